@@ -0,0 +1,201 @@
+# src/aggregate.py
+# Agregação por time em uma única passada ("fundida"): pontos, gols pró,
+# gols contra, vitórias, empates, derrotas e jogos.
+# Opcionalmente em paralelo (map-reduce): cada processo agrega uma parte
+# (um intervalo de linhas da MatchStore ou de bytes do CSV) e as tabelas
+# parciais são somadas na ordem original, com o mesmo resultado da versão
+# sequencial.
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from .data_structs import PONTOS_PERDEDOR_PENALTIS, PONTOS_VENCEDOR_PENALTIS, Team
+from .match_store import MatchStore
+
+if TYPE_CHECKING:
+    from .former_names import NameResolver
+
+# Abaixo disto (linhas ou bytes por processo) o paralelismo não compensa
+MINIMO_POR_PROCESSO = 50_000
+MINIMO_BYTES_POR_PROCESSO = 1 << 20
+
+class TeamStats:
+    """
+    Tabela de totais por time, em colunas indexadas pelo ID do time
+    (IDs na ordem de aparição, como na MatchStore).
+    """
+    CAMPOS = ("points", "goals_for", "goals_against", "wins", "draws", "losses", "played")
+
+    def __init__(self, team_names: Sequence[str] = ()):
+        self.team_names: List[str] = list(team_names)
+        self.team_ids: Dict[str, int] = {name: i for i, name in enumerate(self.team_names)}
+        total = len(self.team_names)
+        self.points = [0] * total
+        self.goals_for = [0] * total
+        self.goals_against = [0] * total
+        self.wins = [0] * total
+        self.draws = [0] * total
+        self.losses = [0] * total
+        self.played = [0] * total
+
+    def __len__(self) -> int:
+        return len(self.team_names)
+
+    def merge(self, other: "TeamStats"):
+        """
+        Soma outra tabela a esta (etapa 'reduce'). Times novos entram no fim,
+        na ordem em que aparecem na outra tabela.
+        """
+        columns = [getattr(self, campo) for campo in self.CAMPOS]
+        other_columns = [getattr(other, campo) for campo in self.CAMPOS]
+        for j, name in enumerate(other.team_names):
+            i = self.team_ids.get(name)
+            if i is None:
+                i = self.team_ids[name] = len(self.team_names)
+                self.team_names.append(name)
+                for column in columns:
+                    column.append(0)
+            for column, other_column in zip(columns, other_columns):
+                column[i] += other_column[j]
+
+    def row(self, name: str) -> Optional[Dict[str, int]]:
+        """Totais de um time (None se ele não aparece na tabela)."""
+        i = self.team_ids.get(name)
+        if i is None:
+            return None
+        return {campo: getattr(self, campo)[i] for campo in self.CAMPOS}
+
+    def team_scores(self) -> List[Team]:
+        """Mesma saída de calculate_team_scores."""
+        return [Team(name, points) for name, points in zip(self.team_names, self.points)]
+
+    def total_goals(self) -> List[Team]:
+        """Mesma saída de calculate_total_goals."""
+        return [Team(name, goals) for name, goals in zip(self.team_names, self.goals_for)]
+
+# =====================================================================
+# Passada Fundida
+# =====================================================================
+
+def agregar_colunas(team_names: Sequence[str], home_ids: Sequence[int], away_ids: Sequence[int],
+                    home_scores: Sequence[int], away_scores: Sequence[int]) -> TeamStats:
+    """
+    Uma passada pelas colunas de IDs e placares, acumulando todos os totais
+    de uma vez. Pontos e jogos saem de V/E/D no fim (3V + E e V + E + D),
+    o que deixa o laço com o mínimo de somas por partida.
+    """
+    stats = TeamStats(team_names)
+    goals_for, goals_against = stats.goals_for, stats.goals_against
+    wins, draws, losses = stats.wins, stats.draws, stats.losses
+
+    for home, away, home_score, away_score in zip(home_ids, away_ids, home_scores, away_scores):
+        goals_for[home] += home_score
+        goals_against[home] += away_score
+        goals_for[away] += away_score
+        goals_against[away] += home_score
+        if home_score > away_score:
+            wins[home] += 1
+            losses[away] += 1
+        elif home_score < away_score:
+            wins[away] += 1
+            losses[home] += 1
+        else:
+            draws[home] += 1
+            draws[away] += 1
+
+    stats.points = [3 * w + d for w, d in zip(wins, draws)]
+    stats.played = [w + d + l for w, d, l in zip(wins, draws, losses)]
+    return stats
+
+def aplicar_disputas(stats: TeamStats, store: MatchStore):
+    """
+    Corrige os totais dos empates decididos nos pênaltis (store.shootouts):
+    o vencedor da disputa conta uma vitória e o outro uma derrota, com os
+    pontos de PONTOS_VENCEDOR_PENALTIS / PONTOS_PERDEDOR_PENALTIS.
+    Custo proporcional ao número de disputas, não de partidas.
+    """
+    for i, winner in store.shootouts.items():
+        if store.home_scores[i] != store.away_scores[i]:
+            continue
+        loser = store.away_ids[i] if winner == store.home_ids[i] else store.home_ids[i]
+        stats.draws[winner] -= 1
+        stats.draws[loser] -= 1
+        stats.wins[winner] += 1
+        stats.losses[loser] += 1
+        stats.points[winner] += PONTOS_VENCEDOR_PENALTIS - 1
+        stats.points[loser] += PONTOS_PERDEDOR_PENALTIS - 1
+
+def agregar_store(store: MatchStore, processos: int = 1, shootouts: bool = False) -> TeamStats:
+    """
+    Agrega todas as partidas da store. Com processos > 1 as linhas são
+    divididas em fatias contínuas, agregadas em paralelo e somadas; como
+    todas as fatias usam os IDs da store, a soma é coluna a coluna.
+    Com 'shootouts', os empates decididos nos pênaltis são corrigidos no fim.
+    """
+    total = len(store)
+    processos = min(processos, max(1, total // MINIMO_POR_PROCESSO))
+    if processos <= 1:
+        stats = agregar_colunas(store.team_names, store.home_ids, store.away_ids,
+                                store.home_scores, store.away_scores)
+        if shootouts:
+            aplicar_disputas(stats, store)
+        return stats
+
+    from concurrent.futures import ProcessPoolExecutor  # só no modo paralelo
+
+    passo = total // processos + 1
+    fatias = [(k * passo, min((k + 1) * passo, total)) for k in range(processos)]
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        partes = list(executor.map(
+            agregar_colunas, [store.team_names] * processos,
+            [store.home_ids[a:b] for a, b in fatias], [store.away_ids[a:b] for a, b in fatias],
+            [store.home_scores[a:b] for a, b in fatias], [store.away_scores[a:b] for a, b in fatias]))
+
+    stats = partes[0]
+    for parte in partes[1:]:
+        stats.merge(parte)
+    if shootouts:
+        aplicar_disputas(stats, store)
+    return stats
+
+def _agregar_intervalo(caminho_csv: str, inicio: int, fim: int, indices: List[int],
+                       resolver: Optional["NameResolver"]) -> Tuple[TeamStats, int]:
+    """Tarefa de um processo: lê um intervalo de bytes do CSV e já o agrega."""
+    from .ingest import _ler_intervalo
+    store, filtradas = _ler_intervalo(caminho_csv, inicio, fim, indices, resolver)
+    return agregar_store(store), filtradas
+
+def agregar_csv(caminho_csv: str, processos: int = 1,
+                resolver: Optional["NameResolver"] = None) -> Tuple[TeamStats, int]:
+    """
+    Lê e agrega results.csv sem montar a MatchStore inteira: cada processo
+    lê um intervalo de bytes (mesma divisão de ler_resultados_csv) e devolve
+    só a sua tabela de totais. As tabelas são somadas na ordem do arquivo,
+    então a ordem dos times é a mesma da leitura sequencial.
+    Retorna (tabela, linhas_filtradas).
+    """
+    from .ingest import COLUNAS_RESULTADOS, indices_colunas
+
+    with open(caminho_csv, mode="rb") as f:
+        cabecalho = f.readline()
+        inicio = f.tell()
+        tamanho = os.fstat(f.fileno()).st_size
+    indices = indices_colunas(cabecalho.decode("utf-8"), COLUNAS_RESULTADOS)
+
+    processos = min(processos, max(1, (tamanho - inicio) // MINIMO_BYTES_POR_PROCESSO))
+    if processos <= 1:
+        return _agregar_intervalo(caminho_csv, inicio, tamanho, indices, resolver)
+
+    from concurrent.futures import ProcessPoolExecutor  # só no modo paralelo
+
+    passo = (tamanho - inicio) // processos + 1
+    limites = [min(inicio + k * passo, tamanho) for k in range(processos + 1)]
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        partes = list(executor.map(_agregar_intervalo, [caminho_csv] * processos,
+                                   limites[:-1], limites[1:], [indices] * processos,
+                                   [resolver] * processos))
+
+    stats, linhas_filtradas = partes[0]
+    for parte, filtradas in partes[1:]:
+        stats.merge(parte)
+        linhas_filtradas += filtradas
+    return stats, linhas_filtradas
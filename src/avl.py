@@ -5,25 +5,33 @@
 
 # src/avl_points.py
 from .data_structs import Team
-from typing import Any, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 
 class AVLNode:
     """
     Classe que representa um nó em uma árvore AVL (balanceada).
     Key: Score (pontos) do time.
     Value: Objeto Team.
+    Size: Quantidade de nós na subárvore (usado nas consultas de ranking).
     """
+    __slots__ = ("key", "value", "left", "right", "height", "size")
+
     def __init__(self, key: int, value: Team):
         self.key = key 
         self.value = value
         self.left = None
         self.right = None
         self.height = 1
+        self.size = 1
 
 class AVLPointsTree_A:
     """
     Implementação de uma Árvore AVL para organizar times por pontuação (score).
     """
+    # Contadores de instrumentação (ver src/profiling.py). None = desligado;
+    # com um dicionário, comparações e rotações são contadas.
+    counters: Dict[str, int] | None = None
+
     def __init__(self):
         self.root = None
 
@@ -39,67 +47,234 @@ class AVLPointsTree_A:
             return 0
         return self._get_height(node.left) - self._get_height(node.right)
 
+    def _get_size(self, node: AVLNode) -> int:
+        """Retorna o tamanho da subárvore de um nó (0 se nulo)."""
+        if not node:
+            return 0
+        return node.size
+
+    def _update(self, node: AVLNode):
+        """Recalcula altura e tamanho de um nó a partir dos filhos."""
+        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        node.size = 1 + self._get_size(node.left) + self._get_size(node.right)
+
     def _left_rotate(self, z: AVLNode) -> AVLNode:
         """Realiza uma Rotação Simples à Esquerda (Case: Direita-Direita)."""
+        if self.counters is not None:
+            self.counters["rotations"] += 1
         y = z.right
         T2 = y.left
         y.left = z
         z.right = T2
-        z.height = 1 + max(self._get_height(z.left), self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        self._update(z)
+        self._update(y)
         return y
 
     def _right_rotate(self, z: AVLNode) -> AVLNode:
         """Realiza uma Rotação Simples à Direita (Case: Esquerda-Esquerda)."""
+        if self.counters is not None:
+            self.counters["rotations"] += 1
         y = z.left
         T3 = y.right
         y.right = z
         z.left = T3
-        z.height = 1 + max(self._get_height(z.left), self._get_height(z.right))
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        self._update(z)
+        self._update(y)
         return y
 
+    @classmethod
+    def from_sorted(cls, teams: List[Team]) -> "AVLPointsTree_A":
+        """
+        Monta a AVL diretamente a partir de uma lista JÁ ORDENADA por score
+        (ex.: saída do merge_sort), em O(n): o elemento do meio de cada trecho
+        vira a raiz da subárvore. A árvore resultante é perfeitamente balanceada.
+        """
+        for i in range(1, len(teams)):
+            if teams[i].score < teams[i - 1].score:
+                raise ValueError("a lista de times precisa estar ordenada por score")
+        tree = cls()
+        tree.root = tree._build(teams, 0, len(teams) - 1)
+        return tree
+
+    def _build(self, teams: List[Team], low: int, high: int) -> AVLNode:
+        """Constrói a subárvore do trecho teams[low..high] (profundidade O(log n))."""
+        if low > high:
+            return None
+        mid = (low + high) // 2
+        node = AVLNode(teams[mid].score, teams[mid])
+        node.left = self._build(teams, low, mid - 1)
+        node.right = self._build(teams, mid + 1, high)
+        self._update(node)
+        return node
+
     def insert(self, team: Team):
-        """Insere um novo nó na AVL, realizando rotações se necessário."""
-        self.root = self._insert(self.root, team.score, team)
+        """
+        Insere um novo nó na AVL, realizando rotações se necessário.
+        Iterativo: desce guardando o caminho e rebalanceia de baixo para cima.
+        """
+        key = team.score
+        new_node = AVLNode(key, team)
+        if not self.root:
+            self.root = new_node
+            return
 
-    def _insert(self, node: AVLNode, key: int, value: Team) -> AVLNode:
-        """Método recursivo para inserção e rebalanceamento."""
-        
-        # 1. Inserção de BST
-        if not node:
-            return AVLNode(key, value)
-        
-        # Se as chaves são iguais (mesmo score), vamos para a direita.
-        if key < node.key:
-            node.left = self._insert(node.left, key, value)
+        # 1. Inserção de BST (se as chaves são iguais, vamos para a direita)
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if self.counters is not None:
+            self.counters["comparisons"] += len(path)
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new_node
         else:
-            node.right = self._insert(node.right, key, value)
+            parent.right = new_node
 
-        # 2. Atualiza a altura
-        node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
-        
-        # 3. Obtém o fator de balanceamento
-        balance = self._get_balance(node)
+        # 2. Atualiza alturas/tamanhos e aplica as rotações no caminho
+        self._rebalance_path(path)
 
-        # 4. Rebalanceamento (Rotações)
+    def search(self, score: int) -> Team | None:
+        """Busca (iterativa) um time com a pontuação 'score'."""
+        if self.counters is not None:
+            self.counters["comparisons"] += self._search_depth(score)
+        node = self.root
+        while node:
+            if score < node.key:
+                node = node.left
+            elif score > node.key:
+                node = node.right
+            else:
+                return node.value
+        return None
 
-        # Case LL (Esquerda-Esquerda)
-        if balance > 1 and key < node.left.key:
-            return self._right_rotate(node)
+    def contains(self, team: Team) -> bool:
+        """Verifica se o time está na árvore (localizado pela pontuação atual)."""
+        return self._find_path(team.score, team) is not None
 
-        # Case RR (Direita-Direita)
-        if balance < -1 and key >= node.right.key:
-            return self._left_rotate(node)
+    def range_query(self, low: int, high: int) -> List[Tuple[int, Team]]:
+        """
+        Times com pontuação entre 'low' e 'high' (inclusive), em ordem crescente.
+        Custo O(log n + k), sem recursão.
+        """
+        result = []
+        if low > high:
+            return result
+        start = self.count_less(low)
+        if start >= len(self):
+            return result
+        for key, team in self._iter_from(start, reverse=False):
+            if key > high:
+                break
+            result.append((key, team))
+        return result
+
+    def delete(self, team: Team):
+        """
+        Remove o nó do time 'team' (localizado pela pontuação atual, team.score),
+        rebalanceando a árvore. Se o time não estiver na árvore, nada muda.
+        """
+        path = self._find_path(team.score, team)
+        if path is None:
+            return
+
+        target = path[-1]
+        if target.left and target.right:
+            # Dois filhos: o sucessor (menor da subárvore direita) ocupa o lugar
+            successor = target.right
+            path.append(successor)
+            while successor.left:
+                successor = successor.left
+                path.append(successor)
+            target.key, target.value = successor.key, successor.value
+            target = successor
+
+        # Agora 'target' tem no máximo um filho: liga o filho ao pai
+        child = target.left or target.right
+        path.pop()
+        if not path:
+            self.root = child
+            return
+        parent = path[-1]
+        if parent.left is target:
+            parent.left = child
+        else:
+            parent.right = child
+        self._rebalance_path(path)
 
-        # Case LR (Esquerda-Direita)
-        if balance > 1 and key >= node.left.key:
-            node.left = self._left_rotate(node.left)
+    def _find_path(self, key: int, value: Team) -> List[AVLNode] | None:
+        """
+        Retorna o caminho (lista de nós, da raiz até o nó do time) ou None.
+        Times empatados podem estar dos dois lados de um nó com o mesmo score,
+        então a busca explora (com pilha explícita) só a região desse score.
+        """
+        path = []
+        node = self.root
+        while node and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if self.counters is not None:
+            self.counters["comparisons"] += len(path) + 1
+        if not node:
+            return None
+
+        stack = [(node, len(path))]
+        while stack:
+            node, depth = stack.pop()
+            del path[depth:]
+            path.append(node)
+            if node.key == key and node.value is value:
+                return path
+            if node.key <= key and node.right:
+                stack.append((node.right, depth + 1))
+            if node.key >= key and node.left:
+                stack.append((node.left, depth + 1))
+        return None
+
+    def _search_depth(self, score: int) -> int:
+        """Nós visitados por search(score) (só usado com os contadores ligados)."""
+        depth = 0
+        node = self.root
+        while node:
+            depth += 1
+            if score < node.key:
+                node = node.left
+            elif score > node.key:
+                node = node.right
+            else:
+                break
+        return depth
+
+    def _rebalance_path(self, path: List[AVLNode]):
+        """Rebalanceia os nós do caminho, do mais fundo até a raiz, religando cada subárvore ao pai."""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            new_node = self._rebalance(node)
+            if i == 0:
+                self.root = new_node
+            elif path[i - 1].left is node:
+                path[i - 1].left = new_node
+            else:
+                path[i - 1].right = new_node
+
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """Atualiza altura/tamanho e aplica as rotações necessárias (LL, RR, LR, RL)."""
+        self._update(node)
+        balance = self._get_balance(node)
+
+        if balance > 1:
+            # Case LR (Esquerda-Direita)
+            if self._get_balance(node.left) < 0:
+                node.left = self._left_rotate(node.left)
+            # Case LL (Esquerda-Esquerda)
             return self._right_rotate(node)
 
-        # Case RL (Direita-Esquerda)
-        if balance < -1 and key < node.right.key:
-            node.right = self._right_rotate(node.right)
+        if balance < -1:
+            # Case RL (Direita-Esquerda)
+            if self._get_balance(node.right) > 0:
+                node.right = self._right_rotate(node.right)
+            # Case RR (Direita-Direita)
             return self._left_rotate(node)
 
         return node
@@ -114,13 +289,119 @@ class AVLPointsTree_A:
 
     def inorder(self) -> List[Tuple[int, Team]]:
         """Retorna uma lista dos times ordenados pela pontuação (in-order)."""
+        if not self.root:
+            return []
+        return list(self._iter_from(0, reverse=False))
+
+    # =================================================================
+    # Consultas de Ranking (estatística de ordem)
+    # =================================================================
+    # Cada nó guarda o tamanho da sua subárvore, então dá para saber quantos
+    # times estão antes/depois de uma posição descendo um único caminho da
+    # raiz (O(log n)), sem percorrer a árvore inteira.
+
+    def __len__(self) -> int:
+        return self._get_size(self.root)
+
+    def count_less(self, score: int) -> int:
+        """Quantidade de times com pontuação menor que 'score' (O(log n))."""
+        count = 0
+        node = self.root
+        while node:
+            if node.key < score:
+                count += self._get_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def count_greater(self, score: int) -> int:
+        """Quantidade de times com pontuação maior que 'score' (O(log n))."""
+        count = 0
+        node = self.root
+        while node:
+            if node.key > score:
+                count += self._get_size(node.right) + 1
+                node = node.left
+            else:
+                node = node.right
+        return count
+
+    def rank(self, team: Team) -> int:
+        """
+        Posição do time no ranking (1 = mais pontos).
+        Times empatados dividem a mesma posição (ex.: 1, 2, 2, 4).
+        """
+        return self.count_greater(team.score) + 1
+
+    def select(self, index: int) -> Tuple[int, Team]:
+        """Retorna o (score, time) na posição 'index' da ordem crescente (0 = menor score)."""
+        if not 0 <= index < len(self):
+            raise IndexError("posição fora da árvore")
+        return next(self._iter_from(index, reverse=False))
+
+    def kth_best(self, k: int) -> Tuple[int, Team]:
+        """Retorna o k-ésimo melhor time (k = 1 é o de maior pontuação)."""
+        if not 1 <= k <= len(self):
+            raise IndexError("posição fora da árvore")
+        return next(self._iter_from(k - 1, reverse=True))
+
+    def ranked(self, start: int, end: int) -> List[Tuple[int, Team]]:
+        """
+        Times nas posições 'start' a 'end' (inclusive) do ranking decrescente,
+        com posições a partir de 1. Ex.: ranked(50, 60). Custo O(log n + k).
+        """
+        start = max(start, 1)
+        if start > end or start > len(self):
+            return []
         result = []
-        self._inorder(self.root, result)
+        for item in self._iter_from(start - 1, reverse=True):
+            result.append(item)
+            if len(result) == end - start + 1:
+                break
         return result
 
-    def _inorder(self, node: AVLNode, result: List[Tuple[int, Team]]):
-        """Método auxiliar recursivo para percorrer a árvore em ordem."""
-        if node:
-            self._inorder(node.left, result)
-            result.append((node.key, node.value)) 
-            self._inorder(node.right, result)
\ No newline at end of file
+    def top_k(self, k: int) -> List[Tuple[int, Team]]:
+        """Os k times com mais pontos, do maior para o menor."""
+        return self.ranked(1, k)
+
+    def bottom_k(self, k: int) -> List[Tuple[int, Team]]:
+        """Os k times com menos pontos, do menor para o maior (mesmo início do inorder())."""
+        if k <= 0 or not self.root:
+            return []
+        result = []
+        for item in self._iter_from(0, reverse=False):
+            result.append(item)
+            if len(result) == k:
+                break
+        return result
+
+    def _iter_from(self, index: int, reverse: bool) -> Iterator[Tuple[int, Team]]:
+        """
+        Percorre a árvore a partir da posição 'index' (0-based) em ordem
+        crescente, ou decrescente se 'reverse'. Usa uma pilha explícita:
+        desce até a posição em O(log n) e depois anda um nó por vez.
+        """
+        # 'near' é o filho visitado antes do nó; 'far' o visitado depois
+        near, far = ("right", "left") if reverse else ("left", "right")
+        stack = []
+        node = self.root
+        while node:
+            near_size = self._get_size(getattr(node, near))
+            if index < near_size:
+                stack.append(node)
+                node = getattr(node, near)
+            elif index == near_size:
+                stack.append(node)
+                break
+            else:
+                index -= near_size + 1
+                node = getattr(node, far)
+
+        while stack:
+            node = stack.pop()
+            yield (node.key, node.value)
+            child = getattr(node, far)
+            while child:
+                stack.append(child)
+                child = getattr(child, near)
@@ -0,0 +1,358 @@
+# src/benchmarks.py
+# Suíte de benchmarks das estruturas e algoritmos de src/.
+# Execução (a partir da raiz do projeto):
+#     python -m src.benchmarks                                # dados reais + sintético 10x
+#     python -m src.benchmarks --escalas 1 10 100 1000        # escalas maiores
+#     python -m src.benchmarks --salvar-baseline              # grava a referência
+#     python -m src.benchmarks --saida bench.json             # compara com a referência
+#     python -m src.benchmarks --verificar                    # falha se store[i] passar do limite de bytes
+#
+# Para cada caso são medidos o tempo (melhor de N repetições) e o pico de
+# memória (tracemalloc, em uma execução separada). O resultado é um JSON;
+# se existir um baseline, cada medida é comparada com ele.
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import tempfile
+import sys
+import time
+import tracemalloc
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+from .bst_library import BST_A
+from .avl import AVLPointsTree_A
+from .sorting import bubble_sort, merge_sort, radix_sort
+from .search import (linear_search, binary_search, build_index, range_search,
+                     range_search_batch)
+from .main import carregar_partidas_csv, executar_pipeline
+from .ingest import ler_resultados_csv
+from .aggregate import agregar_csv, agregar_store
+from .disk_index import DiskIndex, gravar_indice
+from .export import gravar_em_lotes
+
+CAMINHO_RESULTADOS = "data/results.csv"
+CAMINHO_BASELINE = "output/benchmark_baseline.json"
+
+# Bubble Sort é O(n²): acima deste número de times o caso é pulado
+LIMITE_BUBBLE_SORT = 5_000
+# Casos que criam um objeto Match por partida são pulados acima disto
+LIMITE_PARTIDAS_OBJETOS = 2_000_000
+# Processos do caso de leitura paralela do CSV
+PROCESSOS_INGESTAO = 4
+# Quantidade de buscas feitas nos casos de busca
+QUANTIDADE_BUSCAS = 1_000
+# Quantidade de partidas (store[i]) criadas na medição de memória por partida
+PARTIDAS_MEMORIA = 1_000_000
+# Memória por partida carregada no código original (Match com __dict__,
+# datetime e strings próprias), medida com tracemalloc em carregar_partidas_csv
+BYTES_POR_PARTIDA_ORIGINAL = 505
+# Limite verificado por --verificar: no máximo 1/4 do original
+LIMITE_BYTES_POR_PARTIDA = BYTES_POR_PARTIDA_ORIGINAL // 4
+
+# =====================================================================
+# Medição
+# =====================================================================
+
+def _melhor_tempo(funcao: Callable[[], object], repeticoes: int) -> float:
+    """Executa 'funcao' várias vezes e retorna o menor tempo (em segundos)."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+def _pico_memoria(funcao: Callable[[], object]) -> int:
+    """Pico de memória alocada (bytes) durante uma execução de 'funcao'."""
+    tracemalloc.start()
+    try:
+        funcao()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def medir(funcao: Callable[[], object], repeticoes: int) -> Dict[str, float]:
+    """Tempo (melhor de 'repeticoes') e pico de memória de um caso."""
+    return {
+        "tempo_s": _melhor_tempo(funcao, repeticoes),
+        "pico_memoria_bytes": _pico_memoria(funcao),
+    }
+
+def memoria_por_partida(caminho_csv: str, quantidade: int = PARTIDAS_MEMORIA) -> Dict[str, float]:
+    """
+    Cria 'quantidade' partidas store[i] (repetindo as linhas do arquivo) e
+    mede, com tracemalloc, quantos bytes cada uma ocupa em média (objeto,
+    referência na lista e índice). As colunas da store ficam fora da conta:
+    somam 33 bytes por linha (arrays int32 e int8), compartilhados pelas visões.
+    """
+    store, _ = ler_resultados_csv(caminho_csv)
+    total = len(store)
+    tracemalloc.start()
+    try:
+        partidas = [store[i % total] for i in range(quantidade)]
+        atual = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del partidas
+    return {"partidas": quantidade, "bytes_por_partida": atual / quantidade}
+
+# =====================================================================
+# Dados Sintéticos
+# =====================================================================
+
+def gerar_csv_sintetico(caminho_base: str, escala: int, caminho_saida: str, semente: int = 42) -> str:
+    """
+    Gera um results.csv sintético com 'escala' vezes mais partidas e times que
+    o arquivo real. Placares, torneios, cidades e países são sorteados do
+    arquivo real (mesma distribuição); datas ficam em ordem crescente.
+    A semente fixa torna o arquivo reproduzível.
+    """
+    gerador = random.Random(semente)
+    store, _ = ler_resultados_csv(caminho_base)
+    times = [f"{nome} {i}" if i else nome
+             for i in range(escala) for nome in store.team_names]
+    placares = list(zip(store.home_scores, store.away_scores))
+    strings = store.strings
+    locais = [(strings[t], strings[c], strings[p])
+              for t, c, p in zip(store.tournament_ids, store.city_ids, store.country_ids)]
+
+    # Datas em ordem sem montar (e ordenar) a lista inteira: intervalos
+    # aleatórios acumulados, com média 'dias / partidas' (soma ~ período todo)
+    total = len(store) * escala
+    primeiro, ultimo = store.dates[0], store.dates[-1]
+    taxa = total / max(1, ultimo - primeiro)
+
+    def linhas():
+        posicao = float(primeiro)
+        for _ in range(total):
+            posicao += gerador.expovariate(taxa)
+            casa, fora = gerador.sample(times, 2)
+            gols_casa, gols_fora = gerador.choice(placares)
+            torneio, cidade, pais = gerador.choice(locais)
+            yield [date.fromordinal(min(int(posicao), ultimo)).isoformat(), casa, fora,
+                   gols_casa, gols_fora, torneio, cidade, pais,
+                   "TRUE" if gerador.random() < 0.25 else "FALSE"]
+
+    with open(caminho_saida, mode="w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date", "home_team", "away_team", "home_score", "away_score",
+                         "tournament", "city", "country", "neutral"])
+        gravar_em_lotes(writer, linhas())
+    return caminho_saida
+
+# =====================================================================
+# Casos
+# =====================================================================
+
+def executar_casos(caminho_csv: str, repeticoes: int, pasta_temporaria: str) -> Dict[str, Any]:
+    """
+    Mede todos os casos sobre um arquivo de resultados. Os casos de leitura
+    do CSV também informam a vazão em linhas/s.
+    """
+    store, linhas_filtradas = ler_resultados_csv(caminho_csv)
+    # Leitura sequencial, paralela e original precisam filtrar as mesmas linhas
+    store_paralela, filtradas_paralela = ler_resultados_csv(caminho_csv, PROCESSOS_INGESTAO)
+    assert filtradas_paralela == linhas_filtradas
+    assert len(store_paralela) == len(store)
+    del store_paralela
+    if len(store) <= LIMITE_PARTIDAS_OBJETOS:
+        matches, filtradas_original = carregar_partidas_csv(caminho_csv)
+        assert filtradas_original == linhas_filtradas
+        assert len(matches) == len(store)
+        del matches
+    times_pontos = store.team_scores()
+    times_gols = store.total_goals()
+    ordenados = times_pontos[:]
+    merge_sort(ordenados, key=lambda t: t.score)
+
+    gerador = random.Random(7)
+    nomes = [t.name for t in times_pontos]
+    scores = [t.score for t in ordenados]
+    nomes_buscados = [gerador.choice(nomes) for _ in range(QUANTIDADE_BUSCAS)]
+    scores_buscados = [gerador.choice(scores) for _ in range(QUANTIDADE_BUSCAS)]
+    faixas_buscadas = [tuple(sorted((gerador.choice(scores), gerador.choice(scores))))
+                       for _ in range(QUANTIDADE_BUSCAS)]
+
+    bst_nome = BST_A()
+    for t in times_pontos:
+        bst_nome.insert(t.name, t)
+    avl = AVLPointsTree_A.from_sorted(ordenados)
+    indice_nomes = build_index(nomes)
+
+    def construir_bsts():
+        nome, gols = BST_A(), BST_A()
+        for t in times_pontos:
+            nome.insert(t.name, t)
+        for t in times_gols:
+            gols.insert(t.score, t)
+
+    def construir_avl_insert():
+        arvore = AVLPointsTree_A()
+        for t in ordenados:
+            arvore.insert(t)
+
+    def ordenar(funcao: Callable[..., None], **kwargs) -> Callable[[], None]:
+        return lambda: funcao(times_pontos[:], **kwargs)
+
+    saida_pipeline = os.path.join(pasta_temporaria, "matches_summary.csv")
+    caminho_indice = os.path.join(pasta_temporaria, "times.idx")
+    gravar_indice(agregar_store(store), caminho_indice)
+
+    def consultar_indice():
+        with DiskIndex(caminho_indice) as indice:
+            return [indice.team(n) for n in nomes_buscados]
+    casos: Dict[str, Callable[[], object]] = {
+        "ler_resultados_csv": lambda: ler_resultados_csv(caminho_csv),
+        f"ler_resultados_csv (processos={PROCESSOS_INGESTAO})":
+            lambda: ler_resultados_csv(caminho_csv, PROCESSOS_INGESTAO),
+        "calculate_team_scores": store.team_scores,
+        "calculate_total_goals": store.total_goals,
+        "agregar_store (fundido)": lambda: agregar_store(store),
+        "agregar_csv (paralelo)": lambda: agregar_csv(caminho_csv, os.cpu_count() or 1),
+        "merge_sort": ordenar(merge_sort),
+        "merge_sort (key)": ordenar(merge_sort, key=lambda t: t.score),
+        "radix_sort": ordenar(radix_sort, key=lambda t: t.score),
+        "BST_A construcao": construir_bsts,
+        "BST_A search": lambda: [bst_nome.search(n) for n in nomes_buscados],
+        "AVLPointsTree_A insert": construir_avl_insert,
+        "AVLPointsTree_A from_sorted": lambda: AVLPointsTree_A.from_sorted(ordenados),
+        "AVLPointsTree_A top_k(10)": lambda: [avl.top_k(10) for _ in range(QUANTIDADE_BUSCAS)],
+        "linear_search": lambda: [linear_search(nomes, n) for n in nomes_buscados],
+        "binary_search": lambda: [binary_search(scores, s) for s in scores_buscados],
+        "build_index": lambda: build_index(nomes),
+        "busca por nome (build_index)": lambda: [indice_nomes.get(n) for n in nomes_buscados],
+        "range_search (uma a uma)": lambda: [range_search(scores, a, b) for a, b in faixas_buscadas],
+        "range_search_batch": lambda: range_search_batch(scores, faixas_buscadas),
+        "DiskIndex gravar": lambda: gravar_indice(agregar_store(store), caminho_indice),
+        "DiskIndex abrir + team (mmap)": consultar_indice,
+        "pipeline main.py": lambda: executar_pipeline(caminho_csv, saida_pipeline, usar_cache=False),
+    }
+    if len(times_pontos) <= LIMITE_BUBBLE_SORT:
+        casos["bubble_sort"] = ordenar(bubble_sort)
+    if len(store) <= LIMITE_PARTIDAS_OBJETOS:
+        casos["carregar_partidas_csv"] = lambda: carregar_partidas_csv(caminho_csv)
+
+    medidas = {nome: medir(funcao, repeticoes) for nome, funcao in casos.items()}
+    linhas = len(store) + linhas_filtradas
+    for nome, medida in medidas.items():
+        if nome.startswith(("ler_resultados_csv", "carregar_partidas_csv")):
+            medida["linhas_por_s"] = linhas / medida["tempo_s"]
+    return {
+        "partidas": len(store),
+        "linhas_filtradas": linhas_filtradas,
+        "times": len(times_pontos),
+        "casos": medidas,
+    }
+
+def executar_suite(escalas: List[int], repeticoes: int = 3,
+                   caminho_base: str = CAMINHO_RESULTADOS) -> Dict[str, Any]:
+    """Executa os casos no arquivo real (escala 1) e nos sintéticos das demais escalas."""
+    relatorio: Dict[str, Any] = {
+        "ambiente": {
+            "python": platform.python_version(),
+            "implementacao": platform.python_implementation(),
+            "sistema": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "repeticoes": repeticoes,
+        "datasets": {},
+    }
+    with tempfile.TemporaryDirectory() as pasta:
+        for escala in escalas:
+            if escala == 1:
+                nome, caminho = "real", caminho_base
+            else:
+                nome = f"sintetico_x{escala}"
+                caminho = gerar_csv_sintetico(caminho_base, escala,
+                                              os.path.join(pasta, f"results_x{escala}.csv"))
+            relatorio["datasets"][nome] = executar_casos(caminho, repeticoes, pasta)
+    relatorio["memoria_match"] = memoria_por_partida(caminho_base)
+    return relatorio
+
+# =====================================================================
+# Comparação com o Baseline
+# =====================================================================
+
+def comparar_com_baseline(atual: Dict[str, Any], baseline: Dict[str, Any],
+                          tolerancia: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Compara cada medida com o baseline. 'razao' = atual / baseline; acima de
+    1 + tolerancia é regressão, abaixo de 1 - tolerancia é melhoria.
+    """
+    comparacoes = []
+    for dataset, dados in atual["datasets"].items():
+        casos_base = baseline.get("datasets", {}).get(dataset, {}).get("casos", {})
+        for caso, medidas in dados["casos"].items():
+            for metrica, valor in medidas.items():
+                referencia = casos_base.get(caso, {}).get(metrica)
+                # linhas_por_s é derivada de tempo_s (e maior é melhor)
+                if not referencia or metrica == "linhas_por_s":
+                    continue
+                razao = valor / referencia
+                if razao > 1 + tolerancia:
+                    situacao = "regressao"
+                elif razao < 1 - tolerancia:
+                    situacao = "melhoria"
+                else:
+                    situacao = "igual"
+                comparacoes.append({"dataset": dataset, "caso": caso, "metrica": metrica,
+                                    "baseline": referencia, "atual": valor,
+                                    "razao": round(razao, 3), "situacao": situacao})
+    return comparacoes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks das estruturas e algoritmos de src/")
+    parser.add_argument("--escalas", type=int, nargs="+", default=[1, 10],
+                        help="1 = data/results.csv real; N = sintético N vezes maior")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", help="arquivo JSON para gravar o relatório")
+    parser.add_argument("--baseline", default=CAMINHO_BASELINE)
+    parser.add_argument("--salvar-baseline", action="store_true",
+                        help="grava este resultado como o novo baseline")
+    parser.add_argument("--tolerancia", type=float, default=0.10)
+    parser.add_argument("--verificar", action="store_true",
+                        help="só mede a memória por partida e falha acima de "
+                             f"{LIMITE_BYTES_POR_PARTIDA} bytes")
+    args = parser.parse_args()
+
+    if args.verificar:
+        memoria = memoria_por_partida(CAMINHO_RESULTADOS)
+        print(f"Partida: {memoria['bytes_por_partida']:.1f} bytes "
+              f"({memoria['partidas']} objetos; limite {LIMITE_BYTES_POR_PARTIDA}, "
+              f"original {BYTES_POR_PARTIDA_ORIGINAL})")
+        sys.exit(0 if memoria["bytes_por_partida"] <= LIMITE_BYTES_POR_PARTIDA else 1)
+
+    relatorio = executar_suite(args.escalas, args.repeticoes)
+
+    if os.path.exists(args.baseline) and not args.salvar_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            relatorio["comparacao"] = comparar_com_baseline(relatorio, json.load(f), args.tolerancia)
+
+    for dataset, dados in relatorio["datasets"].items():
+        print(f"--- {dataset}: {dados['partidas']} partidas, {dados['times']} times ---")
+        for caso, medidas in dados["casos"].items():
+            vazao = (f"  {medidas['linhas_por_s']:>12,.0f} linhas/s"
+                     if "linhas_por_s" in medidas else "")
+            print(f"  {caso:<36} {medidas['tempo_s'] * 1000:>10.2f} ms"
+                  f"  {medidas['pico_memoria_bytes'] / 1024:>10.0f} KiB{vazao}")
+    memoria = relatorio["memoria_match"]
+    print(f"--- Partida (store[i]): {memoria['bytes_por_partida']:.1f} bytes "
+          f"({memoria['partidas']} objetos) ---")
+    for item in relatorio.get("comparacao", []):
+        if item["situacao"] != "igual":
+            print(f"[{item['situacao']}] {item['dataset']} / {item['caso']} / "
+                  f"{item['metrica']}: x{item['razao']}")
+
+    if args.saida:
+        with open(args.saida, mode="w", encoding="utf-8") as f:
+            json.dump(relatorio, f, indent=2, ensure_ascii=False)
+    if args.salvar_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, mode="w", encoding="utf-8") as f:
+            json.dump(relatorio, f, indent=2, ensure_ascii=False)
+        print(f"Baseline gravado em: {args.baseline}")
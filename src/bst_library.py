@@ -1,11 +1,14 @@
 # src/bst.py
+import math
 from .data_structs import Team
-from typing import List, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Tuple, Any
 
 class Node:
     """
     Classe que representa um nó em uma árvore binária de busca (BST).
     """
+    __slots__ = ("key", "value", "left", "right")
+
     def __init__(self, key: Any, value: Team):
         self.key = key      # Chave de ordenação (ex: nome ou score)
         self.value = value  # Objeto Team
@@ -16,54 +19,290 @@ class BST_A:
     """
     Classe que implementa uma árvore binária de busca (BST) simples.
     Usada para armazenar seleções ordenadas por chave (nome ou score).
+
+    Com balanced=True a árvore se mantém balanceada sozinha (estratégia
+    "scapegoat"): quando uma inserção fica funda demais, a subárvore
+    desequilibrada é reconstruída balanceada. Assim a busca continua
+    O(log n) mesmo com chaves inseridas em ordem ou repetidas.
     """
-    def __init__(self):
+    # Fator de peso do modo balanceado: nenhum filho pode ter mais que
+    # ALPHA do tamanho do pai (altura máxima ~ log(n) na base 1/ALPHA).
+    ALPHA = 2 / 3
+
+    # Contadores de instrumentação (ver src/profiling.py). None = desligado;
+    # com um dicionário, comparações e reconstruções são contadas.
+    counters: Dict[str, int] | None = None
+
+    def __init__(self, balanced: bool = False):
         self.root = None
+        self.balanced = balanced
+        self.size = 0
+        self._max_size = 0  # Maior tamanho desde a última reconstrução completa
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[Any, Team]], balanced: bool = False) -> "BST_A":
+        """
+        Monta uma BST perfeitamente balanceada a partir de pares (chave, time)
+        JÁ ORDENADOS pela chave, em O(n).
+        """
+        tree = cls(balanced)
+        nodes = [Node(key, value) for key, value in items]
+        for i in range(1, len(nodes)):
+            if nodes[i].key < nodes[i - 1].key:
+                raise ValueError("os itens precisam estar ordenados pela chave")
+        tree.root = tree._build(nodes, 0, len(nodes) - 1)
+        tree.size = tree._max_size = len(nodes)
+        return tree
 
     def insert(self, key: Any, value: Team):
-        """Insere um novo nó na BST com a chave e valor fornecidos."""
+        """
+        Insere um novo nó na BST com a chave e valor fornecidos (iterativo).
+        Se as chaves são iguais, o nó vai para a direita para evitar duplicação
+        (especialmente útil para scores iguais).
+        """
+        new_node = Node(key, value)
+        self.size += 1
+        self._max_size = max(self._max_size, self.size)
         if self.root is None:
-            self.root = Node(key, value)
+            self.root = new_node
+            return
+
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if self.counters is not None:
+            self.counters["comparisons"] += len(path)
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new_node
         else:
-            self._insert(self.root, key, value)
-
-    def _insert(self, node: Node, key: Any, value: Team):
-        """Método auxiliar recursivo para inserir um nó na posição correta."""
-        # Se as chaves são iguais, o nó vai para a direita para evitar duplicação 
-        # (especialmente útil para scores iguais).
-        if key < node.key:
-            if node.left is None:
-                node.left = Node(key, value)
-            else:
-                self._insert(node.left, key, value)
-        else: # key >= node.key
-            if node.right is None:
-                node.right = Node(key, value)
+            parent.right = new_node
+
+        # Modo balanceado: profundidade acima do limite -> reconstrói o "bode expiatório"
+        if self.balanced and len(path) > math.log(self.size, 1 / self.ALPHA):
+            self._rebuild_scapegoat(path, new_node)
+
+    def search(self, key: Any) -> Team | None:
+        """Busca um time pela chave na BST (iterativo)."""
+        if self.counters is not None:
+            self.counters["comparisons"] += self._search_depth(key)
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key == key:
+                return node.value
             else:
-                self._insert(node.right, key, value)
+                node = node.right
+        return None
+
+    def delete(self, key: Any, value: Team):
+        """
+        Remove o nó com a chave e o valor (o mesmo objeto Team) fornecidos.
+        Com chaves repetidas, só o nó daquele time é removido.
+        """
+        path = self._find_path(key, value)
+        if path is None:
+            return
+
+        target = path[-1]
+        if target.left is not None and target.right is not None:
+            # Dois filhos: o sucessor (menor da subárvore direita) ocupa o lugar
+            successor = target.right
+            path.append(successor)
+            while successor.left is not None:
+                successor = successor.left
+                path.append(successor)
+            target.key, target.value = successor.key, successor.value
+            target = successor
+
+        child = target.left if target.left is not None else target.right
+        path.pop()
+        if not path:
+            self.root = child
+        elif path[-1].left is target:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+
+        self.size -= 1
+        # Modo balanceado: muitas remoções desde a última reconstrução -> reconstrói tudo
+        if self.balanced and self.size < self.ALPHA * self._max_size:
+            self.rebalance()
+
+    def rebalance(self):
+        """Reconstrói a árvore inteira de forma balanceada (O(n))."""
+        if self.counters is not None:
+            self.counters["rebuilds"] += 1
+        self.root = self._build(self._collect(self.root), 0, self.size - 1)
+        self._max_size = self.size
+
+    # =================================================================
+    # Percursos (geradores com pilha explícita)
+    # =================================================================
+    # Os percursos abaixo produzem os nós sob demanda: pegar os k primeiros
+    # custa O(h + k), sem montar a lista inteira nem usar recursão.
+
+    def iter_inorder(self) -> Iterator[Tuple[Any, Team]]:
+        """Gera os pares (chave, time) em ordem crescente de chave."""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield (node.key, node.value)
+            node = node.right
+
+    def iter_reverse(self) -> Iterator[Tuple[Any, Team]]:
+        """Gera os pares (chave, time) em ordem decrescente de chave."""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield (node.key, node.value)
+            node = node.left
+
+    def iter_range(self, low: Any, high: Any) -> Iterator[Tuple[Any, Team]]:
+        """Gera, em ordem crescente, os pares com low <= chave <= high."""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                if node.key < low:
+                    node = node.right  # toda a subárvore esquerda também é < low
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key > high:
+                return
+            yield (node.key, node.value)
+            node = node.right
 
     def inorder(self) -> List[Tuple[Any, Team]]:
         """Retorna uma lista com os nós em ordem crescente (in-order traversal)."""
-        result = []
-        self._inorder(self.root, result)
-        return result
+        return list(self.iter_inorder())
 
-    def _inorder(self, node: Node, result: List[Tuple[Any, Team]]):
-        """Método auxiliar recursivo para percorrer a árvore em ordem."""
-        if node:
-            self._inorder(node.left, result)
-            result.append((node.key, node.value))
-            self._inorder(node.right, result)
+    def height(self) -> int:
+        """Retorna a altura da árvore (0 se vazia), calculada sem recursão."""
+        height = 0
+        level = [self.root] if self.root is not None else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return height
 
-    def search(self, key: Any) -> Team | None:
-        """Busca um time pela chave na BST."""
-        return self._search(self.root, key)
-
-    def _search(self, node: Node, key: Any) -> Team | None:
-        if node is None or node.key == key:
-            return node.value if node else None
-        
-        if key < node.key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
\ No newline at end of file
+    # =================================================================
+    # Métodos auxiliares
+    # =================================================================
+
+    def _find_path(self, key: Any, value: Team) -> List[Node] | None:
+        """
+        Retorna o caminho (lista de nós, da raiz até o nó com a chave e o valor
+        pedidos) ou None. Após reconstruções, chaves iguais podem ficar dos dois
+        lados de um nó, então a busca explora (com pilha) só a região dessa chave.
+        """
+        path = []
+        node = self.root
+        while node is not None and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if self.counters is not None:
+            self.counters["comparisons"] += len(path) + 1
+        if node is None:
+            return None
+
+        stack = [(node, len(path))]
+        while stack:
+            node, depth = stack.pop()
+            del path[depth:]
+            path.append(node)
+            if node.key == key and node.value is value:
+                return path
+            if not key < node.key and node.right is not None:
+                stack.append((node.right, depth + 1))
+            if not node.key < key and node.left is not None:
+                stack.append((node.left, depth + 1))
+        return None
+
+    def _search_depth(self, key: Any) -> int:
+        """Nós visitados por search(key) (só usado com os contadores ligados)."""
+        depth = 0
+        node = self.root
+        while node is not None:
+            depth += 1
+            if key < node.key:
+                node = node.left
+            elif node.key == key:
+                break
+            else:
+                node = node.right
+        return depth
+
+    def _rebuild_scapegoat(self, path: List[Node], new_node: Node):
+        """
+        Sobe pelo caminho da inserção até achar o primeiro nó em que um filho
+        tem mais que ALPHA do tamanho da subárvore, e reconstrói esse nó.
+        """
+        child, child_size = new_node, 1
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            sibling = node.left if node.right is child else node.right
+            node_size = child_size + 1 + self._count(sibling)
+            if child_size > self.ALPHA * node_size:
+                if self.counters is not None:
+                    self.counters["rebuilds"] += 1
+                rebuilt = self._build(self._collect(node), 0, node_size - 1)
+                if i == 0:
+                    self.root = rebuilt
+                elif path[i - 1].left is node:
+                    path[i - 1].left = rebuilt
+                else:
+                    path[i - 1].right = rebuilt
+                return
+            child, child_size = node, node_size
+
+    def _count(self, node: Node) -> int:
+        """Conta os nós de uma subárvore (iterativo)."""
+        count = 0
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        return count
+
+    def _collect(self, node: Node) -> List[Node]:
+        """Lista os nós de uma subárvore em ordem (iterativo)."""
+        nodes = []
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            nodes.append(node)
+            node = node.right
+        return nodes
+
+    def _build(self, nodes: List[Node], low: int, high: int) -> Node:
+        """Religa nodes[low..high] como subárvore balanceada (profundidade O(log n))."""
+        if low > high:
+            return None
+        mid = (low + high) // 2
+        node = nodes[mid]
+        node.left = self._build(nodes, low, mid - 1)
+        node.right = self._build(nodes, mid + 1, high)
+        return node
@@ -0,0 +1,193 @@
+# src/cache.py
+# Cache binário de results.csv já convertido (MatchStore).
+#
+# Formato do arquivo (little-endian):
+#   [cabeçalho fixo]   ver _CABECALHO
+#   [nomes de times]   UTF-8 separados por '\0'
+#   [strings]          UTF-8 separados por '\0' (torneio, cidade, país)
+#   [colunas]          cada coluna com largura fixa (int32 ou int8), uma após a outra
+#
+# O cache guarda tamanho, mtime e hash do CSV de origem e é descartado
+# automaticamente quando o CSV muda. Também guarda a identificação do índice
+# de nomes antigos usado na leitura (zeros = nomes sem resolução).
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .match_store import MatchStore
+from .ingest import ler_resultados_csv
+
+if TYPE_CHECKING:
+    from .former_names import NameResolver
+
+_MAGICO = b"RESCACHE"
+_VERSAO = 3
+
+# mágico, versão, linhas, linhas_filtradas, tamanho_csv, mtime_ns_csv, hash_csv,
+# identificação_nomes, bytes_nomes_times, bytes_strings, quantidade_nomes,
+# quantidade_strings (a quantidade distingue [] de [""], ambos com 0 bytes)
+_CABECALHO = struct.Struct("<8sIIIQQ16s16sQQII")
+_SEM_RESOLUCAO = bytes(16)
+
+# Colunas da MatchStore, na ordem em que são gravadas
+_COLUNAS = ["dates", "home_ids", "away_ids", "home_scores", "away_scores",
+            "tournament_ids", "city_ids", "country_ids", "neutral"]
+# Bytes de uma linha somando todas as colunas
+_BYTES_POR_LINHA = sum(getattr(MatchStore(), nome).itemsize for nome in _COLUNAS)
+
+# =====================================================================
+# Funções Auxiliares
+# =====================================================================
+
+def caminho_cache(caminho_csv: str) -> str:
+    """O cache fica ao lado do CSV: data/results.csv -> data/results.csv.cache"""
+    return caminho_csv + ".cache"
+
+def hash_arquivo(caminho: str) -> bytes:
+    """Hash (BLAKE2b, 16 bytes) do conteúdo de um arquivo."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(caminho, mode="rb") as f:
+        for bloco in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloco)
+    return h.digest()
+
+def _juntar_strings(valores: List[str]) -> bytes:
+    return "\0".join(valores).encode("utf-8")
+
+def _separar_strings(dados: bytes, quantidade: int) -> List[str]:
+    return dados.decode("utf-8").split("\0") if quantidade else []
+
+def _identificacao(resolver: Optional["NameResolver"]) -> bytes:
+    return resolver.fingerprint if resolver is not None else _SEM_RESOLUCAO
+
+# =====================================================================
+# Gravação e Leitura
+# =====================================================================
+
+def salvar_cache(store: MatchStore, linhas_filtradas: int, caminho_csv: str,
+                 caminho_saida: Optional[str] = None,
+                 resolver: Optional["NameResolver"] = None):
+    """Grava o cache binário da MatchStore (gravação atômica via arquivo temporário)."""
+    caminho_saida = caminho_saida or caminho_cache(caminho_csv)
+    info = os.stat(caminho_csv)
+    nomes = _juntar_strings(store.team_names)
+    strings = _juntar_strings(store.strings)
+
+    temporario = caminho_saida + ".tmp"
+    with open(temporario, mode="wb") as f:
+        f.write(_CABECALHO.pack(_MAGICO, _VERSAO, len(store), linhas_filtradas,
+                                info.st_size, info.st_mtime_ns, hash_arquivo(caminho_csv),
+                                _identificacao(resolver), len(nomes), len(strings),
+                                len(store.team_names), len(store.strings)))
+        f.write(nomes)
+        f.write(strings)
+        for nome in _COLUNAS:
+            coluna = getattr(store, nome)
+            if sys.byteorder != "little":
+                coluna = array(coluna.typecode, coluna)
+                coluna.byteswap()
+            f.write(coluna.tobytes())
+    os.replace(temporario, caminho_saida)
+
+def _cache_valido(cabecalho: tuple, caminho_csv: str, verificar_hash: bool,
+                  identificacao: bytes) -> bool:
+    """
+    Confere o cabeçalho com o CSV atual: tamanho e mtime iguais bastam, a não
+    ser que 'verificar_hash' seja pedido. Se só o mtime mudou, compara o hash.
+    O índice de nomes antigos também precisa ser o mesmo da gravação.
+    """
+    magico, versao, _, _, tamanho, mtime_ns, hash_csv, nomes = cabecalho[:8]
+    if magico != _MAGICO or versao != _VERSAO or nomes != identificacao:
+        return False
+    info = os.stat(caminho_csv)
+    if info.st_size != tamanho:
+        return False
+    if info.st_mtime_ns == mtime_ns and not verificar_hash:
+        return True
+    return hash_arquivo(caminho_csv) == hash_csv
+
+def _atualizar_mtime(caminho_entrada: str, cabecalho: tuple, mtime_ns: int):
+    """Conteúdo igual com mtime novo: grava o mtime no cabeçalho para não recalcular o hash."""
+    novo = list(cabecalho)
+    novo[5] = mtime_ns
+    with open(caminho_entrada, mode="r+b") as f:
+        f.write(_CABECALHO.pack(*novo))
+
+def carregar_cache(caminho_csv: str, caminho_entrada: Optional[str] = None,
+                   verificar_hash: bool = False,
+                   resolver: Optional["NameResolver"] = None) -> Optional[Tuple[MatchStore, int]]:
+    """
+    Abre o cache via mmap e reconstrói a MatchStore copiando cada coluna de
+    uma vez (sem interpretar linha a linha).
+    Retorna (store, linhas_filtradas), ou None se o cache não existir ou estiver desatualizado.
+    """
+    caminho_entrada = caminho_entrada or caminho_cache(caminho_csv)
+    try:
+        f = open(caminho_entrada, mode="rb")
+    except FileNotFoundError:
+        return None
+
+    with f:
+        if os.fstat(f.fileno()).st_size < _CABECALHO.size:
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with mm:
+        cabecalho = _CABECALHO.unpack_from(mm, 0)
+        if not _cache_valido(cabecalho, caminho_csv, verificar_hash, _identificacao(resolver)):
+            return None
+        (_, _, linhas, linhas_filtradas, _, _, _, _,
+         bytes_nomes, bytes_strings, qtd_nomes, qtd_strings) = cabecalho
+        # Arquivo truncado (ou com sobra): o tamanho precisa bater com o cabeçalho
+        esperado = (_CABECALHO.size + bytes_nomes + bytes_strings
+                    + linhas * _BYTES_POR_LINHA)
+        if len(mm) != esperado:
+            return None
+
+        store = MatchStore()
+        pos = _CABECALHO.size
+        nomes = _separar_strings(mm[pos:pos + bytes_nomes], qtd_nomes)
+        pos += bytes_nomes
+        store.strings = _separar_strings(mm[pos:pos + bytes_strings], qtd_strings)
+        pos += bytes_strings
+        if len(nomes) != qtd_nomes or len(store.strings) != qtd_strings:
+            return None
+        store.set_team_names(nomes)
+        store.string_ids = {valor: i for i, valor in enumerate(store.strings)}
+
+        with memoryview(mm) as visao:
+            for nome in _COLUNAS:
+                coluna = getattr(store, nome)
+                fim = pos + linhas * coluna.itemsize
+                coluna.frombytes(visao[pos:fim])
+                if sys.byteorder != "little":
+                    coluna.byteswap()
+                pos = fim
+
+    mtime_ns = os.stat(caminho_csv).st_mtime_ns
+    if mtime_ns != cabecalho[5]:
+        _atualizar_mtime(caminho_entrada, cabecalho, mtime_ns)
+    return store, linhas_filtradas
+
+def carregar_resultados(caminho_csv: str, usar_cache: bool = True, processos: int = 1,
+                        resolver: Optional["NameResolver"] = None) -> Tuple[MatchStore, int]:
+    """
+    Carrega results.csv usando o cache binário quando ele estiver válido.
+    Caso contrário lê o CSV e (re)grava o cache para as próximas execuções.
+    """
+    if usar_cache:
+        carregado = carregar_cache(caminho_csv, resolver=resolver)
+        if carregado is not None:
+            return carregado
+
+    store, linhas_filtradas = ler_resultados_csv(caminho_csv, processos, resolver)
+    if usar_cache:
+        try:
+            salvar_cache(store, linhas_filtradas, caminho_csv, resolver=resolver)
+        except OSError:
+            pass  # sem permissão de escrita: segue sem cache
+    return store, linhas_filtradas
@@ -0,0 +1,397 @@
+# src/cli.py
+# Ferramenta de consulta pela linha de comando.
+# Execução (a partir da raiz do projeto):
+#     python -m src.cli standings [--inicio 1990-01-01 --fim 1999-12-31] [--limite 20] [--gols]
+#     python -m src.cli --disputas standings     # empates decididos nos pênaltis contam para o vencedor
+#     python -m src.cli team Brazil [--inicio ... --fim ...]
+#     python -m src.cli top [-n 10] [--menos]
+#     python -m src.cli top --elo [--data 1990-01-01]     # ranking por rating Elo
+#     python -m src.cli top --artilheiros [--time Brazil | --torneio "FIFA World Cup" | --decada 1990]
+#     python -m src.cli search Bra [-n 10] [--categoria team|tournament|city|country]
+#     python -m src.cli h2h Brazil Argentina [--inicio ... --fim ...] [--ultimos 5]
+#     python -m src.cli index [--time Brazil] [--faixa 100 200 [--campo points|goals_for]]
+#     python -m src.cli export [--saida output/matches_summary.csv] [--incremental] [--gzip | --binario]
+#     python -m src.cli pipeline                  # demonstração completa (Etapas 2 a 6)
+#     python -m src.cli pipeline --perfil output/perfil.json   # + relatório de desempenho
+#
+# Cada comando importa e monta só o que usa: os módulos pesados são importados
+# dentro das funções, e as partidas vêm do cache binário (src/cache.py).
+import argparse
+import sys
+from typing import List, Optional
+
+CAMINHO_RESULTADOS = "data/results.csv"
+CAMINHO_NOMES_ANTIGOS = "data/former_names.csv"
+CAMINHO_GOLS = "data/goalscorers.csv"
+CAMINHO_DISPUTAS = "data/shootouts.csv"
+CAMINHO_RESUMO = "output/matches_summary.csv"
+# Mesmas categorias de src/name_index.py (repetidas para não importar o módulo só pelo parser)
+CATEGORIAS = ("team", "tournament", "city", "country")
+
+# =====================================================================
+# Funções Auxiliares
+# =====================================================================
+
+def _carregar(args: argparse.Namespace):
+    """
+    Carrega as partidas (MatchStore), com nomes históricos já resolvidos e,
+    com --disputas, os vencedores das disputas de pênaltis anexados.
+    """
+    from .cache import carregar_resultados
+    from .former_names import NameResolver
+
+    resolver = NameResolver.from_csv(args.nomes_antigos) if args.nomes_antigos else None
+    store, _ = carregar_resultados(args.resultados, usar_cache=not args.sem_cache,
+                                   resolver=resolver)
+    if args.disputas:
+        from .shootouts import carregar_disputas
+        carregar_disputas(store, args.disputas_csv, resolver)
+    return store, resolver
+
+def _ordinal(texto: Optional[str], padrao: Optional[int]) -> Optional[int]:
+    """Converte uma data "AAAA-MM-DD" da linha de comando (ou usa o padrão)."""
+    from .ingest import data_iso_para_ordinal
+    return data_iso_para_ordinal(texto) if texto else padrao
+
+def _intervalo(args: argparse.Namespace, store) -> tuple:
+    """(início, fim) pedidos em --inicio/--fim, como ordinais (padrão: todo o histórico)."""
+    primeira = min(store.dates) if len(store) else 0
+    ultima = max(store.dates) if len(store) else 0
+    return _ordinal(args.inicio, primeira), _ordinal(args.fim, ultima)
+
+def _imprimir_ranking(linhas: List[tuple], unidade: str):
+    """Imprime uma lista de (posição, nome, valor)."""
+    for posicao, nome, valor in linhas:
+        print(f"  {posicao:>3}. {nome}: {valor} {unidade}")
+
+# =====================================================================
+# Comandos
+# =====================================================================
+
+def comando_standings(args: argparse.Namespace) -> int:
+    """Classificação (pontos ou gols), em todo o histórico ou em um intervalo de datas."""
+    from .sorting import merge_sort
+
+    store, _ = _carregar(args)
+    if args.inicio or args.fim:
+        from .standings import DateRangeStandings
+        inicio, fim = _intervalo(args, store)
+        indice = DateRangeStandings.from_store(store, args.disputas)
+        times = indice.total_goals(inicio, fim) if args.gols else indice.team_scores(inicio, fim)
+    else:
+        times = store.total_goals() if args.gols else store.team_scores(args.disputas)
+
+    merge_sort(times, key=lambda t: (-t.score, t.name))
+    if args.limite:
+        times = times[:args.limite]
+    _imprimir_ranking([(i + 1, t.name, t.score) for i, t in enumerate(times)],
+                      "gols" if args.gols else "pontos")
+    return 0
+
+def _sugerir_times(store, resolver, nome: str):
+    """Imprime nomes parecidos com um time não encontrado."""
+    from .name_index import NameIndex
+    print(f"Time '{nome}' não encontrado.", file=sys.stderr)
+    sugestoes = NameIndex.from_store(store, resolver).search(nome, 5, "team")
+    if sugestoes:
+        print("Você quis dizer: " + ", ".join(n for n, _, _ in sugestoes) + "?", file=sys.stderr)
+
+def _imprimir_time(nome: str, totais: dict, pontos: int, disputas: Optional[tuple] = None):
+    print(f"{nome}")
+    print(f"  Jogos: {totais['played']}  (V {totais['wins']} / E {totais['draws']} / D {totais['losses']})")
+    if disputas is not None:
+        print(f"  Pênaltis: {disputas[0]} disputas vencidas, {disputas[1]} perdidas")
+    print(f"  Gols: {totais['goals_for']} marcados, {totais['goals_against']} sofridos")
+    print(f"  Pontos: {pontos}")
+
+def comando_team(args: argparse.Namespace) -> int:
+    """
+    Resumo de um time: jogos, V/E/D, gols pró/contra, pontos e posição.
+    Em todo o histórico (sem --disputas), lê tudo do índice em disco
+    (src/disk_index.py), sem carregar as partidas. Nos outros casos faz uma
+    única passada pelas partidas.
+    """
+    if not (args.inicio or args.fim or args.disputas or args.sem_cache):
+        from .disk_index import abrir_indice
+        from .former_names import NameResolver
+
+        resolver = NameResolver.from_csv(args.nomes_antigos) if args.nomes_antigos else None
+        with abrir_indice(args.resultados, resolver) as indice:
+            totais = indice.team(args.nome)
+            if totais is not None:
+                pontos = totais["points"]
+                # Posição: 1 + times com mais pontos (empates dividem a posição)
+                melhores = len(indice.score_range(pontos + 1, 2 ** 31 - 1))
+                _imprimir_time(args.nome, totais, pontos)
+                print(f"  Posição no ranking: {melhores + 1} de {len(indice)}")
+                return 0
+        store, resolver = _carregar(args)
+        _sugerir_times(store, resolver, args.nome)
+        return 1
+
+    store, resolver = _carregar(args)
+    team = store.team_ids.get(args.nome)
+    if team is None:
+        _sugerir_times(store, resolver, args.nome)
+        return 1
+
+    inicio, fim = _intervalo(args, store)
+    if not (args.inicio or args.fim):
+        from .aggregate import agregar_store
+        totais_gerais = agregar_store(store)
+        totais = totais_gerais.row(args.nome)
+    else:
+        totais = dict(played=0, wins=0, draws=0, losses=0, goals_for=0, goals_against=0)
+        for data, home, away, home_score, away_score in zip(store.dates, store.home_ids, store.away_ids,
+                                                            store.home_scores, store.away_scores):
+            if home != team and away != team or not inicio <= data <= fim:
+                continue
+            marcados, sofridos = (home_score, away_score) if home == team else (away_score, home_score)
+            totais["played"] += 1
+            totais["goals_for"] += marcados
+            totais["goals_against"] += sofridos
+            if marcados > sofridos:
+                totais["wins"] += 1
+            elif marcados == sofridos:
+                totais["draws"] += 1
+            else:
+                totais["losses"] += 1
+
+    pontos = 3 * totais["wins"] + totais["draws"]
+    disputas = None
+    if args.disputas:
+        # Empates decididos nos pênaltis: pontos da disputa no lugar do ponto do empate
+        from .data_structs import PONTOS_PERDEDOR_PENALTIS, PONTOS_VENCEDOR_PENALTIS
+        vencidas = perdidas = 0
+        for i, vencedor in store.shootouts.items():
+            if (team in (store.home_ids[i], store.away_ids[i]) and inicio <= store.dates[i] <= fim
+                    and store.home_scores[i] == store.away_scores[i]):
+                if vencedor == team:
+                    vencidas += 1
+                    pontos += PONTOS_VENCEDOR_PENALTIS - 1
+                else:
+                    perdidas += 1
+                    pontos += PONTOS_PERDEDOR_PENALTIS - 1
+        disputas = (vencidas, perdidas)
+
+    _imprimir_time(args.nome, totais, pontos, disputas)
+    if not (args.inicio or args.fim):
+        # Posição no ranking geral: 1 + times com mais pontos (empates dividem a posição)
+        from .aggregate import aplicar_disputas
+        if args.disputas:
+            aplicar_disputas(totais_gerais, store)
+        melhores = sum(1 for p in totais_gerais.points if p > pontos)
+        print(f"  Posição no ranking: {melhores + 1} de {len(store.team_names)}")
+    return 0
+
+def comando_top(args: argparse.Namespace) -> int:
+    """Top N times por pontos ou rating Elo (ou os N piores), ou top N artilheiros."""
+    if args.artilheiros:
+        from .goalscorers import ScorerIndex, anexar_gols, ler_gols_csv
+
+        store, resolver = _carregar(args)
+        gols, _ = ler_gols_csv(args.gols_csv, store, resolver)
+        anexar_gols(store, gols)
+        indice = ScorerIndex.from_goals(gols, store)
+        if args.time:
+            ranking = indice.top_scorers_team(args.time, args.n)
+        elif args.torneio:
+            ranking = indice.top_scorers_tournament(args.torneio, args.n)
+        elif args.decada is not None:
+            ranking = indice.top_scorers_decade(args.decada, args.n)
+        else:
+            ranking = indice.top_scorers(args.n)
+        _imprimir_ranking([(i + 1, nome, gols) for i, (nome, gols) in enumerate(ranking)], "gols")
+        return 0
+
+    from .sorting import bottom_k, top_k
+
+    store, _ = _carregar(args)
+    selecao = bottom_k if args.menos else top_k
+    if args.elo:
+        from .elo import EloEngine
+        dia = _ordinal(args.data, None)
+        times, unidade = EloEngine.from_store(store).team_ratings(dia), "Elo"
+    else:
+        times, unidade = store.team_scores(args.disputas), "pontos"
+    times = selecao(times, args.n, key=lambda t: t.score)
+    _imprimir_ranking([(i + 1, t.name, t.score) for i, t in enumerate(times)], unidade)
+    return 0
+
+def comando_h2h(args: argparse.Namespace) -> int:
+    """Confronto direto entre dois times: V/E/D, gols de cada lado e forma recente."""
+    from .head_to_head import HeadToHeadIndex
+
+    store, _ = _carregar(args)
+    for nome in (args.time_a, args.time_b):
+        if nome not in store.team_ids:
+            print(f"Time '{nome}' não encontrado.", file=sys.stderr)
+            return 1
+
+    indice = HeadToHeadIndex.from_store(store)
+    inicio = _ordinal(args.inicio, None)
+    fim = _ordinal(args.fim, None)
+    confronto = indice.record(args.time_a, args.time_b, inicio, fim)
+    print(f"{args.time_a} x {args.time_b}: {confronto.played} jogos")
+    print(f"  Vitórias {args.time_a}: {confronto.wins}  |  Empates: {confronto.draws}  |  "
+          f"Vitórias {args.time_b}: {confronto.losses}")
+    print(f"  Gols: {confronto.goals_for} x {confronto.goals_against}")
+    print(f"  Últimos {args.ultimos} jogos ({args.time_a}): "
+          f"{indice.last_n(args.time_a, args.time_b, args.ultimos, inicio, fim) or '-'}")
+    return 0
+
+def comando_export(args: argparse.Namespace) -> int:
+    """Grava o resumo das partidas (Etapa 6): CSV, CSV gzip ou binário colunar."""
+    from .export import exportar_binario, exportar_csv
+
+    store, _ = _carregar(args)
+    if args.binario:
+        linhas = exportar_binario(store, args.saida)
+    else:
+        linhas = exportar_csv(store, args.saida, incremental=args.incremental,
+                              compactar=args.gzip)
+    print(f"Arquivo de resumo gerado em: {args.saida} ({linhas} linhas gravadas)")
+    return 0
+
+def comando_search(args: argparse.Namespace) -> int:
+    """Busca de nomes por prefixo ou aproximada (times, torneios, cidades e países)."""
+    from .name_index import NameIndex
+
+    store, resolver = _carregar(args)
+    resultados = NameIndex.from_store(store, resolver).search(args.texto, args.n, args.categoria)
+    if not resultados:
+        print(f"Nada encontrado para '{args.texto}'.")
+        return 1
+    for nome, categoria, pontuacao in resultados:
+        print(f"  {nome}  ({categoria}, {pontuacao:.2f})")
+    return 0
+
+def comando_index(args: argparse.Namespace) -> int:
+    """
+    Consultas no índice em disco (src/disk_index.py), sem carregar as partidas.
+    O índice é (re)gravado ao lado do CSV quando não existe ou está desatualizado.
+    """
+    from .disk_index import abrir_indice
+    from .former_names import NameResolver
+
+    resolver = NameResolver.from_csv(args.nomes_antigos) if args.nomes_antigos else None
+    with abrir_indice(args.resultados, resolver) as indice:
+        if args.time:
+            totais = indice.team(args.time)
+            if totais is None:
+                print(f"Time '{args.time}' não encontrado.", file=sys.stderr)
+                return 1
+            print(args.time)
+            for campo, valor in totais.items():
+                print(f"  {campo}: {valor}")
+        if args.faixa:
+            low, high = args.faixa
+            unidade = "pontos" if args.campo == "points" else "gols"
+            for valor, nome in indice.score_range(low, high, args.campo):
+                print(f"  {nome}: {valor} {unidade}")
+        if not (args.time or args.faixa):
+            print(f"Índice com {len(indice)} times; altura das árvores: "
+                  + ", ".join(f"{arvore} {altura}" for arvore, (_, altura) in indice.roots.items()))
+    return 0
+
+def comando_pipeline(args: argparse.Namespace) -> int:
+    """Demonstração completa do trabalho (Etapas 2 a 6, com todas as impressões)."""
+    from .main import imprimir_pipeline
+    from .profiling import Profiler
+    perfil = Profiler(enabled=bool(args.perfil), memoria=not args.sem_tracemalloc)
+    with perfil:
+        imprimir_pipeline(args.resultados, args.saida, args.nomes_antigos, perfil,
+                          args.disputas_csv if args.disputas else None)
+    if args.perfil:
+        perfil.salvar(args.perfil)
+        print(f"Relatório de desempenho gravado em: {args.perfil}", file=sys.stderr)
+    return 0
+
+# =====================================================================
+# Argumentos
+# =====================================================================
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli",
+                                     description="Consultas sobre as partidas internacionais de futebol")
+    parser.add_argument("--resultados", default=CAMINHO_RESULTADOS, help="caminho de results.csv")
+    parser.add_argument("--nomes-antigos", default=CAMINHO_NOMES_ANTIGOS,
+                        help="caminho de former_names.csv ('' para não resolver nomes antigos)")
+    parser.add_argument("--sem-cache", action="store_true", help="não usa o cache binário")
+    parser.add_argument("--disputas", action="store_true",
+                        help="empates decididos nos pênaltis contam para o vencedor da disputa")
+    parser.add_argument("--disputas-csv", default=CAMINHO_DISPUTAS, help="caminho de shootouts.csv")
+    comandos = parser.add_subparsers(dest="comando")
+
+    p = comandos.add_parser("standings", help="classificação por pontos ou gols")
+    p.add_argument("--inicio", help="data inicial (AAAA-MM-DD)")
+    p.add_argument("--fim", help="data final (AAAA-MM-DD)")
+    p.add_argument("--limite", type=int, default=20, help="quantidade de linhas (0 = todas)")
+    p.add_argument("--gols", action="store_true", help="ordena por gols marcados")
+    p.set_defaults(funcao=comando_standings)
+
+    p = comandos.add_parser("team", help="resumo de um time")
+    p.add_argument("nome")
+    p.add_argument("--inicio", help="data inicial (AAAA-MM-DD)")
+    p.add_argument("--fim", help="data final (AAAA-MM-DD)")
+    p.set_defaults(funcao=comando_team)
+
+    p = comandos.add_parser("top", help="top N times ou artilheiros")
+    p.add_argument("-n", type=int, default=10)
+    p.add_argument("--menos", action="store_true", help="os N times com menos pontos")
+    p.add_argument("--elo", action="store_true", help="ordena pelo rating Elo")
+    p.add_argument("--data", help="rating Elo nesta data (AAAA-MM-DD)")
+    p.add_argument("--artilheiros", action="store_true", help="ranking de artilheiros")
+    p.add_argument("--gols-csv", default=CAMINHO_GOLS, help="caminho de goalscorers.csv")
+    p.add_argument("--time", help="artilheiros de um time")
+    p.add_argument("--torneio", help="artilheiros de um torneio")
+    p.add_argument("--decada", type=int, help="artilheiros de uma década (ex.: 1990)")
+    p.set_defaults(funcao=comando_top)
+
+    p = comandos.add_parser("search", help="busca de nomes por prefixo ou aproximada")
+    p.add_argument("texto")
+    p.add_argument("-n", type=int, default=10)
+    p.add_argument("--categoria", choices=CATEGORIAS, help="só times, torneios, cidades ou países")
+    p.set_defaults(funcao=comando_search)
+
+    p = comandos.add_parser("h2h", help="confronto direto entre dois times")
+    p.add_argument("time_a")
+    p.add_argument("time_b")
+    p.add_argument("--inicio", help="data inicial (AAAA-MM-DD)")
+    p.add_argument("--fim", help="data final (AAAA-MM-DD)")
+    p.add_argument("--ultimos", type=int, default=5, help="tamanho da forma recente")
+    p.set_defaults(funcao=comando_h2h)
+
+    p = comandos.add_parser("index", help="consultas no índice de times em disco (sem carregar as partidas)")
+    p.add_argument("--time", help="totais de um time")
+    p.add_argument("--faixa", type=int, nargs=2, metavar=("MIN", "MAX"), help="times com valor na faixa")
+    p.add_argument("--campo", choices=("points", "goals_for"), default="points")
+    p.set_defaults(funcao=comando_index)
+
+    p = comandos.add_parser("export", help="grava o CSV de resumo das partidas")
+    p.add_argument("--saida", default=CAMINHO_RESUMO)
+    p.add_argument("--incremental", action="store_true",
+                   help="acrescenta só as partidas novas desde a última exportação")
+    p.add_argument("--gzip", action="store_true", help="grava o CSV compactado")
+    p.add_argument("--binario", action="store_true", help="grava em formato binário colunar")
+    p.set_defaults(funcao=comando_export)
+
+    p = comandos.add_parser("pipeline", help="demonstração completa (Etapas 2 a 6)")
+    p.add_argument("--saida", default=CAMINHO_RESUMO)
+    p.add_argument("--perfil", help="grava um relatório JSON com tempo, CPU e memória de cada etapa")
+    p.add_argument("--sem-tracemalloc", action="store_true",
+                   help="no relatório, não mede memória (tracemalloc deixa a execução mais lenta)")
+    p.set_defaults(funcao=comando_pipeline)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada. Sem comando, executa o pipeline completo (comportamento original)."""
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+    if args.comando is None:
+        args = parser.parse_args(list(argv or sys.argv[1:]) + ["pipeline"])
+    return args.funcao(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
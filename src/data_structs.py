@@ -1,14 +1,55 @@
 # src/data_structs.py
-from datetime import datetime
-from typing import List, Tuple
+import sys
+from datetime import date as Date, datetime
+from typing import Dict, List, Tuple
+
+class NameTable:
+    """
+    Tabela de internamento de nomes: cada nome recebe um ID inteiro pequeno
+    (0, 1, 2, ...), e cada nome/ID existe uma única vez na memória.
+    """
+    __slots__ = ("names", "ids")
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, name: str) -> int:
+        """Retorna o ID do nome, registrando-o se ainda não existir."""
+        name_id = self.ids.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            name = sys.intern(name)
+            self.ids[name] = name_id
+            self.names.append(name)
+        return name_id
+
+    def name(self, name_id: int) -> str:
+        """Retorna o nome de um ID."""
+        return self.names[name_id]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+# Tabela global de times, compartilhada por Match, Team e pelos nós das árvores
+TEAM_NAMES = NameTable()
+
+# Pontos de uma partida empatada decidida nos pênaltis (modo com disputas):
+# o vencedor da disputa leva os pontos de uma vitória.
+PONTOS_VENCEDOR_PENALTIS = 3
+PONTOS_PERDEDOR_PENALTIS = 0
 
 class Team:
     """
     Classe que representa uma seleção ou time de futebol.
-    Atributos: name (nome do time) e score (pontuação acumulada).
+    Atributos: name (nome do time), score (pontuação acumulada) e
+    team_id (ID do nome na tabela global TEAM_NAMES).
     """
+    __slots__ = ("name", "score", "team_id")
+
     def __init__(self, name: str, score: int = 0):
-        self.name = name
+        self.team_id = TEAM_NAMES.intern(name)
+        self.name = TEAM_NAMES.names[self.team_id]
         self.score = score
 
     def __lt__(self, other):
@@ -22,21 +63,72 @@ class Team:
 class Match:
     """
     Classe que representa uma partida de futebol.
+    Representação compacta (__slots__): os times são guardados como IDs da
+    tabela TEAM_NAMES e a data como ordinal inteiro (date.toordinal()).
+    Os atributos date, home_team_name e away_team_name continuam disponíveis
+    como propriedades.
     """
-    def __init__(self, date: datetime, home_team_name: str, away_team_name: str, 
+    __slots__ = ("date_ord", "home_id", "away_id", "home_score", "away_score",
+                 "tournament", "city", "country", "neutral", "goals", "shootout_winner_id")
+
+    def __init__(self, date: datetime | int, home_team_name: str, away_team_name: str, 
                  home_score: int, away_score: int, tournament: str = "", 
                  city: str = "", country: str = "", neutral: bool = False):
-        # A classe Match armazena os nomes dos times, não objetos Team, 
+        # A classe Match armazena os times (IDs dos nomes), não objetos Team, 
         # para facilitar a leitura inicial do CSV.
-        self.date = date
-        self.home_team_name = home_team_name
-        self.away_team_name = away_team_name
+        self.date_ord = date if isinstance(date, int) else date.toordinal()
+        self.home_id = TEAM_NAMES.intern(home_team_name)
+        self.away_id = TEAM_NAMES.intern(away_team_name)
         self.home_score = home_score
         self.away_score = away_score
-        self.tournament = tournament
-        self.city = city
-        self.country = country
+        # Textos repetidos (torneio, cidade, país) compartilham o mesmo objeto str
+        self.tournament = sys.intern(tournament)
+        self.city = sys.intern(city)
+        self.country = sys.intern(country)
         self.neutral = neutral
+        # Gols da partida (objetos Goal), preenchidos pela junção com goalscorers.csv
+        self.goals: Tuple["Goal", ...] = ()
+        # ID do vencedor da disputa de pênaltis (-1 se não houve), de shootouts.csv
+        self.shootout_winner_id = -1
+
+    @property
+    def date(self) -> datetime:
+        """Data da partida (criada a partir do ordinal)."""
+        return datetime.fromordinal(self.date_ord)
+
+    @date.setter
+    def date(self, value: datetime):
+        self.date_ord = value.toordinal()
+
+    @property
+    def home_team_name(self) -> str:
+        return TEAM_NAMES.names[self.home_id]
+
+    @home_team_name.setter
+    def home_team_name(self, value: str):
+        self.home_id = TEAM_NAMES.intern(value)
+
+    @property
+    def away_team_name(self) -> str:
+        return TEAM_NAMES.names[self.away_id]
+
+    @away_team_name.setter
+    def away_team_name(self, value: str):
+        self.away_id = TEAM_NAMES.intern(value)
+
+    @property
+    def shootout_winner(self) -> str | None:
+        """Nome do vencedor da disputa de pênaltis, ou None se não houve disputa."""
+        return TEAM_NAMES.names[self.shootout_winner_id] if self.shootout_winner_id >= 0 else None
+
+    @shootout_winner.setter
+    def shootout_winner(self, value: str | None):
+        self.shootout_winner_id = -1 if value is None else TEAM_NAMES.intern(value)
+
+    @property
+    def year(self) -> int:
+        """Ano da partida (sem criar um datetime)."""
+        return Date.fromordinal(self.date_ord).year
 
     def total_goals(self) -> int:
         """Calcula e retorna o total de gols na partida."""
@@ -47,20 +139,54 @@ class Match:
         Retorna uma linha para gravação CSV no formato: 
         [ano, país, nome_time_casa, nome_time_visitante, placar (ex: "2-0")]
         """
-        year = str(self.date.year)
+        year = str(self.year)
         score = f"{self.home_score}-{self.away_score}"
         # Formato de score alterado de "2 x 0" para "2-0" conforme o requisito do CSV de saída.
         return [year, self.country, self.home_team_name, self.away_team_name, score]
 
-    def determine_points(self) -> Tuple[int, int]:
+    def determine_points(self, shootouts: bool = False) -> Tuple[int, int]:
         """
         Determina os pontos de cada time (casa, visitante) baseado no resultado.
         Vitória = 3 pontos, Empate = 1 ponto, Derrota = 0 pontos (Etapa 4).
+        Com 'shootouts', um empate decidido nos pênaltis dá ao vencedor da
+        disputa PONTOS_VENCEDOR_PENALTIS e ao outro PONTOS_PERDEDOR_PENALTIS.
         Retorna: (pontos_casa, pontos_visitante)
         """
         if self.home_score > self.away_score:
             return (3, 0)  # Vitória Casa
         elif self.home_score < self.away_score:
             return (0, 3)  # Vitória Visitante
+        elif shootouts and self.shootout_winner_id >= 0:
+            if self.shootout_winner_id == self.home_id:
+                return (PONTOS_VENCEDOR_PENALTIS, PONTOS_PERDEDOR_PENALTIS)
+            return (PONTOS_PERDEDOR_PENALTIS, PONTOS_VENCEDOR_PENALTIS)
         else:
-            return (1, 1)  # Empate
\ No newline at end of file
+            return (1, 1)  # Empate
+
+class Goal:
+    """
+    Classe que representa um gol (linha de goalscorers.csv).
+    Atributos: match_index (linha da partida na MatchStore, -1 se a partida
+    não foi encontrada), date_ord, team_id (time que marcou, ID de TEAM_NAMES),
+    scorer (None se desconhecido), minute (None se desconhecido), own_goal e penalty.
+    """
+    __slots__ = ("match_index", "date_ord", "team_id", "scorer", "minute",
+                 "own_goal", "penalty")
+
+    def __init__(self, match_index: int, date_ord: int, team: str, scorer: str | None,
+                 minute: int | None = None, own_goal: bool = False, penalty: bool = False):
+        self.match_index = match_index
+        self.date_ord = date_ord
+        self.team_id = TEAM_NAMES.intern(team)
+        self.scorer = sys.intern(scorer) if scorer is not None else None
+        self.minute = minute
+        self.own_goal = own_goal
+        self.penalty = penalty
+
+    @property
+    def team(self) -> str:
+        return TEAM_NAMES.names[self.team_id]
+
+    def __repr__(self):
+        """Representação para debug."""
+        return f"Goal({self.scorer!r}, team={self.team!r}, minute={self.minute})"
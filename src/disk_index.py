@@ -0,0 +1,353 @@
+# src/disk_index.py
+# Índice ordenado em disco (árvore B+ estática, em páginas) com os totais
+# por time: consultas por nome e por faixa de pontos/gols sem carregar as
+# partidas nem montar BSTs. O arquivo é aberto com mmap (somente leitura),
+# então vários processos compartilham as mesmas páginas do cache do sistema
+# e cada consulta só toca as poucas páginas do caminho até a folha.
+#
+# Formato do arquivo (little-endian, páginas de TAMANHO_PAGINA bytes):
+#   [página 0]       cabeçalho (_CABECALHO) + raiz e altura de cada árvore
+#   [registros]      um registro de largura fixa por time (_REGISTRO)
+#   [nomes]          nomes dos times em UTF-8, um após o outro
+#   [árvores]        páginas das árvores B+ (nome, pontos e gols)
+#
+# Páginas das árvores ("slotted pages"):
+#   [tipo u8][n u16][próxima folha u32] [n deslocamentos u16] ... [entradas]
+#   entrada = [tamanho da chave u16][chave][valor u32]
+# Nas folhas o valor é o número do registro; nas páginas internas é a página
+# filha, e a chave é a primeira chave dessa filha. As folhas são encadeadas
+# (próxima folha) para as consultas por faixa.
+import mmap
+import os
+import struct
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from .aggregate import TeamStats, agregar_store
+from .cache import carregar_resultados, hash_arquivo
+
+if TYPE_CHECKING:
+    from .former_names import NameResolver
+
+TAMANHO_PAGINA = 4096
+
+_MAGICO = b"TEAMIDX1"
+_VERSAO = 1
+
+# mágico, versão, tamanho_pagina, times, tamanho_csv, mtime_ns_csv, hash_csv,
+# identificação_nomes, página_registros, página_nomes, bytes_nomes
+_CABECALHO = struct.Struct("<8sIIIQQ16s16sIIQ")
+# raiz e altura de cada árvore, na ordem de ARVORES
+_RAIZ = struct.Struct("<II")
+# points, goals_for, goals_against, wins, draws, losses, played, início do nome, tamanho do nome
+_REGISTRO = struct.Struct("<7iIH2x")
+_PAGINA = struct.Struct("<BHI")
+_DESLOCAMENTO = struct.Struct("<H")
+_TAMANHO_CHAVE = struct.Struct("<H")
+_VALOR = struct.Struct("<I")
+
+_FOLHA = 1
+_INTERNA = 2
+
+# Árvores do arquivo: "name" (nome do time) e uma por campo numérico de TeamStats
+ARVORES = ("name", "points", "goals_for")
+
+def caminho_indice(caminho_csv: str) -> str:
+    """O índice fica ao lado do CSV: data/results.csv -> data/results.csv.idx"""
+    return caminho_csv + ".idx"
+
+def _chave_inteira(valor: int) -> bytes:
+    """Inteiro de 32 bits como bytes que ordenam igual aos números (big-endian com o sinal invertido)."""
+    return struct.pack(">I", (valor + (1 << 31)) & 0xFFFFFFFF)
+
+# =====================================================================
+# Gravação
+# =====================================================================
+
+def _paginas(entradas: List[Tuple[bytes, int]]) -> List[List[Tuple[bytes, int]]]:
+    """Divide as entradas (já ordenadas) em páginas cheias, na ordem."""
+    paginas, atual, usado = [], [], _PAGINA.size
+    for chave, valor in entradas:
+        tamanho = _DESLOCAMENTO.size + _TAMANHO_CHAVE.size + len(chave) + _VALOR.size
+        if tamanho + _PAGINA.size > TAMANHO_PAGINA:
+            raise ValueError("chave grande demais para uma página")
+        if atual and usado + tamanho > TAMANHO_PAGINA:
+            paginas.append(atual)
+            atual, usado = [], _PAGINA.size
+        atual.append((chave, valor))
+        usado += tamanho
+    if atual or not paginas:
+        paginas.append(atual)
+    return paginas
+
+def _montar_pagina(tipo: int, entradas: List[Tuple[bytes, int]], proxima: int) -> bytes:
+    pagina = bytearray(TAMANHO_PAGINA)
+    _PAGINA.pack_into(pagina, 0, tipo, len(entradas), proxima)
+    pos = _PAGINA.size + len(entradas) * _DESLOCAMENTO.size
+    for i, (chave, valor) in enumerate(entradas):
+        _DESLOCAMENTO.pack_into(pagina, _PAGINA.size + i * _DESLOCAMENTO.size, pos)
+        _TAMANHO_CHAVE.pack_into(pagina, pos, len(chave))
+        pos += _TAMANHO_CHAVE.size
+        pagina[pos:pos + len(chave)] = chave
+        pos += len(chave)
+        _VALOR.pack_into(pagina, pos, valor)
+        pos += _VALOR.size
+    return bytes(pagina)
+
+def _montar_arvore(entradas: List[Tuple[bytes, int]], primeira_pagina: int) -> Tuple[List[bytes], int, int]:
+    """
+    Monta a árvore B+ de baixo para cima: folhas cheias com as entradas e, em
+    cada nível acima, uma entrada (primeira chave, página) por página de baixo.
+    Retorna (páginas, página raiz, altura).
+    """
+    paginas: List[bytes] = []
+    nivel = _paginas(entradas)
+    tipo, altura = _FOLHA, 1
+    while True:
+        inicio = primeira_pagina + len(paginas)
+        for k, grupo in enumerate(nivel):
+            proxima = inicio + k + 1 if tipo == _FOLHA and k + 1 < len(nivel) else 0
+            paginas.append(_montar_pagina(tipo, grupo, proxima))
+        if len(nivel) == 1:
+            return paginas, inicio, altura
+        acima = [(grupo[0][0] if grupo else b"", inicio + k) for k, grupo in enumerate(nivel)]
+        nivel = _paginas(acima)
+        tipo, altura = _INTERNA, altura + 1
+
+def gravar_indice(stats: TeamStats, caminho_saida: str, caminho_csv: Optional[str] = None,
+                  resolver: Optional["NameResolver"] = None):
+    """
+    Grava o índice em disco a partir de uma tabela de totais (TeamStats).
+    Com 'caminho_csv', o cabeçalho guarda tamanho, mtime e hash do CSV de
+    origem (e o índice de nomes antigos) para abrir_indice saber se ele vale.
+    Gravação atômica via arquivo temporário.
+    """
+    total = len(stats)
+    nomes = [nome.encode("utf-8") for nome in stats.team_names]
+    registros = bytearray()
+    inicio_nome = 0
+    for i in range(total):
+        registros += _REGISTRO.pack(stats.points[i], stats.goals_for[i], stats.goals_against[i],
+                                    stats.wins[i], stats.draws[i], stats.losses[i], stats.played[i],
+                                    inicio_nome, len(nomes[i]))
+        inicio_nome += len(nomes[i])
+    bytes_nomes = b"".join(nomes)
+
+    paginas_registros = -(-len(registros) // TAMANHO_PAGINA)
+    pagina_nomes = 1 + paginas_registros
+    proxima = pagina_nomes + -(-len(bytes_nomes) // TAMANHO_PAGINA)
+
+    arvores: List[bytes] = []
+    raizes = b""
+    for arvore in ARVORES:
+        if arvore == "name":
+            entradas = sorted((nome, i) for i, nome in enumerate(nomes))
+        else:
+            coluna = getattr(stats, arvore)
+            entradas = sorted((_chave_inteira(coluna[i]), i) for i in range(total))
+        paginas, raiz, altura = _montar_arvore(entradas, proxima + len(arvores))
+        arvores.extend(paginas)
+        raizes += _RAIZ.pack(raiz, altura)
+
+    if caminho_csv is not None:
+        info = os.stat(caminho_csv)
+        origem = (info.st_size, info.st_mtime_ns, hash_arquivo(caminho_csv))
+    else:
+        origem = (0, 0, bytes(16))
+    identificacao = resolver.fingerprint if resolver is not None else bytes(16)
+    cabecalho = _CABECALHO.pack(_MAGICO, _VERSAO, TAMANHO_PAGINA, total, *origem, identificacao,
+                                1, pagina_nomes, len(bytes_nomes)) + raizes
+
+    def alinhar(dados: bytes) -> bytes:
+        return dados + bytes(-len(dados) % TAMANHO_PAGINA)
+
+    pasta = os.path.dirname(caminho_saida)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    temporario = caminho_saida + ".tmp"
+    with open(temporario, mode="wb") as f:
+        f.write(alinhar(cabecalho))
+        f.write(alinhar(bytes(registros)))
+        f.write(alinhar(bytes_nomes))
+        for pagina in arvores:
+            f.write(pagina)
+    os.replace(temporario, caminho_saida)
+
+# =====================================================================
+# Leitura (mmap)
+# =====================================================================
+
+class DiskIndex:
+    """
+    Índice aberto via mmap. Nada é lido na abertura além do cabeçalho: cada
+    consulta desce da raiz até a folha (altura páginas) e lê só os registros
+    e nomes dos times devolvidos. 'pages_read' conta as páginas tocadas.
+    """
+    def __init__(self, caminho: str):
+        with open(caminho, mode="rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _CABECALHO.size + len(ARVORES) * _RAIZ.size:
+            self._mm.close()
+            raise ValueError(f"{caminho} não é um índice de times válido")
+        cabecalho = _CABECALHO.unpack_from(self._mm, 0)
+        (magico, versao, self.page_size, self.teams, self.csv_size, self.csv_mtime_ns,
+         self.csv_hash, self.fingerprint, self._pagina_registros, self._pagina_nomes,
+         _) = cabecalho
+        if magico != _MAGICO or versao != _VERSAO:
+            self._mm.close()
+            raise ValueError(f"{caminho} não é um índice de times válido")
+        self.roots: Dict[str, Tuple[int, int]] = {}
+        for k, arvore in enumerate(ARVORES):
+            self.roots[arvore] = _RAIZ.unpack_from(self._mm, _CABECALHO.size + k * _RAIZ.size)
+        self.pages_read = 0
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self) -> "DiskIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        return self.teams
+
+    # =================================================================
+    # Páginas e registros
+    # =================================================================
+
+    def _chave(self, base: int, i: int) -> Tuple[bytes, int]:
+        """(chave, valor) da entrada i da página que começa em 'base'."""
+        pos = base + _DESLOCAMENTO.unpack_from(self._mm, base + _PAGINA.size + i * _DESLOCAMENTO.size)[0]
+        tamanho = _TAMANHO_CHAVE.unpack_from(self._mm, pos)[0]
+        pos += _TAMANHO_CHAVE.size
+        return self._mm[pos:pos + tamanho], _VALOR.unpack_from(self._mm, pos + tamanho)[0]
+
+    def _lower_bound(self, arvore: str, chave: bytes) -> Tuple[int, int]:
+        """
+        Posição (página da folha, índice) da primeira entrada com chave >= 'chave'.
+        Em cada página interna, desce pela última filha cuja primeira chave é
+        menor que 'chave' (com chaves repetidas, a primeira ocorrência pode
+        estar no fim dessa filha).
+        """
+        pagina, altura = self.roots[arvore]
+        for _ in range(altura - 1):
+            base = pagina * self.page_size
+            self.pages_read += 1
+            n = _PAGINA.unpack_from(self._mm, base)[1]
+            lo, hi = 0, n
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._chave(base, mid)[0] < chave:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            pagina = self._chave(base, max(lo - 1, 0))[1]
+
+        base = pagina * self.page_size
+        self.pages_read += 1
+        n = _PAGINA.unpack_from(self._mm, base)[1]
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._chave(base, mid)[0] < chave:
+                lo = mid + 1
+            else:
+                hi = mid
+        return pagina, lo
+
+    def _entradas(self, pagina: int, i: int) -> Iterator[Tuple[bytes, int]]:
+        """Entradas das folhas a partir de (página, índice), seguindo o encadeamento."""
+        while pagina:
+            base = pagina * self.page_size
+            _, n, proxima = _PAGINA.unpack_from(self._mm, base)
+            for k in range(i, n):
+                yield self._chave(base, k)
+            pagina, i = proxima, 0
+            if pagina:
+                self.pages_read += 1
+
+    def _registro(self, numero: int) -> Tuple[str, Dict[str, int]]:
+        pos = self._pagina_registros * self.page_size + numero * _REGISTRO.size
+        self.pages_read += 1
+        *valores, inicio_nome, tamanho_nome = _REGISTRO.unpack_from(self._mm, pos)
+        inicio = self._pagina_nomes * self.page_size + inicio_nome
+        nome = self._mm[inicio:inicio + tamanho_nome].decode("utf-8")
+        return nome, dict(zip(TeamStats.CAMPOS, valores))
+
+    # =================================================================
+    # Consultas
+    # =================================================================
+
+    def team(self, name: str) -> Optional[Dict[str, int]]:
+        """Totais de um time (mesmo formato de TeamStats.row), ou None."""
+        chave = name.encode("utf-8")
+        for encontrada, numero in self._entradas(*self._lower_bound("name", chave)):
+            if encontrada != chave:
+                return None
+            return self._registro(numero)[1]
+        return None
+
+    def score_range(self, low: int, high: int, campo: str = "points") -> List[Tuple[int, str]]:
+        """
+        Times com 'campo' (points ou goals_for) entre low e high (inclusive),
+        em ordem crescente: [(valor, nome), ...]. Custo O(altura + k) páginas.
+        """
+        if campo not in self.roots or campo == "name":
+            raise ValueError(f"campo deve ser um de: {', '.join(ARVORES[1:])}")
+        resultado = []
+        fim = _chave_inteira(high)
+        for chave, numero in self._entradas(*self._lower_bound(campo, _chave_inteira(low))):
+            if chave > fim:
+                break
+            nome, totais = self._registro(numero)
+            resultado.append((totais[campo], nome))
+        return resultado
+
+    def valido_para(self, caminho_csv: str, resolver: Optional["NameResolver"] = None) -> bool:
+        """
+        O índice foi gravado a partir deste CSV (e do mesmo índice de nomes
+        antigos)? Tamanho e mtime iguais bastam; se só o mtime mudou, compara o hash.
+        """
+        identificacao = resolver.fingerprint if resolver is not None else bytes(16)
+        if identificacao != self.fingerprint:
+            return False
+        info = os.stat(caminho_csv)
+        if info.st_size != self.csv_size:
+            return False
+        return info.st_mtime_ns == self.csv_mtime_ns or hash_arquivo(caminho_csv) == self.csv_hash
+
+def _atualizar_mtime(caminho: str, indice: DiskIndex, mtime_ns: int):
+    """Conteúdo igual com mtime novo: grava o mtime no cabeçalho para não recalcular o hash."""
+    novo = list(_CABECALHO.unpack_from(indice._mm, 0))
+    novo[5] = mtime_ns
+    with open(caminho, mode="r+b") as f:
+        f.write(_CABECALHO.pack(*novo))
+    indice.csv_mtime_ns = mtime_ns
+
+def abrir_indice(caminho_csv: str, resolver: Optional["NameResolver"] = None,
+                 caminho: Optional[str] = None) -> DiskIndex:
+    """
+    Abre o índice do CSV; se ele não existir ou estiver desatualizado, carrega
+    as partidas (via cache binário), agrega, grava o índice e o abre.
+    """
+    caminho = caminho or caminho_indice(caminho_csv)
+    try:
+        indice = DiskIndex(caminho)
+    except (OSError, ValueError):
+        indice = None
+    if indice is not None:
+        if indice.valido_para(caminho_csv, resolver):
+            mtime_ns = os.stat(caminho_csv).st_mtime_ns
+            if mtime_ns != indice.csv_mtime_ns:
+                try:
+                    _atualizar_mtime(caminho, indice, mtime_ns)
+                except OSError:
+                    pass  # sem permissão de escrita: o hash é conferido de novo na próxima vez
+            return indice
+        indice.close()
+
+    store, _ = carregar_resultados(caminho_csv, resolver=resolver)
+    gravar_indice(agregar_store(store), caminho, caminho_csv, resolver)
+    return DiskIndex(caminho)
@@ -0,0 +1,220 @@
+# src/elo.py
+# Rating Elo das seleções, calculado em uma única passada cronológica.
+# Modelo no estilo do World Football Elo:
+#   esperado = 1 / (10^(-dr/400) + 1),  dr = R_casa + vantagem - R_fora
+#   novo     = R + K * G * (resultado - esperado)
+# K depende do torneio e G da diferença de gols. A vantagem de jogar em casa
+# só vale quando a partida não é em campo neutro (Match.neutral).
+import pickle
+from array import array
+from bisect import bisect_right
+from datetime import date
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+from .data_structs import Team
+from .match_store import MatchStore
+
+RATING_INICIAL = 1500.0
+VANTAGEM_CASA = 100.0
+
+# Peso K por torneio (os demais usam K_OUTROS)
+K_COPA_DO_MUNDO = 60
+K_CONTINENTAL = 50
+K_ELIMINATORIAS = 40
+K_OUTROS = 30
+K_AMISTOSO = 20
+TORNEIOS_CONTINENTAIS = frozenset([
+    "UEFA Euro", "Copa América", "African Cup of Nations", "AFC Asian Cup",
+    "Gold Cup", "CONCACAF Championship", "Oceania Nations Cup", "Confederations Cup",
+])
+
+_VERSAO_CHECKPOINT = 2
+
+# Colunas que entram no cálculo: a assinatura do checkpoint cobre só estas
+_COLUNAS_ELO = ("dates", "home_ids", "away_ids", "home_scores", "away_scores",
+                "tournament_ids", "neutral")
+
+def peso_torneio(torneio: str) -> int:
+    """Peso K de uma partida pelo nome do torneio."""
+    if torneio == "FIFA World Cup":
+        return K_COPA_DO_MUNDO
+    if torneio in TORNEIOS_CONTINENTAIS:
+        return K_CONTINENTAL
+    if "qualification" in torneio:
+        return K_ELIMINATORIAS
+    if torneio == "Friendly":
+        return K_AMISTOSO
+    return K_OUTROS
+
+def multiplicador_gols(diferenca: int) -> float:
+    """Fator G pela diferença de gols (1; 1,5; (11 + d) / 8)."""
+    diferenca = abs(diferenca)
+    if diferenca <= 1:
+        return 1.0
+    if diferenca == 2:
+        return 1.5
+    return (11 + diferenca) / 8
+
+class EloEngine:
+    """
+    Motor de rating Elo com histórico por time.
+    Para cada time guarda, em arrays compactos, as datas (ordinais) dos seus
+    jogos e o rating depois de cada um. 'processed' funciona como checkpoint:
+    update() só processa as linhas da MatchStore depois dele, então partidas
+    novas no final do arquivo atualizam apenas o fim do histórico. Se as
+    linhas já processadas mudaram (assinatura diferente) ou se alguma linha
+    nova é mais antiga que 'last_date', o cálculo é refeito do zero.
+    """
+    def __init__(self, home_advantage: float = VANTAGEM_CASA,
+                 initial_rating: float = RATING_INICIAL):
+        self.home_advantage = home_advantage
+        self.initial_rating = initial_rating
+        self._reset()
+
+    def _reset(self):
+        """Volta ao estado inicial (sem partidas processadas)."""
+        self.team_names: List[str] = []
+        self.team_ids: Dict[str, int] = {}
+        self.ratings = array("d")              # rating atual de cada time
+        self.history_dates: List[array] = []   # datas dos jogos de cada time
+        self.history_ratings: List[array] = [] # rating depois de cada jogo
+        self.processed = 0                     # linhas da store já processadas
+        self.last_date = 0                     # data da última partida processada
+        self.signature = ""                    # assinatura das linhas processadas
+        self._k_cache: Dict[str, int] = {}
+
+    @classmethod
+    def from_store(cls, store: MatchStore, **kwargs) -> "EloEngine":
+        """Calcula os ratings de todas as partidas da store."""
+        engine = cls(**kwargs)
+        engine.update(store)
+        return engine
+
+    def _team(self, name: str) -> int:
+        team = self.team_ids.get(name)
+        if team is None:
+            team = len(self.team_names)
+            self.team_ids[name] = team
+            self.team_names.append(name)
+            self.ratings.append(self.initial_rating)
+            self.history_dates.append(array("i"))
+            self.history_ratings.append(array("d"))
+        return team
+
+    def _checkpoint_valid(self, store: MatchStore) -> bool:
+        """As linhas já processadas continuam iguais e nenhuma nova é mais antiga que elas?"""
+        start = self.processed
+        if start > len(store) or store.prefix_signature(start, _COLUNAS_ELO) != self.signature:
+            return False
+        return not any(day < self.last_date for day in islice(store.dates, start, None))
+
+    def update(self, store: MatchStore) -> int:
+        """
+        Processa as linhas da store a partir do checkpoint, em ordem de data
+        (ordenação estável; results.csv já vem ordenado). Se o checkpoint não
+        vale para a store (ver _checkpoint_valid), recalcula tudo. Retorna
+        quantas partidas foram processadas.
+        """
+        if self.processed and not self._checkpoint_valid(store):
+            self._reset()
+        start = self.processed
+        total = len(store)
+        if start >= total:
+            return 0
+
+        ids = [self._team(name) for name in store.team_names]
+        dates = store.dates
+        ratings = self.ratings
+        history_dates, history_ratings = self.history_dates, self.history_ratings
+        k_cache = self._k_cache
+        home_advantage = self.home_advantage
+
+        for i in sorted(range(start, total), key=dates.__getitem__):
+            home, away = ids[store.home_ids[i]], ids[store.away_ids[i]]
+            home_score, away_score = store.home_scores[i], store.away_scores[i]
+            tournament = store.strings[store.tournament_ids[i]]
+            k = k_cache.get(tournament)
+            if k is None:
+                k = k_cache[tournament] = peso_torneio(tournament)
+
+            diff = ratings[home] - ratings[away]
+            if not store.neutral[i]:
+                diff += home_advantage
+            expected = 1.0 / (10 ** (-diff / 400) + 1)
+            if home_score > away_score:
+                result = 1.0
+            elif home_score < away_score:
+                result = 0.0
+            else:
+                result = 0.5
+            delta = k * multiplicador_gols(home_score - away_score) * (result - expected)
+
+            ratings[home] += delta
+            ratings[away] -= delta
+            day = dates[i]
+            history_dates[home].append(day)
+            history_ratings[home].append(ratings[home])
+            history_dates[away].append(day)
+            history_ratings[away].append(ratings[away])
+            if day > self.last_date:
+                self.last_date = day
+
+        self.processed = total
+        self.signature = store.prefix_signature(total, _COLUNAS_ELO)
+        return total - start
+
+    # =================================================================
+    # Consultas
+    # =================================================================
+
+    def rating(self, name: str) -> float:
+        """Rating atual do time (inicial se ele nunca jogou)."""
+        team = self.team_ids.get(name)
+        return self.ratings[team] if team is not None else self.initial_rating
+
+    def rating_at(self, name: str, day: date | int) -> float:
+        """Rating do time ao fim do dia 'day' (busca binária no histórico do time)."""
+        team = self.team_ids.get(name)
+        if team is None:
+            return self.initial_rating
+        day = day if isinstance(day, int) else day.toordinal()
+        i = bisect_right(self.history_dates[team], day)
+        return self.history_ratings[team][i - 1] if i else self.initial_rating
+
+    def history(self, name: str) -> List[Tuple[int, float]]:
+        """Histórico (data ordinal, rating) do time."""
+        team = self.team_ids.get(name)
+        if team is None:
+            return []
+        return list(zip(self.history_dates[team], self.history_ratings[team]))
+
+    def team_ratings(self, day: Optional[date | int] = None) -> List[Team]:
+        """
+        Times com o rating (arredondado para inteiro) como score, atual ou na
+        data 'day'. A lista pode ser usada no lugar de calculate_team_scores em
+        generate_top_rankings, merge_sort/radix_sort e AVLPointsTree_A.
+        """
+        if day is None:
+            return [Team(name, round(r)) for name, r in zip(self.team_names, self.ratings)]
+        return [Team(name, round(self.rating_at(name, day))) for name in self.team_names]
+
+    # =================================================================
+    # Checkpoint em disco
+    # =================================================================
+
+    def save(self, caminho: str):
+        """Grava o estado (ratings, histórico, checkpoint e assinatura) em um arquivo."""
+        with open(caminho, mode="wb") as f:
+            pickle.dump((_VERSAO_CHECKPOINT, self.__dict__), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, caminho: str) -> "EloEngine":
+        """Lê um estado gravado por save(); depois basta chamar update() com a store atual."""
+        with open(caminho, mode="rb") as f:
+            versao, estado = pickle.load(f)
+        if versao != _VERSAO_CHECKPOINT:
+            raise ValueError(f"checkpoint Elo com versão desconhecida: {versao}")
+        engine = cls()
+        engine.__dict__.update(estado)
+        return engine
@@ -0,0 +1,225 @@
+# src/export.py
+# Exportação do resumo das partidas (Etapa 6): year,country,home_team,away_team,score
+# - Linhas geradas direto das colunas da MatchStore (sem objetos Match).
+# - Gravação em lotes com writerows.
+# - Modo incremental: só as partidas novas desde a última exportação são
+#   acrescentadas, usando uma marca d'água gravada ao lado do arquivo.
+# - Saídas opcionais: CSV compactado (gzip) e binário colunar.
+import csv
+import gzip
+import json
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .match_store import MatchStore
+
+CABECALHO_RESUMO = ["year", "country", "home_team", "away_team", "score"]
+
+# Linhas por chamada de writerows
+TAMANHO_LOTE = 4096
+
+_MAGICO_BINARIO = b"RESUMO01"
+# mágico, linhas, bytes_times, bytes_paises
+_CABECALHO_BINARIO = struct.Struct("<8sIQQ")
+# Colunas cobertas pela assinatura da marca d'água do modo incremental
+_COLUNAS_ASSINATURA = ("dates", "home_ids", "away_ids", "home_scores", "away_scores",
+                       "country_ids")
+
+# =====================================================================
+# Funções Auxiliares
+# =====================================================================
+
+def caminho_marca(caminho_saida: str) -> str:
+    """A marca d'água fica ao lado do arquivo exportado: resumo.csv -> resumo.csv.watermark"""
+    return caminho_saida + ".watermark"
+
+def linhas_resumo(store: MatchStore, inicio: int = 0) -> Iterator[List[Any]]:
+    """
+    Gera as linhas do resumo a partir da linha 'inicio' da store, no mesmo
+    formato de Match.to_list(). O ano de cada data é calculado uma vez só.
+    """
+    anos: Dict[int, str] = {}
+    team_names, strings = store.team_names, store.strings
+    for i in range(inicio, len(store)):
+        data = store.dates[i]
+        ano = anos.get(data)
+        if ano is None:
+            ano = anos[data] = str(date.fromordinal(data).year)
+        yield [ano, strings[store.country_ids[i]],
+               team_names[store.home_ids[i]], team_names[store.away_ids[i]],
+               f"{store.home_scores[i]}-{store.away_scores[i]}"]
+
+def gravar_em_lotes(writer, linhas: Iterable[List[Any]], tamanho_lote: int = TAMANHO_LOTE) -> int:
+    """Grava as linhas com writerows em lotes de 'tamanho_lote'. Retorna quantas foram gravadas."""
+    linhas = iter(linhas)
+    total = 0
+    while True:
+        lote = list(islice(linhas, tamanho_lote))
+        if not lote:
+            return total
+        writer.writerows(lote)
+        total += len(lote)
+
+def _ler_marca(caminho_saida: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(caminho_marca(caminho_saida), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def assinatura_prefixo(store: MatchStore, linhas: int) -> str:
+    """
+    Hash das 'linhas' primeiras partidas da store, só com o que vai para o
+    resumo: datas, times, placares e país (colunas e os nomes a que os IDs
+    delas apontam). Se alguma dessas partidas for corrigida, removida ou se
+    uma partida for inserida no meio, o hash muda.
+    """
+    return store.prefix_signature(linhas, _COLUNAS_ASSINATURA)
+
+def _gravar_marca(caminho_saida: str, store: MatchStore, compactado: bool):
+    marca = {"linhas": len(store), "ultima_data": store.dates[-1] if len(store) else 0,
+             "assinatura": assinatura_prefixo(store, len(store)),
+             "gzip": compactado, "tamanho_saida": os.path.getsize(caminho_saida)}
+    temporario = caminho_marca(caminho_saida) + ".tmp"
+    with open(temporario, mode="w", encoding="utf-8") as f:
+        json.dump(marca, f)
+    os.replace(temporario, caminho_marca(caminho_saida))
+
+def _marca_vale(marca: Dict[str, Any], store: MatchStore) -> bool:
+    """As linhas da marca continuam iguais na store e as novas não são mais antigas que elas?"""
+    linhas = marca.get("linhas", 0)
+    if not 0 < linhas <= len(store) or store.dates[linhas - 1] != marca.get("ultima_data"):
+        return False
+    if any(data < marca["ultima_data"] for data in islice(store.dates, linhas, None)):
+        return False
+    return assinatura_prefixo(store, linhas) == marca.get("assinatura")
+
+# =====================================================================
+# Exportação CSV
+# =====================================================================
+
+def exportar_csv(store: MatchStore, caminho_saida: str, incremental: bool = False,
+                 compactar: bool = False) -> int:
+    """
+    Grava o resumo das partidas da store. Retorna quantas linhas foram gravadas.
+
+    incremental=True: só as partidas mais novas que a última exportada são
+    acrescentadas ao fim, se a marca d'água ainda vale: mesmo formato,
+    arquivo do tamanho registrado, as linhas já exportadas sem nenhuma
+    mudança (assinatura_prefixo igual) e nenhuma partida nova com data
+    anterior à última exportada. Senão o arquivo é regravado por inteiro.
+    A marca d'água só é gravada neste modo.
+    compactar=True: grava em gzip (o modo incremental acrescenta um novo
+    membro gzip, o que continua sendo um arquivo .gz válido).
+    """
+    pasta_saida = os.path.dirname(caminho_saida)
+    if pasta_saida:
+        os.makedirs(pasta_saida, exist_ok=True)
+
+    inicio = 0
+    if incremental:
+        marca = _ler_marca(caminho_saida)
+        if (marca is not None and marca.get("gzip") == compactar
+                and os.path.exists(caminho_saida)
+                and os.path.getsize(caminho_saida) == marca.get("tamanho_saida")
+                and _marca_vale(marca, store)):
+            inicio = marca["linhas"]
+
+    modo = "a" if inicio else "w"
+    if compactar:
+        arquivo = gzip.open(caminho_saida, mode=modo + "t", newline="", encoding="utf-8")
+    else:
+        arquivo = open(caminho_saida, mode=modo, newline="", encoding="utf-8")
+    with arquivo as f:
+        writer = csv.writer(f)
+        if not inicio:
+            writer.writerow(CABECALHO_RESUMO)
+        gravadas = gravar_em_lotes(writer, linhas_resumo(store, inicio))
+
+    if incremental:
+        _gravar_marca(caminho_saida, store, compactar)
+    return gravadas
+
+# =====================================================================
+# Exportação Binária Colunar
+# =====================================================================
+
+def exportar_binario(store: MatchStore, caminho_saida: str) -> int:
+    """
+    Grava o resumo em formato binário colunar (little-endian):
+      [cabeçalho] _CABECALHO_BINARIO
+      [times]     nomes UTF-8 separados por '\\0'
+      [países]    nomes UTF-8 separados por '\\0'
+      [colunas]   year (int16), country_id, home_id, away_id (int32),
+                  home_score, away_score (int16)
+    Cada coluna é gravada de uma vez (tobytes). Retorna o número de linhas.
+    """
+    paises: List[str] = []
+    ids_paises: Dict[int, int] = {}
+    country_ids = array("i")
+    for string_id in store.country_ids:
+        novo = ids_paises.get(string_id)
+        if novo is None:
+            novo = ids_paises[string_id] = len(paises)
+            paises.append(store.strings[string_id])
+        country_ids.append(novo)
+
+    anos: Dict[int, int] = {}
+    years = array("h")
+    for data in store.dates:
+        ano = anos.get(data)
+        if ano is None:
+            ano = anos[data] = date.fromordinal(data).year
+        years.append(ano)
+
+    times = "\0".join(store.team_names).encode("utf-8")
+    nomes_paises = "\0".join(paises).encode("utf-8")
+    colunas = [years, country_ids, store.home_ids, store.away_ids,
+               array("h", store.home_scores), array("h", store.away_scores)]
+
+    pasta_saida = os.path.dirname(caminho_saida)
+    if pasta_saida:
+        os.makedirs(pasta_saida, exist_ok=True)
+    temporario = caminho_saida + ".tmp"
+    with open(temporario, mode="wb") as f:
+        f.write(_CABECALHO_BINARIO.pack(_MAGICO_BINARIO, len(store), len(times), len(nomes_paises)))
+        f.write(times)
+        f.write(nomes_paises)
+        for coluna in colunas:
+            if sys.byteorder != "little":
+                coluna = array(coluna.typecode, coluna)
+                coluna.byteswap()
+            f.write(coluna.tobytes())
+    os.replace(temporario, caminho_saida)
+    return len(store)
+
+def ler_binario(caminho: str) -> Iterator[List[Any]]:
+    """Lê um arquivo de exportar_binario e gera as linhas no formato do CSV de resumo."""
+    with open(caminho, mode="rb") as f:
+        dados = f.read()
+    magico, linhas, bytes_times, bytes_paises = _CABECALHO_BINARIO.unpack_from(dados, 0)
+    if magico != _MAGICO_BINARIO:
+        raise ValueError(f"{caminho} não é um resumo binário")
+    pos = _CABECALHO_BINARIO.size
+    times = dados[pos:pos + bytes_times].decode("utf-8").split("\0") if bytes_times else []
+    pos += bytes_times
+    paises = dados[pos:pos + bytes_paises].decode("utf-8").split("\0") if bytes_paises else []
+    pos += bytes_paises
+
+    colunas = []
+    for typecode in ("h", "i", "i", "i", "h", "h"):
+        coluna = array(typecode)
+        fim = pos + linhas * coluna.itemsize
+        coluna.frombytes(dados[pos:fim])
+        if sys.byteorder != "little":
+            coluna.byteswap()
+        colunas.append(coluna)
+        pos = fim
+
+    for ano, pais, casa, fora, gols_casa, gols_fora in zip(*colunas):
+        yield [str(ano), paises[pais], times[casa], times[fora], f"{gols_casa}-{gols_fora}"]
@@ -0,0 +1,81 @@
+# src/former_names.py
+# Resolução de nomes históricos de seleções (data/former_names.csv).
+# Ex.: "Dahomey" entre 1959-11-08 e 1975-11-30 é a seleção hoje chamada "Benin".
+import hashlib
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, List, Tuple
+
+from .ingest import data_iso_para_ordinal, ler_csv_posicional
+
+CAMINHO_NOMES_ANTIGOS = "data/former_names.csv"
+
+class NameResolver:
+    """
+    Índice de intervalos por nome antigo.
+    Para cada nome antigo guarda os intervalos [início, fim] (datas como
+    ordinais) ordenados pelo início, e o nome atual de cada intervalo.
+    A consulta usa busca binária: O(log k), com k = intervalos do nome.
+    Resultados por (nome, ano) ficam em cache, exceto nos anos em que um
+    intervalo começa ou termina (ali o dia importa).
+    """
+    def __init__(self, intervals: List[Tuple[str, str, int, int]] = ()):
+        # nome antigo -> (inícios, fins, nomes atuais), ordenados pelo início
+        self.starts: Dict[str, List[int]] = {}
+        self.ends: Dict[str, List[int]] = {}
+        self.currents: Dict[str, List[str]] = {}
+        # (nome, ano) em que algum intervalo do nome começa ou termina
+        self._boundary_years = set()
+        self._cache: Dict[Tuple[str, int], str] = {}
+
+        for current, former, start, end in sorted(intervals, key=lambda r: (r[1], r[2])):
+            self.starts.setdefault(former, []).append(start)
+            self.ends.setdefault(former, []).append(end)
+            self.currents.setdefault(former, []).append(current)
+            self._boundary_years.add((former, date.fromordinal(start).year))
+            self._boundary_years.add((former, date.fromordinal(end).year))
+
+        h = hashlib.blake2b(digest_size=16)
+        for current, former, start, end in sorted(intervals):
+            h.update(f"{current}\0{former}\0{start}\0{end}\n".encode("utf-8"))
+        # Identifica o conteúdo do índice (usado para validar o cache binário)
+        self.fingerprint = h.digest()
+
+    @classmethod
+    def from_csv(cls, caminho_csv: str = CAMINHO_NOMES_ANTIGOS) -> "NameResolver":
+        """Monta o índice a partir de former_names.csv (current,former,start_date,end_date)."""
+        intervals = []
+        for current, former, start, end in ler_csv_posicional(
+                caminho_csv, ["current", "former", "start_date", "end_date"]):
+            intervals.append((current.strip(), former.strip(),
+                              data_iso_para_ordinal(start.strip()),
+                              data_iso_para_ordinal(end.strip())))
+        return cls(intervals)
+
+    def __len__(self) -> int:
+        """Quantidade de intervalos no índice."""
+        return sum(len(starts) for starts in self.starts.values())
+
+    def resolve(self, name: str, date_ord: int) -> str:
+        """
+        Retorna o nome canônico (atual) do time 'name' na data 'date_ord'.
+        Nomes sem histórico são devolvidos sem alteração.
+        """
+        starts = self.starts.get(name)
+        if starts is None:
+            return name
+
+        year = date.fromordinal(date_ord).year
+        key = (name, year)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        i = bisect_right(starts, date_ord) - 1
+        if i >= 0 and date_ord <= self.ends[name][i]:
+            result = self.currents[name][i]
+        else:
+            result = name
+        if key not in self._boundary_years:
+            self._cache[key] = result
+        return result
@@ -0,0 +1,177 @@
+# src/goalscorers.py
+# Leitura de data/goalscorers.csv, junção dos gols com as partidas de
+# results.csv e índice de artilheiros.
+from datetime import date
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .data_structs import Goal
+from .match_store import MatchStore
+from .ingest import VALORES_FALTANTES, data_iso_para_ordinal, ler_csv_posicional
+
+if TYPE_CHECKING:
+    from .former_names import NameResolver
+
+CAMINHO_GOLS = "data/goalscorers.csv"
+
+# Colunas usadas de goalscorers.csv
+COLUNAS_GOLS = ["date", "home_team", "away_team", "team", "scorer", "minute",
+                "own_goal", "penalty"]
+
+# =====================================================================
+# Leitura e Junção
+# =====================================================================
+
+def indice_partidas(store: MatchStore) -> Dict[Tuple[int, int, int], int]:
+    """
+    Índice hash (data, ID mandante, ID visitante) -> linha da partida.
+    Se houver partidas repetidas com a mesma chave, vale a primeira.
+    """
+    indice: Dict[Tuple[int, int, int], int] = {}
+    for i, chave in enumerate(zip(store.dates, store.home_ids, store.away_ids)):
+        indice.setdefault(chave, i)
+    return indice
+
+def ler_gols_csv(caminho_csv: str, store: MatchStore,
+                 resolver: Optional["NameResolver"] = None) -> Tuple[List[Goal], int]:
+    """
+    Lê goalscorers.csv e liga cada gol à sua partida na 'store' por meio do
+    índice hash (data, mandante, visitante): uma consulta O(1) por gol.
+    Gols sem partida correspondente ficam com match_index = -1.
+    Linhas sem data, times ou time que marcou são filtradas.
+    Retorna (gols, linhas_filtradas).
+    """
+    indice = indice_partidas(store)
+    team_ids = store.team_ids
+    faltantes = VALORES_FALTANTES
+    cache_datas: Dict[str, int] = {}
+
+    gols: List[Goal] = []
+    filtradas = 0
+    for texto_data, home, away, team, scorer, minute, own_goal, penalty in \
+            ler_csv_posicional(caminho_csv, COLUNAS_GOLS):
+        home, away, team = home.strip(), away.strip(), team.strip()
+        if (home.lower() in faltantes or away.lower() in faltantes or
+                team.lower() in faltantes or texto_data.strip().lower() in faltantes):
+            filtradas += 1
+            continue
+        try:
+            data_ord = cache_datas.get(texto_data)
+            if data_ord is None:
+                data_ord = data_iso_para_ordinal(texto_data)
+                cache_datas[texto_data] = data_ord
+        except ValueError:
+            filtradas += 1
+            continue
+
+        if resolver is not None:
+            home = resolver.resolve(home, data_ord)
+            away = resolver.resolve(away, data_ord)
+            team = resolver.resolve(team, data_ord)
+
+        home_id, away_id = team_ids.get(home), team_ids.get(away)
+        match_index = -1
+        if home_id is not None and away_id is not None:
+            match_index = indice.get((data_ord, home_id, away_id), -1)
+
+        scorer = scorer.strip()
+        minute = minute.strip()
+        gols.append(Goal(match_index, data_ord, team,
+                         None if scorer.lower() in faltantes else scorer,
+                         int(minute) if minute.isdigit() else None,
+                         own_goal.strip().lower() == "true",
+                         penalty.strip().lower() == "true"))
+    return gols, filtradas
+
+def anexar_gols(store: MatchStore, gols: List[Goal]) -> int:
+    """
+    Anexa os gols às linhas da 'store' (store[i].goals passa a ter os gols da
+    partida i). Retorna quantos gols foram ligados a alguma partida.
+    """
+    store.goals = {}
+    ligados = 0
+    for gol in gols:
+        if gol.match_index >= 0:
+            store.goals.setdefault(gol.match_index, []).append(gol)
+            ligados += 1
+    return ligados
+
+# =====================================================================
+# Índice de Artilheiros
+# =====================================================================
+
+class ScorerIndex:
+    """
+    Índice de artilheiros com agregados pré-calculados.
+    Na construção, os gols são contados uma única vez por jogador (geral, por
+    time, por torneio e por década) e cada ranking é ordenado. Depois, cada
+    consulta é só uma busca em dicionário e um recorte da lista.
+    Gols contra e gols sem autor conhecido não contam para os artilheiros.
+    """
+    def __init__(self):
+        self.overall: List[Tuple[str, int]] = []
+        self.by_team: Dict[str, List[Tuple[str, int]]] = {}
+        self.by_tournament: Dict[str, List[Tuple[str, int]]] = {}
+        self.by_decade: Dict[int, List[Tuple[str, int]]] = {}
+        self.player_goals: Dict[str, int] = {}
+
+    @classmethod
+    def from_goals(cls, gols: List[Goal], store: MatchStore) -> "ScorerIndex":
+        """Monta o índice a partir dos gols (já ligados às partidas da 'store')."""
+        index = cls()
+        geral: Dict[str, int] = {}
+        por_time: Dict[str, Dict[str, int]] = {}
+        por_torneio: Dict[str, Dict[str, int]] = {}
+        por_decada: Dict[int, Dict[str, int]] = {}
+        anos: Dict[int, int] = {}
+
+        for gol in gols:
+            scorer = gol.scorer
+            if scorer is None or gol.own_goal:
+                continue
+            geral[scorer] = geral.get(scorer, 0) + 1
+
+            contagem = por_time.setdefault(gol.team, {})
+            contagem[scorer] = contagem.get(scorer, 0) + 1
+
+            if gol.match_index >= 0:
+                torneio = store.strings[store.tournament_ids[gol.match_index]]
+                contagem = por_torneio.setdefault(torneio, {})
+                contagem[scorer] = contagem.get(scorer, 0) + 1
+
+            ano = anos.get(gol.date_ord)
+            if ano is None:
+                ano = anos[gol.date_ord] = date.fromordinal(gol.date_ord).year
+            contagem = por_decada.setdefault(ano // 10 * 10, {})
+            contagem[scorer] = contagem.get(scorer, 0) + 1
+
+        index.player_goals = geral
+        index.overall = cls._ranking(geral)
+        index.by_team = {time: cls._ranking(c) for time, c in por_time.items()}
+        index.by_tournament = {torneio: cls._ranking(c) for torneio, c in por_torneio.items()}
+        index.by_decade = {decada: cls._ranking(c) for decada, c in por_decada.items()}
+        return index
+
+    @staticmethod
+    def _ranking(contagem: Dict[str, int]) -> List[Tuple[str, int]]:
+        """Ordena (jogador, gols) por gols decrescentes; empates em ordem alfabética."""
+        return sorted(contagem.items(), key=lambda item: (-item[1], item[0]))
+
+    def top_scorers(self, k: int = 10) -> List[Tuple[str, int]]:
+        """Os k maiores artilheiros de todos os jogos."""
+        return self.overall[:k]
+
+    def top_scorers_team(self, team: str, k: int = 10) -> List[Tuple[str, int]]:
+        """Os k maiores artilheiros de uma seleção."""
+        return self.by_team.get(team, [])[:k]
+
+    def top_scorers_tournament(self, tournament: str, k: int = 10) -> List[Tuple[str, int]]:
+        """Os k maiores artilheiros de um torneio (ex.: "FIFA World Cup")."""
+        return self.by_tournament.get(tournament, [])[:k]
+
+    def top_scorers_decade(self, decade: int, k: int = 10) -> List[Tuple[str, int]]:
+        """Os k maiores artilheiros de uma década (ex.: 1990 ou 1994 -> 1990-1999)."""
+        return self.by_decade.get(decade // 10 * 10, [])[:k]
+
+    def goals_of(self, scorer: str) -> int:
+        """Total de gols de um jogador (0 se desconhecido)."""
+        return self.player_goals.get(scorer, 0)
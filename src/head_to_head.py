@@ -0,0 +1,202 @@
+# src/head_to_head.py
+# Índice de confrontos diretos (head-to-head) entre pares de seleções.
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from .match_store import MatchStore
+
+class HeadToHead:
+    """
+    Resultado de um confronto direto, do ponto de vista do time 'team'
+    contra 'opponent': jogos, vitórias, empates, derrotas e gols.
+    """
+    __slots__ = ("team", "opponent", "played", "wins", "draws", "losses",
+                 "goals_for", "goals_against")
+
+    def __init__(self, team: str, opponent: str, played: int = 0, wins: int = 0,
+                 draws: int = 0, losses: int = 0, goals_for: int = 0, goals_against: int = 0):
+        self.team = team
+        self.opponent = opponent
+        self.played = played
+        self.wins = wins
+        self.draws = draws
+        self.losses = losses
+        self.goals_for = goals_for
+        self.goals_against = goals_against
+
+    def __repr__(self):
+        """Representação para debug."""
+        return (f"HeadToHead('{self.team}' x '{self.opponent}': {self.played} jogos, "
+                f"V {self.wins} / E {self.draws} / D {self.losses}, "
+                f"gols {self.goals_for}-{self.goals_against})")
+
+class _Pair:
+    """
+    Dados de um par (time menor ID, time maior ID), em ordem de data:
+    linhas das partidas na store, datas, resultado de cada jogo do ponto de
+    vista do primeiro time ('W', 'D', 'L') e somas acumuladas (prefixos) de
+    vitórias, empates e gols de cada lado.
+    """
+    __slots__ = ("rows", "dates", "form", "cum_wins", "cum_draws", "cum_losses",
+                 "cum_goals_for", "cum_goals_against")
+
+    def __init__(self):
+        self.rows = array("i")
+        self.dates = array("i")
+        self.form = bytearray()
+        self.cum_wins = array("i", [0])
+        self.cum_draws = array("i", [0])
+        self.cum_losses = array("i", [0])
+        self.cum_goals_for = array("i", [0])
+        self.cum_goals_against = array("i", [0])
+
+    def append(self, row: int, day: int, goals_for: int, goals_against: int):
+        """Acrescenta um jogo (mais recente que os anteriores do par)."""
+        self.rows.append(row)
+        self.dates.append(day)
+        win, draw, loss = goals_for > goals_against, goals_for == goals_against, goals_for < goals_against
+        self.form.append(ord("W") if win else ord("D") if draw else ord("L"))
+        self.cum_wins.append(self.cum_wins[-1] + win)
+        self.cum_draws.append(self.cum_draws[-1] + draw)
+        self.cum_losses.append(self.cum_losses[-1] + loss)
+        self.cum_goals_for.append(self.cum_goals_for[-1] + goals_for)
+        self.cum_goals_against.append(self.cum_goals_against[-1] + goals_against)
+
+class HeadToHeadIndex:
+    """
+    Índice de confrontos diretos por par NÃO ordenado de times.
+    Construído em uma passada pelas colunas da MatchStore. Os totais de um
+    par são lidos dos prefixos em O(1); resultados entre duas datas usam
+    duas buscas binárias nas datas do par (O(log m)).
+    """
+    def __init__(self):
+        self.team_names: List[str] = []
+        self.team_ids: Dict[str, int] = {}
+        self.pairs: Dict[Tuple[int, int], _Pair] = {}
+        self.processed = 0  # linhas da store já indexadas
+
+    @classmethod
+    def from_store(cls, store: MatchStore) -> "HeadToHeadIndex":
+        """Monta o índice com todas as partidas da store."""
+        index = cls()
+        index.update(store)
+        return index
+
+    def _team(self, name: str) -> int:
+        team = self.team_ids.get(name)
+        if team is None:
+            team = len(self.team_names)
+            self.team_ids[name] = team
+            self.team_names.append(name)
+        return team
+
+    def update(self, store: MatchStore) -> int:
+        """
+        Indexa as linhas da store depois das já processadas (partidas novas
+        no fim do arquivo). Retorna quantas partidas foram indexadas.
+        """
+        start, total = self.processed, len(store)
+        ids = [self._team(name) for name in store.team_names]
+        dates = store.dates
+        pairs = self.pairs
+        rebuild = set()
+
+        for i in sorted(range(start, total), key=dates.__getitem__):
+            home, away = ids[store.home_ids[i]], ids[store.away_ids[i]]
+            home_score, away_score = store.home_scores[i], store.away_scores[i]
+            if home < away:
+                key, goals_for, goals_against = (home, away), home_score, away_score
+            else:
+                key, goals_for, goals_against = (away, home), away_score, home_score
+            pair = pairs.get(key)
+            if pair is None:
+                pair = pairs[key] = _Pair()
+            elif dates[i] < pair.dates[-1]:
+                rebuild.add(key)  # partida fora de ordem: o par é refeito abaixo
+            pair.append(i, dates[i], goals_for, goals_against)
+
+        for key in rebuild:
+            old = pairs[key]
+            pair = pairs[key] = _Pair()
+            for k in sorted(range(len(old.rows)), key=old.dates.__getitem__):
+                row = old.rows[k]
+                home_score, away_score = store.home_scores[row], store.away_scores[row]
+                if ids[store.home_ids[row]] == key[0]:
+                    pair.append(row, old.dates[k], home_score, away_score)
+                else:
+                    pair.append(row, old.dates[k], away_score, home_score)
+
+        self.processed = total
+        return total - start
+
+    # =================================================================
+    # Consultas
+    # =================================================================
+
+    def _lookup(self, team: str, opponent: str) -> Tuple[Optional[_Pair], bool]:
+        """Par dos dois times e se 'team' é o primeiro do par."""
+        a, b = self.team_ids.get(team), self.team_ids.get(opponent)
+        if a is None or b is None or a == b:
+            return None, True
+        return self.pairs.get((a, b) if a < b else (b, a)), a < b
+
+    def _window(self, pair: _Pair, start: Optional[date | int],
+                end: Optional[date | int]) -> Tuple[int, int]:
+        """Posições [lo, hi) dos jogos do par entre start e end (inclusive)."""
+        lo = 0 if start is None else bisect_left(pair.dates, _ordinal(start))
+        hi = len(pair.dates) if end is None else bisect_right(pair.dates, _ordinal(end))
+        return lo, max(lo, hi)
+
+    def record(self, team: str, opponent: str, start: Optional[date | int] = None,
+               end: Optional[date | int] = None) -> HeadToHead:
+        """
+        Confronto de 'team' contra 'opponent', em todo o histórico (O(1)) ou
+        entre as datas start e end (O(log m)).
+        """
+        pair, first = self._lookup(team, opponent)
+        result = HeadToHead(team, opponent)
+        if pair is None:
+            return result
+        lo, hi = self._window(pair, start, end) if start is not None or end is not None \
+            else (0, len(pair.dates))
+        wins = pair.cum_wins[hi] - pair.cum_wins[lo]
+        losses = pair.cum_losses[hi] - pair.cum_losses[lo]
+        goals_for = pair.cum_goals_for[hi] - pair.cum_goals_for[lo]
+        goals_against = pair.cum_goals_against[hi] - pair.cum_goals_against[lo]
+        if not first:
+            wins, losses = losses, wins
+            goals_for, goals_against = goals_against, goals_for
+        result.played = hi - lo
+        result.wins, result.losses = wins, losses
+        result.draws = pair.cum_draws[hi] - pair.cum_draws[lo]
+        result.goals_for, result.goals_against = goals_for, goals_against
+        return result
+
+    def matches(self, team: str, opponent: str, start: Optional[date | int] = None,
+                end: Optional[date | int] = None) -> List[int]:
+        """Linhas (na MatchStore) dos jogos entre os dois times, em ordem de data."""
+        pair, _ = self._lookup(team, opponent)
+        if pair is None:
+            return []
+        lo, hi = self._window(pair, start, end)
+        return pair.rows[lo:hi].tolist()
+
+    def last_n(self, team: str, opponent: str, n: int = 5, start: Optional[date | int] = None,
+               end: Optional[date | int] = None) -> str:
+        """
+        Forma nos últimos n confrontos (entre start e end, se informados), do
+        mais antigo ao mais recente (ex.: "WDLWW").
+        """
+        pair, first = self._lookup(team, opponent)
+        if pair is None or n <= 0:
+            return ""
+        lo, hi = self._window(pair, start, end)
+        form = pair.form[max(lo, hi - n):hi].decode("ascii")
+        return form if first else form.translate(_INVERTE_FORMA)
+
+_INVERTE_FORMA = str.maketrans("WL", "LW")
+
+def _ordinal(day: date | int) -> int:
+    return day if isinstance(day, int) else day.toordinal()
@@ -0,0 +1,226 @@
+# src/ingest.py
+# Motor de leitura rápida dos arquivos CSV em data/.
+# - Colunas lidas por posição (sem um dicionário por linha).
+# - Datas "YYYY-MM-DD" convertidas sem strptime (com cache por string).
+# - Leitura opcional em paralelo, dividindo o arquivo em intervalos de bytes.
+import csv
+import os
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .match_store import MatchStore
+
+if TYPE_CHECKING:
+    from .former_names import NameResolver
+
+# Mesmos valores considerados "faltantes" por main.faltando()
+VALORES_FALTANTES = frozenset(["", "na", "n/a", "null", "none", "-"])
+
+# Colunas usadas de results.csv, na ordem em que são passadas ao MatchStore
+COLUNAS_RESULTADOS = ["date", "home_team", "away_team", "home_score", "away_score",
+                      "tournament", "city", "country", "neutral"]
+
+# =====================================================================
+# Funções Auxiliares
+# =====================================================================
+
+def data_iso_para_ordinal(texto: str) -> int:
+    """
+    Converte uma data "YYYY-MM-DD" para ordinal (date.toordinal()).
+    Usa fatias fixas da string; formatos diferentes caem no strptime,
+    que aceita as mesmas entradas do carregador original.
+    """
+    if (len(texto) == 10 and texto[4] == "-" and texto[7] == "-"
+            and texto[:4].isdigit() and texto[5:7].isdigit() and texto[8:].isdigit()):
+        return date(int(texto[:4]), int(texto[5:7]), int(texto[8:])).toordinal()
+    return datetime.strptime(texto, "%Y-%m-%d").toordinal()
+
+def dividir_linha(linha: str) -> List[str]:
+    """Separa uma linha CSV em campos. Só usa o módulo csv se houver aspas."""
+    if '"' in linha:
+        return next(csv.reader((linha,)))
+    return linha.split(",")
+
+def indices_colunas(cabecalho: str, colunas: Sequence[str]) -> List[int]:
+    """Retorna a posição de cada coluna pedida no cabeçalho do CSV."""
+    nomes = [nome.strip() for nome in dividir_linha(cabecalho.rstrip("\r\n"))]
+    return [nomes.index(coluna) for coluna in colunas]
+
+def ler_csv_posicional(caminho_csv: str, colunas: Sequence[str]) -> Iterator[List[str]]:
+    """
+    Lê qualquer CSV de data/ e gera, para cada linha, a lista dos campos
+    pedidos em 'colunas' (na mesma ordem). Linhas curtas demais são ignoradas.
+    """
+    with open(caminho_csv, mode="r", encoding="utf-8", newline="") as f:
+        indices = indices_colunas(f.readline(), colunas)
+        minimo = max(indices) + 1
+        for linha in f:
+            linha = linha.rstrip("\r\n")
+            if not linha:
+                continue
+            campos = dividir_linha(linha)
+            if len(campos) < minimo:
+                continue
+            yield [campos[i] for i in indices]
+
+# =====================================================================
+# Leitura de results.csv
+# =====================================================================
+
+def _ler_intervalo(caminho_csv: str, inicio: int, fim: int, indices: List[int],
+                   resolver: Optional["NameResolver"] = None) -> Tuple[MatchStore, int]:
+    """
+    Lê as linhas que COMEÇAM no intervalo de bytes [inicio, fim) e retorna
+    uma MatchStore parcial e o número de linhas filtradas.
+    """
+    with open(caminho_csv, mode="rb") as f:
+        # Alinha no início de uma linha (a linha que cruza 'inicio' é do bloco anterior)
+        if inicio > 0:
+            f.seek(inicio - 1)
+            if f.read(1) != b"\n":
+                f.readline()
+        pos = f.tell()
+        bloco = b""
+        if pos < fim:
+            bloco = f.read(fim - pos)
+            if not bloco.endswith(b"\n"):
+                bloco += f.readline()
+
+    store = MatchStore()
+    filtradas = _preencher_store(store, bloco.decode("utf-8").split("\n"), indices, resolver)
+    return store, filtradas
+
+def _preencher_store(store: MatchStore, linhas: List[str], indices: List[int],
+                     resolver: Optional["NameResolver"] = None) -> int:
+    """
+    Laço principal da leitura: valida cada linha e grava os campos direto nas
+    colunas da MatchStore. Retorna o número de linhas filtradas.
+    Com 'resolver', nomes antigos de times são trocados pelo nome atual
+    (pela data da partida) já nesta leitura.
+    """
+    i_date, i_home, i_away, i_hs, i_as, i_tour, i_city, i_country, i_neutral = indices
+    minimo = max(indices) + 1
+    faltantes = VALORES_FALTANTES
+    cache_datas: Dict[str, int] = {}
+
+    # Referências locais (evita buscas de atributo no laço)
+    team_ids = store.team_ids
+    team_id = store.team_id
+    string_ids = store.string_ids
+    string_id = store.string_id
+    dates = store.dates.append
+    home_ids = store.home_ids.append
+    away_ids = store.away_ids.append
+    home_scores = store.home_scores.append
+    away_scores = store.away_scores.append
+    tournament_ids = store.tournament_ids.append
+    city_ids = store.city_ids.append
+    country_ids = store.country_ids.append
+    neutral = store.neutral.append
+    renomeados = resolver.starts if resolver is not None else {}
+
+    filtradas = 0
+    for linha in linhas:
+        if linha.endswith("\r"):
+            linha = linha[:-1]
+        if not linha:
+            continue  # linhas em branco são ignoradas, como no csv.DictReader
+        try:
+            campos = linha.split(",") if '"' not in linha else next(csv.reader((linha,)))
+            if len(campos) < minimo:
+                filtradas += 1
+                continue
+
+            home = campos[i_home].strip()
+            away = campos[i_away].strip()
+            texto_data = campos[i_date]
+            if (home.lower() in faltantes or away.lower() in faltantes or
+                    campos[i_hs].strip().lower() in faltantes or
+                    campos[i_as].strip().lower() in faltantes or
+                    texto_data.strip().lower() in faltantes):
+                filtradas += 1
+                continue
+
+            data_ord = cache_datas.get(texto_data)
+            if data_ord is None:
+                data_ord = data_iso_para_ordinal(texto_data)
+                cache_datas[texto_data] = data_ord
+            home_score = int(campos[i_hs])
+            away_score = int(campos[i_as])
+        except (ValueError, TypeError, csv.Error):
+            filtradas += 1
+            continue
+
+        if home in renomeados:
+            home = resolver.resolve(home, data_ord)
+        if away in renomeados:
+            away = resolver.resolve(away, data_ord)
+
+        tournament = campos[i_tour].strip()
+        city = campos[i_city].strip()
+        country = campos[i_country].strip()
+
+        dates(data_ord)
+        home_ids(team_ids[home] if home in team_ids else team_id(home))
+        away_ids(team_ids[away] if away in team_ids else team_id(away))
+        home_scores(home_score)
+        away_scores(away_score)
+        tournament_ids(string_ids[tournament] if tournament in string_ids else string_id(tournament))
+        city_ids(string_ids[city] if city in string_ids else string_id(city))
+        country_ids(string_ids[country] if country in string_ids else string_id(country))
+        neutral(1 if campos[i_neutral].lower() == "true" else 0)
+
+    return filtradas
+
+def ler_resultados_csv(caminho_csv: str, processos: int = 1,
+                       resolver: Optional["NameResolver"] = None) -> Tuple[MatchStore, int]:
+    """
+    Lê results.csv para uma MatchStore e retorna (store, linhas_filtradas).
+    Com processos > 1, o arquivo é dividido em intervalos de bytes lidos em
+    paralelo; as partes são unidas na ordem original do arquivo.
+    Com 'resolver', os times ficam com o nome canônico (ver former_names.py).
+    (Supõe que nenhum campo entre aspas contém quebra de linha.)
+    """
+    with open(caminho_csv, mode="rb") as f:
+        cabecalho = f.readline()
+        inicio = f.tell()
+        tamanho = os.fstat(f.fileno()).st_size
+    indices = indices_colunas(cabecalho.decode("utf-8"), COLUNAS_RESULTADOS)
+
+    if processos <= 1 or tamanho - inicio < 1 << 20:
+        return _ler_intervalo(caminho_csv, inicio, tamanho, indices, resolver)
+
+    from concurrent.futures import ProcessPoolExecutor  # só no modo paralelo
+
+    passo = (tamanho - inicio) // processos + 1
+    limites = [min(inicio + k * passo, tamanho) for k in range(processos + 1)]
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        partes = list(executor.map(_ler_intervalo, [caminho_csv] * processos,
+                                   limites[:-1], limites[1:], [indices] * processos,
+                                   [resolver] * processos))
+
+    store, linhas_filtradas = partes[0]
+    for parte, filtradas in partes[1:]:
+        store.extend(parte)
+        linhas_filtradas += filtradas
+    return store, linhas_filtradas
+
+def ler_novas_linhas(caminho_csv: str, inicio: int,
+                     resolver: Optional["NameResolver"] = None) -> Tuple[MatchStore, int, int]:
+    """
+    Lê as linhas completas de results.csv a partir do byte 'inicio' (usado para
+    acompanhar um arquivo que cresce). Uma última linha sem '\n' ainda está
+    sendo escrita e fica para a próxima leitura.
+    Retorna (store, linhas_filtradas, posição onde a próxima leitura deve começar).
+    """
+    with open(caminho_csv, mode="rb") as f:
+        cabecalho = f.readline()
+        inicio = max(inicio, f.tell())
+        f.seek(inicio)
+        dados = f.read()
+    indices = indices_colunas(cabecalho.decode("utf-8"), COLUNAS_RESULTADOS)
+
+    completas = dados[:dados.rfind(b"\n") + 1]
+    store = MatchStore()
+    filtradas = _preencher_store(store, completas.decode("utf-8").split("\n"), indices, resolver)
+    return store, filtradas, inicio + len(completas)
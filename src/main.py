@@ -1,14 +1,21 @@
 # src/main.py
 import csv
+import os
 from datetime import datetime
-from typing import List, Dict, Tuple
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 # Importações atualizadas
 from .data_structs import Match, Team
+from .match_store import MatchStore
+from .cache import carregar_resultados
+from .former_names import NameResolver
+from .aggregate import agregar_store
+from .export import CABECALHO_RESUMO, exportar_csv, gravar_em_lotes
+from .profiling import Profiler, perfil_ou_desligado
+from .shootouts import carregar_disputas
 from .bst_library import BST_A
 from .avl import AVLPointsTree_A
 from .sorting import (
-    calculate_team_scores, 
-    calculate_total_goals, 
     merge_sort, 
     generate_top_rankings
 )
@@ -25,6 +32,12 @@ def faltando(valor: str) -> bool:
     valor_strip = str(valor).strip()
     return valor_strip == "" or valor_strip.lower() in ["na", "n/a", "null", "none", "-"]
 
+def linha_incompleta(row: Dict[str, str]) -> bool:
+    """Checa se falta algum dos campos essenciais da linha."""
+    return (faltando(row["home_team"]) or faltando(row["away_team"]) or
+            faltando(row["home_score"]) or faltando(row["away_score"]) or
+            faltando(row["date"]))
+
 def carregar_partidas_csv(caminho_csv: str) -> Tuple[List[Match], int]:
     """Lê o CSV, cria objetos Match e filtra dados faltantes."""
     matches: List[Match] = []
@@ -36,9 +49,7 @@ def carregar_partidas_csv(caminho_csv: str) -> Tuple[List[Match], int]:
         for row in leitor:
             try:
                 # Filtrar campos essenciais
-                if (faltando(row["home_team"]) or faltando(row["away_team"]) or 
-                    faltando(row["home_score"]) or faltando(row["away_score"]) or
-                    faltando(row["date"])):
+                if linha_incompleta(row):
                     linhas_filtradas += 1
                     continue
                 
@@ -67,14 +78,36 @@ def carregar_partidas_csv(caminho_csv: str) -> Tuple[List[Match], int]:
 
     return matches, linhas_filtradas
 
+def carregar_partidas_store(caminho_csv: str, processos: int = 1, usar_cache: bool = True,
+                            caminho_nomes_antigos: Optional[str] = None,
+                            caminho_disputas: Optional[str] = None) -> Tuple[MatchStore, int]:
+    """
+    Lê o CSV direto para a tabela colunar (MatchStore), sem criar objetos Match.
+    Usa o motor de leitura de src/ingest.py (mesmo filtro de carregar_partidas_csv)
+    e, se 'usar_cache', o cache binário de src/cache.py gravado ao lado do CSV.
+    Com 'caminho_nomes_antigos' (former_names.csv), nomes históricos são
+    trocados pelo nome atual da seleção durante a leitura.
+    Com 'caminho_disputas' (shootouts.csv), o vencedor de cada disputa de
+    pênaltis é anexado à sua partida (src/shootouts.py).
+    """
+    resolver = NameResolver.from_csv(caminho_nomes_antigos) if caminho_nomes_antigos else None
+    store, linhas_filtradas = carregar_resultados(caminho_csv, usar_cache, processos, resolver)
+    if caminho_disputas:
+        carregar_disputas(store, caminho_disputas, resolver)
+    return store, linhas_filtradas
+
 # =====================================================================
 # Criação das BSTs (Etapa 3)
 # =====================================================================
 
-def criar_bsts(lista_times_pontos: List[Team], lista_times_gols: List[Team]) -> Tuple[BST_A, BST_A]:
-    """Cria e popula as duas BSTs (por nome e por gols totais)."""
-    bst_nome = BST_A()
-    bst_gols = BST_A()
+def criar_bsts(lista_times_pontos: List[Team], lista_times_gols: List[Team],
+               balanceada: bool = False) -> Tuple[BST_A, BST_A]:
+    """
+    Cria e popula as duas BSTs (por nome e por gols totais).
+    Com 'balanceada', as BSTs usam o modo auto-balanceado de BST_A.
+    """
+    bst_nome = BST_A(balanced=balanceada)
+    bst_gols = BST_A(balanced=balanceada)
     
     # 1. BST por Nome (Chave = Nome | Valor = Team/Pontos)
     for time in lista_times_pontos:
@@ -91,7 +124,14 @@ def criar_bsts(lista_times_pontos: List[Team], lista_times_gols: List[Team]) ->
 # =====================================================================
 
 def criar_avl_por_pontos(lista_times: List[Team]) -> AVLPointsTree_A:
-    """Cria e popula a AVL com os times ordenados por pontos."""
+    """
+    Cria e popula a AVL com os times ordenados por pontos.
+    Se a lista já vier ordenada (Merge Sort da Etapa 4), a árvore é montada
+    direto em O(n); senão, os times são inseridos um a um.
+    """
+    if all(lista_times[i - 1].score <= lista_times[i].score for i in range(1, len(lista_times))):
+        return AVLPointsTree_A.from_sorted(lista_times)
+
     avl = AVLPointsTree_A()
     
     for time in lista_times:
@@ -103,51 +143,130 @@ def criar_avl_por_pontos(lista_times: List[Team]) -> AVLPointsTree_A:
 # Geração do CSV (Etapa 6)
 # =====================================================================
 
-def gerar_csv_resumo(matches: List[Match], caminho_saida: str):
-    """Grava o resumo das partidas no formato exigido."""
+def gerar_csv_resumo(matches: Iterable[Match], caminho_saida: str,
+                     incremental: bool = False, compactar: bool = False):
+    """
+    Grava o resumo das partidas no formato exigido.
+    Com uma MatchStore, usa o exportador de src/export.py (linhas geradas
+    direto das colunas, modo incremental e gzip opcionais).
+    """
+    if isinstance(matches, MatchStore):
+        exportar_csv(matches, caminho_saida, incremental=incremental, compactar=compactar)
+        return
+
     with open(caminho_saida, mode='w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
         # Cabeçalho: year,country,home_team,away_team,score (score = "home_score-away_score")
-        writer.writerow(["year", "country", "home_team", "away_team", "score"])
-        
-        for match in matches:
-            writer.writerow(match.to_list())
+        writer.writerow(CABECALHO_RESUMO)
+        gravar_em_lotes(writer, (match.to_list() for match in matches))
 
 # =====================================================================
-# BLOCO PRINCIPAL DE EXECUÇÃO
+# Pipeline Completo (Etapas 2 a 6)
 # =====================================================================
 
-if __name__ == "__main__":
-    
-    # Paths 
-    INPUT_CSV = "data/results.csv"
-    OUTPUT_CSV = "output/matches_summary.csv"
+def executar_pipeline(caminho_csv: str, caminho_saida: str, usar_cache: bool = True,
+                      caminho_nomes_antigos: Optional[str] = None,
+                      perfil: Optional[Profiler] = None,
+                      caminho_disputas: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Executa as Etapas 2 a 6 sem imprimir nada e retorna as estruturas criadas
+    (usado pelo bloco principal e pelos benchmarks).
+    Com um 'perfil' (src/profiling.py), cada etapa é medida.
+    Com 'caminho_disputas' (shootouts.csv), empates decididos nos pênaltis
+    contam para o vencedor da disputa nos pontos, nas BSTs e na AVL.
+    """
+    perfil = perfil_ou_desligado(perfil)
+
+    # Etapa 2: Partidas em formato colunar; objetos Match são criados só quando necessários
+    with perfil.etapa("leitura"):
+        matches, linhas_filtradas = carregar_partidas_store(caminho_csv, usar_cache=usar_cache,
+                                                            caminho_nomes_antigos=caminho_nomes_antigos,
+                                                            caminho_disputas=caminho_disputas)
+
+    # Cálculo da pontuação e gols (uma única passada para os dois; ver src/aggregate.py)
+    with perfil.etapa("agregacao"):
+        totais = agregar_store(matches, shootouts=bool(caminho_disputas))
+        lista_times_pontos = totais.team_scores()
+        lista_times_gols = totais.total_goals()
+
+    # Etapa 3: BSTs
+    with perfil.etapa("bsts"):
+        bst_nome, bst_gols = criar_bsts(lista_times_pontos, lista_times_gols)
+
+    # Etapa 4: Usando o Merge Sort (O(n log n) e estável) para ordenar a lista
+    with perfil.etapa("ordenacao"):
+        times_ordenacao = lista_times_pontos[:]
+        merge_sort(times_ordenacao, key=lambda t: t.score) # Ordena em ordem crescente por score de pontos
+        top_more, top_less = generate_top_rankings(times_ordenacao, top_n=10)
+
+    # Etapa 5: AVL por Pontos
+    with perfil.etapa("avl"):
+        avl_points = criar_avl_por_pontos(times_ordenacao)
+
+    # Etapa 6: Geração do CSV
+    with perfil.etapa("exportacao"):
+        pasta_saida = os.path.dirname(caminho_saida)
+        if pasta_saida:
+            os.makedirs(pasta_saida, exist_ok=True)
+        gerar_csv_resumo(matches, caminho_saida)
+
+    return {
+        "matches": matches,
+        "linhas_filtradas": linhas_filtradas,
+        "lista_times_pontos": lista_times_pontos,
+        "lista_times_gols": lista_times_gols,
+        "bst_nome": bst_nome,
+        "bst_gols": bst_gols,
+        "times_ordenacao": times_ordenacao,
+        "top_more": top_more,
+        "top_less": top_less,
+        "avl_points": avl_points,
+    }
+
+# =====================================================================
+# Impressão das Etapas (demonstração do trabalho)
+# =====================================================================
+
+def imprimir_pipeline(caminho_csv: str = "data/results.csv",
+                      caminho_saida: str = "output/matches_summary.csv",
+                      caminho_nomes_antigos: Optional[str] = "data/former_names.csv",
+                      perfil: Optional[Profiler] = None,
+                      caminho_disputas: Optional[str] = None):
+    """
+    Executa as Etapas 2 a 6 e imprime os resultados de cada etapa
+    (comando 'pipeline' da linha de comando, ver src/cli.py).
+    """
+    # Executa as Etapas 2 a 6; os blocos abaixo imprimem os resultados de cada etapa
+    # (seleções com nomes antigos são somadas no nome atual)
+    resultado = executar_pipeline(caminho_csv, caminho_saida, caminho_nomes_antigos=caminho_nomes_antigos,
+                                  perfil=perfil, caminho_disputas=caminho_disputas)
+    matches = resultado["matches"]
+    linhas_filtradas = resultado["linhas_filtradas"]
+    lista_times_pontos = resultado["lista_times_pontos"]
+    times_ordenacao = resultado["times_ordenacao"]
+    bst_nome, bst_gols = resultado["bst_nome"], resultado["bst_gols"]
+    top_more, top_less = resultado["top_more"], resultado["top_less"]
+    avl_points = resultado["avl_points"]
 
     # Etapa 2: Carregar Partidas
     print("--- Etapa 2: Carregando Partidas ---")
-    matches, linhas_filtradas = carregar_partidas_csv(INPUT_CSV)
     print(f"Total de partidas carregadas: {len(matches)}")
     print(f"Total de linhas filtradas (dados faltantes/inválidos): {linhas_filtradas}")
     print("-" * 40)
 
-    # Cálculo da pontuação e gols
-    lista_times_pontos = calculate_team_scores(matches)
-    lista_times_gols = calculate_total_goals(matches)
-
     # Etapa 3: Criar BSTs
     print("--- Etapa 3: Implementando BSTs ---")
-    bst_nome, bst_gols = criar_bsts(lista_times_pontos, lista_times_gols) 
     
     # PRINTS ADICIONADOS AQUI
     print("\n[BST por Nome (Ordem Alfabética - In-order)]")
     # A BST por nome usa o nome como chave, o in-order retorna em ordem alfabética.
-    for key, team in bst_nome.inorder()[:10]: # Imprime os primeiros 10
+    for key, team in islice(bst_nome.iter_inorder(), 10): # Imprime os primeiros 10
         print(f"  - {team.name} (Pontos: {team.score})")
 
     print("\n[BST por Gols Totais (Ordem de Gols - In-order)]")
     # A BST por gols usa o score de gols como chave, o in-order retorna em ordem crescente de gols.
     # Note que a chave (key) é o score de gols (value.score).
-    for key, team in bst_gols.inorder()[:10]: # Imprime os primeiros 10 (menores scores de gols)
+    for key, team in islice(bst_gols.iter_inorder(), 10): # Imprime os primeiros 10 (menores scores de gols)
         print(f"  - {team.name} (Gols: {key})")
     # FIM DOS PRINTS DA ETAPA 3
     
@@ -155,12 +274,6 @@ if __name__ == "__main__":
     
     # Etapa 4: Ordenação e Ranking
     print("--- Etapa 4: Ordenação e Rankings ---")
-    times_ordenacao = lista_times_pontos[:] 
-    
-    # Usando o Merge Sort (O(n log n) e estável) para ordenar a lista
-    merge_sort(times_ordenacao) # Ordena em ordem crescente por score de pontos
-    
-    top_more, top_less = generate_top_rankings(times_ordenacao, top_n=10)
     
     # PRINTS ADICIONADOS AQUI
     print("\n[Top 10 Seleções com MAIS pontos (Merge Sort)]")
@@ -176,13 +289,12 @@ if __name__ == "__main__":
 
     # Etapa 5: AVL por Pontos
     print("--- Etapa 5: AVL por Pontos ---")
-    avl_points = criar_avl_por_pontos(times_ordenacao)
     print(f"Altura da Árvore AVL: {avl_points.height()}")
     
     # PRINTS ADICIONADOS AQUI
     print("\n[AVL In-Order (Ordenado por Pontos)]")
     # O in-order retorna em ordem crescente de pontuação (score).
-    for key, team in avl_points.inorder()[:10]: # Imprime os primeiros 10 (menores scores)
+    for key, team in avl_points.bottom_k(10): # Imprime os primeiros 10 (menores scores)
         print(f"  - {team.name} (Pontos: {key})")
     # FIM DOS PRINTS DA ETAPA 5
 
@@ -190,10 +302,7 @@ if __name__ == "__main__":
 
     # Etapa 6: Geração do CSV
     print("--- Etapa 6: Gerando CSV de Resumo ---")
-    import os
-    os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
-    gerar_csv_resumo(matches, OUTPUT_CSV)
-    print(f"Arquivo de resumo gerado em: {OUTPUT_CSV}")
+    print(f"Arquivo de resumo gerado em: {caminho_saida}")
     print("-" * 40)
 
     # =====================================================================
@@ -239,4 +348,14 @@ if __name__ == "__main__":
     else:
         print(f"3. Busca Binária por Score (O(log n)): Score {target_score} não encontrado.")
     
-    print("-" * 40)
\ No newline at end of file
+    print("-" * 40)
+
+
+# =====================================================================
+# BLOCO PRINCIPAL DE EXECUÇÃO
+# =====================================================================
+
+if __name__ == "__main__":
+    # Sem argumentos executa o pipeline completo; "python -m src.main --help" lista os comandos
+    from .cli import main
+    raise SystemExit(main())
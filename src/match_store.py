@@ -0,0 +1,334 @@
+# src/match_store.py
+import hashlib
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .data_structs import (PONTOS_PERDEDOR_PENALTIS, PONTOS_VENCEDOR_PENALTIS, TEAM_NAMES,
+                           Goal, Match, Team)
+
+if TYPE_CHECKING:
+    from .former_names import NameResolver
+
+class MatchStore:
+    """
+    Tabela colunar de partidas.
+    Em vez de uma lista de objetos Match, cada atributo fica em um array tipado
+    (uma coluna). Times e textos (torneio, cidade, país) são guardados como IDs
+    inteiros que apontam para tabelas de strings.
+    Datas são armazenadas como ordinais (datetime.toordinal()).
+    Os IDs de time das colunas são locais (densos, 0..n-1, para indexar as
+    listas de pontos e gols); cada um aponta para o ID do mesmo nome na
+    tabela global TEAM_NAMES (team_global_ids), e os nomes são os mesmos
+    objetos str da tabela global.
+    """
+    def __init__(self):
+        # Tabela de times: ID -> nome e nome -> ID (IDs na ordem de aparição)
+        self.team_names: List[str] = []
+        self.team_ids: Dict[str, int] = {}
+        # ID local -> ID em TEAM_NAMES
+        self.team_global_ids = array("i")
+
+        # Tabela de strings para torneio, cidade e país
+        self.strings: List[str] = []
+        self.string_ids: Dict[str, int] = {}
+
+        # Colunas
+        self.dates = array("i")
+        self.home_ids = array("i")
+        self.away_ids = array("i")
+        self.home_scores = array("i")
+        self.away_scores = array("i")
+        self.tournament_ids = array("i")
+        self.city_ids = array("i")
+        self.country_ids = array("i")
+        self.neutral = array("b")
+
+        # Gols por linha (opcional): índice da partida -> lista de Goal.
+        # Preenchido por goalscorers.anexar_gols; não é gravado no cache binário.
+        self.goals: Dict[int, List[Goal]] = {}
+
+        # Disputas de pênaltis (opcional): índice da partida -> ID do vencedor.
+        # Preenchido por shootouts.anexar_disputas; também fora do cache binário.
+        self.shootouts: Dict[int, int] = {}
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[Match],
+                     resolver: Optional["NameResolver"] = None) -> "MatchStore":
+        """
+        Constrói a tabela colunar a partir de objetos Match.
+        Com 'resolver', os times ficam com o nome canônico na data da partida.
+        """
+        store = cls()
+        for m in matches:
+            home, away = m.home_team_name, m.away_team_name
+            if resolver is not None:
+                home = resolver.resolve(home, m.date_ord)
+                away = resolver.resolve(away, m.date_ord)
+            store.append(m.date_ord, home, away,
+                         m.home_score, m.away_score, m.tournament, m.city,
+                         m.country, m.neutral)
+        return store
+
+    # =================================================================
+    # Tabelas de nomes
+    # =================================================================
+
+    def team_id(self, name: str) -> int:
+        """Retorna o ID do time, registrando o nome se ainda não existir."""
+        team_id = self.team_ids.get(name)
+        if team_id is None:
+            global_id = TEAM_NAMES.intern(name)
+            name = TEAM_NAMES.names[global_id]
+            team_id = len(self.team_names)
+            self.team_ids[name] = team_id
+            self.team_names.append(name)
+            self.team_global_ids.append(global_id)
+        return team_id
+
+    def __setstate__(self, state: Dict):
+        # IDs globais só valem no processo que os criou (ex.: store lida em
+        # um processo filho na leitura paralela): refaz ao desserializar
+        self.__dict__.update(state)
+        self.set_team_names(self.team_names)
+
+    def set_team_names(self, names: List[str]):
+        """Substitui a tabela de times (usado ao carregar o cache binário)."""
+        self.team_names = []
+        self.team_ids = {}
+        self.team_global_ids = array("i")
+        for name in names:
+            self.team_id(name)
+
+    def string_id(self, value: str) -> int:
+        """Retorna o ID de uma string (torneio, cidade ou país)."""
+        string_id = self.string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.string_ids[value] = string_id
+            self.strings.append(value)
+        return string_id
+
+    def prefix_signature(self, rows: int, columns: Iterable[str]) -> str:
+        """
+        Hash das 'rows' primeiras linhas nas colunas 'columns' (e nos nomes
+        de times e strings a que os IDs delas apontam). Se alguma dessas
+        linhas for corrigida, removida ou se uma linha for inserida no meio,
+        o hash muda. Usado para validar checkpoints incrementais.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(rows.to_bytes(8, "little"))
+        if rows:
+            for name in columns:
+                h.update(memoryview(getattr(self, name))[:rows].cast("B"))
+            # IDs são dados na ordem de aparição: o prefixo usa só os primeiros nomes de cada tabela
+            teams = max(max(self.home_ids[:rows]), max(self.away_ids[:rows])) + 1
+            strings = max(max(self.tournament_ids[:rows]), max(self.city_ids[:rows]),
+                          max(self.country_ids[:rows])) + 1
+            h.update("\0".join(self.team_names[:teams]).encode("utf-8"))
+            h.update(b"\1")
+            h.update("\0".join(self.strings[:strings]).encode("utf-8"))
+        return h.hexdigest()
+
+    # =================================================================
+    # Inserção e acesso por linha
+    # =================================================================
+
+    def append(self, date_ord: int, home_team_name: str, away_team_name: str,
+               home_score: int, away_score: int, tournament: str = "",
+               city: str = "", country: str = "", neutral: bool = False):
+        """Adiciona uma partida ao final da tabela."""
+        self.dates.append(date_ord)
+        self.home_ids.append(self.team_id(home_team_name))
+        self.away_ids.append(self.team_id(away_team_name))
+        self.home_scores.append(home_score)
+        self.away_scores.append(away_score)
+        self.tournament_ids.append(self.string_id(tournament))
+        self.city_ids.append(self.string_id(city))
+        self.country_ids.append(self.string_id(country))
+        self.neutral.append(1 if neutral else 0)
+
+    def extend(self, other: "MatchStore"):
+        """
+        Adiciona ao final todas as partidas de outra tabela, convertendo os IDs
+        de times e strings da outra tabela para os IDs desta. Gols e disputas
+        de pênaltis anexados passam a apontar para as novas linhas.
+        """
+        team_map = [self.team_id(name) for name in other.team_names]
+        string_map = [self.string_id(value) for value in other.strings]
+
+        base = len(self.dates)
+        self.dates.extend(other.dates)
+        self.home_ids.extend(array("i", [team_map[t] for t in other.home_ids]))
+        self.away_ids.extend(array("i", [team_map[t] for t in other.away_ids]))
+        self.home_scores.extend(other.home_scores)
+        self.away_scores.extend(other.away_scores)
+        self.tournament_ids.extend(array("i", [string_map[s] for s in other.tournament_ids]))
+        self.city_ids.extend(array("i", [string_map[s] for s in other.city_ids]))
+        self.country_ids.extend(array("i", [string_map[s] for s in other.country_ids]))
+        self.neutral.extend(other.neutral)
+        for i, goals in other.goals.items():
+            for goal in goals:
+                goal.match_index = base + i
+            self.goals[base + i] = goals
+        for i, winner in other.shootouts.items():
+            self.shootouts[base + i] = team_map[winner]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, i: int) -> "MatchRow":
+        """
+        Visão de linha: um MatchRow que guarda só a store e o índice; os
+        atributos da partida são lidos das colunas quando pedidos.
+        """
+        total = len(self.dates)
+        if i < 0:
+            i += total
+        if not 0 <= i < total:
+            raise IndexError("índice de partida fora da tabela")
+        return MatchRow(self, i)
+
+    def __iter__(self) -> Iterator["MatchRow"]:
+        """Percorre as partidas como visões de linha, criadas sob demanda."""
+        for i in range(len(self.dates)):
+            yield MatchRow(self, i)
+
+    # =================================================================
+    # Agregações em lote (por coluna)
+    # =================================================================
+
+    def points_by_team(self, shootouts: bool = False) -> List[int]:
+        """
+        Soma os pontos (Vitória = 3, Empate = 1, Derrota = 0) de cada time.
+        Percorre apenas as colunas de IDs e placares, acumulando em uma lista
+        indexada pelo ID do time (equivalente a um 'bincount').
+        Com 'shootouts', os empates decididos nos pênaltis são corrigidos no
+        fim (uma passada só pelas disputas, ver Match.determine_points).
+        """
+        points = [0] * len(self.team_names)
+        for home, away, home_score, away_score in zip(self.home_ids, self.away_ids,
+                                                      self.home_scores, self.away_scores):
+            if home_score > away_score:
+                points[home] += 3
+            elif home_score < away_score:
+                points[away] += 3
+            else:
+                points[home] += 1
+                points[away] += 1
+        if shootouts:
+            self._apply_shootouts(points)
+        return points
+
+    def _apply_shootouts(self, points: List[int]):
+        """Troca o ponto do empate pelos pontos da disputa de pênaltis, em cada partida com disputa."""
+        for i, winner in self.shootouts.items():
+            if self.home_scores[i] != self.away_scores[i]:
+                continue
+            loser = self.away_ids[i] if winner == self.home_ids[i] else self.home_ids[i]
+            points[winner] += PONTOS_VENCEDOR_PENALTIS - 1
+            points[loser] += PONTOS_PERDEDOR_PENALTIS - 1
+
+    def goals_by_team(self) -> List[int]:
+        """Soma os gols marcados por cada time (mandante e visitante)."""
+        goals = [0] * len(self.team_names)
+        for team, score in zip(self.home_ids, self.home_scores):
+            goals[team] += score
+        for team, score in zip(self.away_ids, self.away_scores):
+            goals[team] += score
+        return goals
+
+    def team_scores(self, shootouts: bool = False) -> List[Team]:
+        """Equivalente colunar de calculate_team_scores (mesma ordem de times)."""
+        return [Team(name, score) for name, score in zip(self.team_names,
+                                                         self.points_by_team(shootouts))]
+
+    def total_goals(self) -> List[Team]:
+        """Equivalente colunar de calculate_total_goals (mesma ordem de times)."""
+        return [Team(name, goals) for name, goals in zip(self.team_names, self.goals_by_team())]
+
+class MatchRow:
+    """
+    Visão somente leitura de uma linha da MatchStore, com a mesma interface
+    de Match (date, date_ord, home_id, home_team_name, goals, shootout_winner,
+    determine_points, to_list, ...). Guarda apenas a store e o índice da
+    linha, então criar muitas visões custa pouco; home_id, away_id e
+    shootout_winner_id são IDs da tabela global TEAM_NAMES, como em Match.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: MatchStore, index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def date_ord(self) -> int:
+        return self.store.dates[self.index]
+
+    @property
+    def home_id(self) -> int:
+        store = self.store
+        return store.team_global_ids[store.home_ids[self.index]]
+
+    @property
+    def away_id(self) -> int:
+        store = self.store
+        return store.team_global_ids[store.away_ids[self.index]]
+
+    @property
+    def home_team_name(self) -> str:
+        return self.store.team_names[self.store.home_ids[self.index]]
+
+    @property
+    def away_team_name(self) -> str:
+        return self.store.team_names[self.store.away_ids[self.index]]
+
+    @property
+    def home_score(self) -> int:
+        return self.store.home_scores[self.index]
+
+    @property
+    def away_score(self) -> int:
+        return self.store.away_scores[self.index]
+
+    @property
+    def tournament(self) -> str:
+        return self.store.strings[self.store.tournament_ids[self.index]]
+
+    @property
+    def city(self) -> str:
+        return self.store.strings[self.store.city_ids[self.index]]
+
+    @property
+    def country(self) -> str:
+        return self.store.strings[self.store.country_ids[self.index]]
+
+    @property
+    def neutral(self) -> bool:
+        return bool(self.store.neutral[self.index])
+
+    @property
+    def goals(self) -> Tuple[Goal, ...]:
+        """Gols da partida (vazio se goalscorers.csv não foi anexado)."""
+        return tuple(self.store.goals.get(self.index, ()))
+
+    @property
+    def shootout_winner_id(self) -> int:
+        """ID (em TEAM_NAMES) do vencedor da disputa de pênaltis, ou -1."""
+        winner = self.store.shootouts.get(self.index)
+        return self.store.team_global_ids[winner] if winner is not None else -1
+
+    @property
+    def shootout_winner(self) -> Optional[str]:
+        winner = self.store.shootouts.get(self.index)
+        return self.store.team_names[winner] if winner is not None else None
+
+    # Propriedades e métodos derivados são os mesmos de Match
+    date = property(Match.date.fget)
+    year = property(Match.year.fget)
+    total_goals = Match.total_goals
+    to_list = Match.to_list
+    determine_points = Match.determine_points
+
+    def __repr__(self):
+        return (f"MatchRow({self.date.date()}, {self.home_team_name} {self.home_score}"
+                f"-{self.away_score} {self.away_team_name})")
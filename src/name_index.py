@@ -0,0 +1,197 @@
+# src/name_index.py
+# Busca de nomes por prefixo e aproximada (autocompletar): times, torneios,
+# cidades e países.
+# - Prefixo: vetor ordenado com o nome normalizado e cada sufixo que começa
+#   em uma palavra ("cote d ivoire", "d ivoire", "ivoire"); os nomes com um
+#   prefixo formam um trecho contínuo, achado com duas buscas binárias.
+# - Aproximada: índice invertido de trigramas; só os nomes que compartilham
+#   algum trigrama com a consulta são pontuados (coeficiente de Dice).
+import unicodedata
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from .match_store import MatchStore
+
+if TYPE_CHECKING:
+    from .former_names import NameResolver
+
+CATEGORIAS = ("team", "tournament", "city", "country")
+
+# Pontuação mínima (Dice entre trigramas) de um resultado aproximado
+SIMILARIDADE_MINIMA = 0.3
+
+def normalizar(texto: str) -> str:
+    """
+    Forma usada na comparação: sem acentos, minúsculas e só letras/dígitos
+    separados por um espaço. Ex.: "Côte d'Ivoire" -> "cote d ivoire".
+    """
+    sem_acentos = unicodedata.normalize("NFKD", texto)
+    limpo = "".join(c if c.isalnum() else " " for c in sem_acentos if not unicodedata.combining(c))
+    return " ".join(limpo.casefold().split())
+
+def trigramas(normalizado: str) -> Set[str]:
+    """Trigramas do texto normalizado, com um espaço de cada lado ("bra" -> " br", "bra", "ra ")."""
+    texto = f" {normalizado} "
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+class NameIndex:
+    """
+    Índice de nomes para autocompletar. Cada entrada é um (nome, categoria)
+    com um peso (quantidade de partidas), usado para desempatar: nomes mais
+    frequentes aparecem primeiro. Uma entrada pode ter apelidos (ex.: nomes
+    antigos de uma seleção), que também são encontrados pela busca.
+    """
+    def __init__(self):
+        self.names: List[str] = []
+        self.categories: List[str] = []
+        self.weights: List[int] = []
+        self._entries: Dict[Tuple[str, str], int] = {}
+        self._aliases: List[List[str]] = []
+        # Vetor ordenado de chaves (normalizadas) e a entrada de cada chave
+        self._keys: List[str] = []
+        self._key_ids: List[int] = []
+        # Chave de cada posição é o início do nome (e não de uma palavra do meio)?
+        self._key_starts: List[bool] = []
+        self._grams: Dict[str, List[int]] = {}
+        self._gram_counts: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_store(cls, store: MatchStore,
+                   resolver: Optional["NameResolver"] = None) -> "NameIndex":
+        """
+        Monta o índice com os times, torneios, cidades e países da store,
+        pesados pela quantidade de partidas. Com o 'resolver', os nomes
+        antigos viram apelidos do nome atual ("Dahomey" encontra "Benin").
+        """
+        index = cls()
+        team_counts = [0] * len(store.team_names)
+        for home, away in zip(store.home_ids, store.away_ids):
+            team_counts[home] += 1
+            team_counts[away] += 1
+        for name, count in zip(store.team_names, team_counts):
+            index.add(name, "team", count)
+
+        for category, column in (("tournament", store.tournament_ids), ("city", store.city_ids),
+                                 ("country", store.country_ids)):
+            counts: Dict[int, int] = {}
+            for string_id in column:
+                counts[string_id] = counts.get(string_id, 0) + 1
+            for string_id, count in counts.items():
+                index.add(store.strings[string_id], category, count)
+
+        if resolver is not None:
+            for former, currents in resolver.currents.items():
+                for current in set(currents):
+                    if (current, "team") in index._entries:
+                        index.add(current, "team", 0, aliases=[former])
+        index.build()
+        return index
+
+    def add(self, name: str, category: str, weight: int = 0, aliases: Iterable[str] = ()):
+        """Acrescenta (ou reforça) uma entrada. Depois de todas as inclusões, chame build()."""
+        entry = self._entries.get((name, category))
+        if entry is None:
+            entry = self._entries[(name, category)] = len(self.names)
+            self.names.append(name)
+            self.categories.append(category)
+            self.weights.append(0)
+            self._aliases.append([])
+        self.weights[entry] += weight
+        self._aliases[entry].extend(aliases)
+
+    def build(self):
+        """Monta o vetor ordenado de prefixos e o índice de trigramas."""
+        keys: List[Tuple[str, int, bool]] = []
+        self._grams = {}
+        self._gram_counts = [0] * len(self.names)
+        for entry, name in enumerate(self.names):
+            grams: Set[str] = set()
+            for text in [name] + self._aliases[entry]:
+                normalized = normalizar(text)
+                if not normalized:
+                    continue
+                keys.append((normalized, entry, True))
+                for i, c in enumerate(normalized):
+                    if c == " ":
+                        keys.append((normalized[i + 1:], entry, False))
+                grams |= trigramas(normalized)
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(entry)
+            self._gram_counts[entry] = len(grams)
+        keys.sort()
+        self._keys = [key for key, _, _ in keys]
+        self._key_ids = [entry for _, entry, _ in keys]
+        self._key_starts = [start for _, _, start in keys]
+
+    # =================================================================
+    # Consultas
+    # =================================================================
+    # Os resultados são triplas (nome, categoria, pontuação entre 0 e 1),
+    # da melhor para a pior.
+
+    def prefix(self, query: str, limit: int = 10,
+               category: Optional[str] = None) -> List[Tuple[str, str, float]]:
+        """
+        Nomes com uma palavra começando por 'query' (O(log n + m), m = chaves
+        no trecho). Nomes que COMEÇAM por 'query' vêm antes (pontuação 1.0)
+        dos que só têm uma palavra do meio com o prefixo (0.9).
+        """
+        normalized = normalizar(query)
+        if not normalized or limit <= 0:
+            return []
+        lo = bisect_left(self._keys, normalized)
+        hi = bisect_left(self._keys, normalized + "\U0010ffff", lo)
+        best: Dict[int, bool] = {}
+        for k in range(lo, hi):
+            entry = self._key_ids[k]
+            if category is None or self.categories[entry] == category:
+                best[entry] = best.get(entry, False) or self._key_starts[k]
+        ordered = sorted(best, key=lambda e: (not best[e], -self.weights[e], self.names[e]))
+        return [(self.names[e], self.categories[e], 1.0 if best[e] else 0.9)
+                for e in ordered[:limit]]
+
+    def fuzzy(self, query: str, limit: int = 10, category: Optional[str] = None,
+              minimum: float = SIMILARIDADE_MINIMA) -> List[Tuple[str, str, float]]:
+        """
+        Nomes parecidos com 'query' (erros de digitação, letras trocadas).
+        Conta os trigramas em comum só das entradas que aparecem nas listas
+        dos trigramas da consulta; pontuação = 2 * comuns / (total_consulta + total_nome).
+        """
+        normalized = normalizar(query)
+        if not normalized or limit <= 0:
+            return []
+        query_grams = trigramas(normalized)
+        common: Dict[int, int] = {}
+        for gram in query_grams:
+            for entry in self._grams.get(gram, ()):
+                common[entry] = common.get(entry, 0) + 1
+
+        scored = []
+        total = len(query_grams)
+        for entry, count in common.items():
+            if category is not None and self.categories[entry] != category:
+                continue
+            score = 2 * count / (total + self._gram_counts[entry])
+            if score >= minimum:
+                scored.append((-score, -self.weights[entry], self.names[entry], entry))
+        scored.sort()
+        return [(self.names[e], self.categories[e], round(-s, 3)) for s, _, _, e in scored[:limit]]
+
+    def search(self, query: str, limit: int = 10,
+               category: Optional[str] = None) -> List[Tuple[str, str, float]]:
+        """
+        Autocompletar: resultados por prefixo primeiro e, se faltarem, os
+        aproximados (sem repetir entradas).
+        """
+        results = self.prefix(query, limit, category)
+        if len(results) < limit:
+            seen = {(name, cat) for name, cat, _ in results}
+            for result in self.fuzzy(query, limit, category):
+                if (result[0], result[1]) not in seen:
+                    results.append(result)
+                    if len(results) == limit:
+                        break
+        return results
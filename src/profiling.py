@@ -0,0 +1,144 @@
+# src/profiling.py
+# Medição por etapa do pipeline: tempo de parede, tempo de CPU, blocos de
+# memória alocados e pico de memória (tracemalloc), além de contadores de
+# comparações e rotações nas árvores. O resultado vira um relatório JSON.
+#
+# Desligado (padrão), cada etapa é só um 'with' em um contexto vazio e as
+# árvores fazem uma única checagem de atributo por operação.
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional
+
+from .bst_library import BST_A
+from .avl import AVLPointsTree_A
+
+_VAZIO = nullcontext()
+
+def _novos_contadores() -> Dict[str, int]:
+    return {"comparisons": 0, "rotations": 0, "rebuilds": 0}
+
+class Profiler:
+    """
+    Coleta as medidas de cada etapa de um pipeline.
+    Uso:
+        perfil = Profiler()
+        with perfil.etapa("leitura"):
+            ...
+        perfil.salvar("output/perfil.json")
+    """
+    def __init__(self, enabled: bool = True, memoria: bool = True):
+        self.enabled = enabled
+        self.memoria = memoria            # tracemalloc deixa o código bem mais lento
+        self.etapas: List[Dict[str, Any]] = []
+        self.contadores: Dict[str, Dict[str, int]] = {}
+        self.inicio = time.time()
+
+    def etapa(self, nome: str):
+        """Contexto que mede uma etapa (contexto vazio se o profiler está desligado)."""
+        if not self.enabled:
+            return _VAZIO
+        return self._medir(nome)
+
+    @contextmanager
+    def _medir(self, nome: str) -> Iterator[None]:
+        iniciou_tracemalloc = False
+        if self.memoria:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                iniciou_tracemalloc = True
+            tracemalloc.reset_peak()
+            memoria_inicial = tracemalloc.get_traced_memory()[0]
+        blocos_iniciais = sys.getallocatedblocks()
+        contadores_iniciais = {arvore: dict(c) for arvore, c in self._contadores_arvores().items()}
+        cpu_inicial = time.process_time()
+        parede_inicial = time.perf_counter()
+        try:
+            yield
+        finally:
+            medida: Dict[str, Any] = {
+                "etapa": nome,
+                "tempo_s": time.perf_counter() - parede_inicial,
+                "cpu_s": time.process_time() - cpu_inicial,
+                "blocos_alocados_liquidos": sys.getallocatedblocks() - blocos_iniciais,
+            }
+            if self.memoria:
+                atual, pico = tracemalloc.get_traced_memory()
+                medida["memoria_liquida_bytes"] = atual - memoria_inicial
+                medida["pico_memoria_bytes"] = pico - memoria_inicial
+                if iniciou_tracemalloc:
+                    tracemalloc.stop()
+            for arvore, contadores in self._contadores_arvores().items():
+                diferenca = {chave: valor - contadores_iniciais[arvore][chave]
+                             for chave, valor in contadores.items()}
+                if any(diferenca.values()):
+                    medida.setdefault("arvores", {})[arvore] = diferenca
+            self.etapas.append(medida)
+
+    # =================================================================
+    # Contadores das árvores
+    # =================================================================
+
+    def _contadores_arvores(self) -> Dict[str, Dict[str, int]]:
+        return {nome: contadores for nome, contadores in
+                (("BST_A", BST_A.counters), ("AVLPointsTree_A", AVLPointsTree_A.counters))
+                if contadores is not None}
+
+    def ativar_contadores(self):
+        """Liga a contagem de comparações/rotações em BST_A e AVLPointsTree_A."""
+        BST_A.counters = _novos_contadores()
+        AVLPointsTree_A.counters = _novos_contadores()
+
+    def desativar_contadores(self):
+        """Desliga a contagem e guarda os totais no relatório."""
+        self.contadores = {nome: dict(c) for nome, c in self._contadores_arvores().items()}
+        BST_A.counters = None
+        AVLPointsTree_A.counters = None
+
+    def __enter__(self) -> "Profiler":
+        if self.enabled:
+            self.ativar_contadores()
+        return self
+
+    def __exit__(self, *exc):
+        if self.enabled:
+            self.desativar_contadores()
+        return False
+
+    # =================================================================
+    # Relatório
+    # =================================================================
+
+    def relatorio(self) -> Dict[str, Any]:
+        """Relatório estruturado da execução."""
+        return {
+            "inicio": self.inicio,
+            "ambiente": {
+                "python": platform.python_version(),
+                "implementacao": platform.python_implementation(),
+                "sistema": platform.platform(),
+                "cpus": os.cpu_count(),
+            },
+            "memoria_rastreada": self.memoria,
+            "tempo_total_s": sum(e["tempo_s"] for e in self.etapas),
+            "etapas": self.etapas,
+            "contadores_arvores": self.contadores or self._contadores_arvores(),
+        }
+
+    def salvar(self, caminho: str):
+        """Grava o relatório em JSON."""
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        with open(caminho, mode="w", encoding="utf-8") as f:
+            json.dump(self.relatorio(), f, indent=2, ensure_ascii=False)
+
+# Profiler desligado usado quando nenhum é informado
+DESLIGADO = Profiler(enabled=False)
+
+def perfil_ou_desligado(perfil: Optional[Profiler]) -> Profiler:
+    return perfil if perfil is not None else DESLIGADO
@@ -1,5 +1,6 @@
 # src/search.py
-from typing import List, Any
+import math
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Sequence, Tuple
 
 def linear_search(arr: List[Any], x: Any) -> int:
     """
@@ -27,4 +28,119 @@ def binary_search(arr: List[Any], x: Any) -> int:
             high = mid - 1
         else:
             return mid
-    return -1
\ No newline at end of file
+    return -1
+
+# =====================================================================
+# Buscas com Chaves Repetidas
+# =====================================================================
+# Com chaves repetidas (vários times com o mesmo score), binary_search
+# devolve uma posição qualquer do grupo. As funções abaixo devolvem os
+# LIMITES do grupo, então todos os elementos iguais (ou dentro de uma faixa)
+# saem com uma fatia: arr[lo:hi].
+
+def lower_bound(arr: Sequence[Any], x: Any, low: int = 0, high: int | None = None) -> int:
+    """
+    Primeira posição de 'arr' (ordenada) com elemento >= x, ou len(arr) se
+    não houver (O(log n)). 'low' e 'high' limitam a busca a arr[low:high].
+    """
+    if high is None:
+        high = len(arr)
+    while low < high:
+        mid = (low + high) // 2
+        if arr[mid] < x:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+def upper_bound(arr: Sequence[Any], x: Any, low: int = 0, high: int | None = None) -> int:
+    """Primeira posição de 'arr' (ordenada) com elemento > x, ou len(arr) se não houver (O(log n))."""
+    if high is None:
+        high = len(arr)
+    while low < high:
+        mid = (low + high) // 2
+        if x < arr[mid]:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+def equal_range(arr: Sequence[Any], x: Any) -> Tuple[int, int]:
+    """
+    Intervalo [lo, hi) dos elementos iguais a x (vazio se lo == hi).
+    Ex.: todos os times com 40 pontos -> times[lo:hi].
+    """
+    lo = lower_bound(arr, x)
+    return lo, upper_bound(arr, x, lo)
+
+def range_search(arr: Sequence[Any], low: Any, high: Any) -> Tuple[int, int]:
+    """Intervalo [lo, hi) dos elementos entre 'low' e 'high' (inclusive), O(log n)."""
+    lo = lower_bound(arr, low)
+    return lo, max(lo, upper_bound(arr, high, lo))
+
+# =====================================================================
+# Buscas em Lote
+# =====================================================================
+# Milhares de consultas contra o mesmo vetor: as consultas são ordenadas e
+# resolvidas em uma única passada, sempre a partir da posição da anterior
+# (a resposta de uma consulta maior nunca fica antes da de uma menor).
+# Com muitas consultas a passada é uma intercalação (merge) O(n + q); com
+# poucas, cada consulta é uma busca binária só no trecho que sobrou.
+
+def _bounds_in_batch(arr: Sequence[Any], queries: Sequence[Any], strict: bool) -> List[int]:
+    """lower_bound (strict=False) ou upper_bound (strict=True) de cada consulta, na ordem dada."""
+    n = len(arr)
+    result = [0] * len(queries)
+    order = sorted(range(len(queries)), key=queries.__getitem__)
+    i = 0
+    if len(queries) * math.log2(n + 1) < n:
+        bound = upper_bound if strict else lower_bound
+        for q in order:
+            i = bound(arr, queries[q], i)
+            result[q] = i
+    elif strict:
+        for q in order:
+            x = queries[q]
+            while i < n and not x < arr[i]:
+                i += 1
+            result[q] = i
+    else:
+        for q in order:
+            x = queries[q]
+            while i < n and arr[i] < x:
+                i += 1
+            result[q] = i
+    return result
+
+def lower_bounds(arr: Sequence[Any], queries: Sequence[Any]) -> List[int]:
+    """lower_bound de cada consulta (na ordem das consultas), em uma passada por 'arr'."""
+    return _bounds_in_batch(arr, queries, strict=False)
+
+def upper_bounds(arr: Sequence[Any], queries: Sequence[Any]) -> List[int]:
+    """upper_bound de cada consulta (na ordem das consultas), em uma passada por 'arr'."""
+    return _bounds_in_batch(arr, queries, strict=True)
+
+def range_search_batch(arr: Sequence[Any], bands: Sequence[Tuple[Any, Any]]) -> List[Tuple[int, int]]:
+    """
+    Várias consultas "quem tem entre X e Y pontos" de uma vez: para cada faixa
+    (low, high) devolve o intervalo [lo, hi) de 'arr', na ordem das faixas.
+    Custo O(n + q log q) no total, em vez de q buscas binárias separadas.
+    """
+    los = lower_bounds(arr, [low for low, _ in bands])
+    his = upper_bounds(arr, [high for _, high in bands])
+    return [(lo, max(lo, hi)) for lo, hi in zip(los, his)]
+
+# =====================================================================
+# Índice Hash
+# =====================================================================
+
+def build_index(items: Iterable[Any], key: Callable[[Any], Hashable] | None = None) -> Dict[Hashable, int]:
+    """
+    Monta uma vez um dicionário chave -> posição (ex.: nome do time -> índice
+    na lista), para buscas O(1) no lugar de linear_search. Com chaves
+    repetidas vale a primeira posição, como em linear_search.
+    """
+    index: Dict[Hashable, int] = {}
+    for i, item in enumerate(items):
+        index.setdefault(item if key is None else key(item), i)
+    return index
@@ -0,0 +1,318 @@
+# src/server.py
+# Servidor HTTP/JSON local (asyncio) com as estruturas carregadas em memória.
+# Execução (a partir da raiz do projeto):
+#     python -m src.server [--porta 8000] [--intervalo 2]
+#
+# Rotas (GET, respostas em JSON):
+#     /health                                   versão do snapshot e totais
+#     /team?name=Brazil                         pontos, gols, posição no ranking
+#     /ranking?start=1&end=10                   posições start..end (AVL por pontos)
+#     /range?low=100&high=200                   times com pontos entre low e high
+#     /standings?inicio=1990-01-01&fim=1999-12-31&limite=20
+#     /h2h?a=Brazil&b=Argentina[&inicio=...&fim=...&ultimos=5]   confronto direto
+#     /search?q=Bra[&limit=10&category=team]    autocompletar (prefixo e aproximada)
+#
+# As estruturas ficam em um Snapshot imutável. Quando data/results.csv muda,
+# um novo Snapshot é montado em segundo plano e trocado de uma vez (uma
+# atribuição); cada requisição usa o snapshot que pegou ao começar.
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .data_structs import Team
+from .match_store import MatchStore
+from .bst_library import BST_A
+from .avl import AVLPointsTree_A
+from .sorting import merge_sort, top_k
+from .standings import DateRangeStandings
+from .head_to_head import HeadToHeadIndex
+from .name_index import CATEGORIAS, NameIndex
+from .cache import carregar_resultados
+from .former_names import NameResolver
+from .ingest import data_iso_para_ordinal
+
+CAMINHO_RESULTADOS = "data/results.csv"
+CAMINHO_NOMES_ANTIGOS = "data/former_names.csv"
+
+# Tamanho máximo aceito para a linha de requisição e cabeçalhos
+LIMITE_CABECALHO = 16 * 1024
+# Quantidade de respostas de /standings guardadas por snapshot
+LIMITE_CACHE_STANDINGS = 1024
+
+class ErroConsulta(Exception):
+    """Parâmetro inválido ou recurso inexistente (vira uma resposta 4xx)."""
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+
+# =====================================================================
+# Snapshot (estruturas prontas para consulta)
+# =====================================================================
+
+class Snapshot:
+    """
+    Conjunto imutável das estruturas usadas nas consultas: pontos e gols por
+    time, BST por nome, AVL por pontos e índice por intervalo de datas.
+    Depois de montado, nada nele é alterado.
+    """
+    def __init__(self, store: MatchStore, versao: int, assinatura: Tuple[int, int],
+                 resolver: Optional[NameResolver] = None):
+        self.versao = versao
+        self.assinatura = assinatura      # (tamanho, mtime_ns) do CSV de origem
+        self.carregado_em = time.time()
+        self.partidas = len(store)
+
+        self.pontos = store.team_scores()
+        self.gols = {t.name: t.score for t in store.total_goals()}
+        self.bst_nome = BST_A.from_sorted(sorted(((t.name, t) for t in self.pontos),
+                                                 key=lambda item: item[0]))
+        ordenados = self.pontos[:]
+        merge_sort(ordenados, key=lambda t: t.score)
+        self.avl = AVLPointsTree_A.from_sorted(ordenados)
+        self.datas = DateRangeStandings.from_store(store)
+        self.confrontos = HeadToHeadIndex.from_store(store)
+        self.nomes = NameIndex.from_store(store, resolver)
+        # Respostas de /standings já calculadas (o snapshot não muda, então não expiram)
+        self._cache_standings: Dict[Tuple[int, int, int], Dict[str, Any]] = {}
+
+    @classmethod
+    def carregar(cls, caminho_csv: str, caminho_nomes_antigos: Optional[str],
+                 versao: int) -> "Snapshot":
+        """Lê o CSV (via cache binário) e monta um snapshot novo."""
+        info = os.stat(caminho_csv)
+        resolver = NameResolver.from_csv(caminho_nomes_antigos) if caminho_nomes_antigos else None
+        store, _ = carregar_resultados(caminho_csv, resolver=resolver)
+        return cls(store, versao, (info.st_size, info.st_mtime_ns), resolver)
+
+    def _time(self, team: Team) -> Dict[str, Any]:
+        return {"name": team.name, "points": team.score,
+                "goals": self.gols.get(team.name, 0), "rank": self.avl.rank(team)}
+
+    # =================================================================
+    # Consultas
+    # =================================================================
+
+    def health(self, params: Dict[str, str]) -> Dict[str, Any]:
+        return {"version": self.versao, "loaded_at": self.carregado_em,
+                "matches": self.partidas, "teams": len(self.pontos)}
+
+    def team(self, params: Dict[str, str]) -> Dict[str, Any]:
+        nome = _parametro(params, "name")
+        team = self.bst_nome.search(nome)
+        if team is None:
+            raise ErroConsulta(404, f"time '{nome}' não encontrado")
+        return self._time(team)
+
+    def ranking(self, params: Dict[str, str]) -> Dict[str, Any]:
+        start = _inteiro(params, "start", 1)
+        end = _inteiro(params, "end", start + 9)
+        times = self.avl.ranked(start, end)
+        return {"start": start, "teams": [self._time(t) for _, t in times]}
+
+    def range(self, params: Dict[str, str]) -> Dict[str, Any]:
+        low = _inteiro(params, "low", 0)
+        high = _inteiro(params, "high", low)
+        return {"low": low, "high": high,
+                "teams": [self._time(t) for _, t in self.avl.range_query(low, high)]}
+
+    def standings(self, params: Dict[str, str]) -> Dict[str, Any]:
+        try:
+            inicio = data_iso_para_ordinal(_parametro(params, "inicio"))
+            fim = data_iso_para_ordinal(_parametro(params, "fim"))
+        except ValueError:
+            raise ErroConsulta(400, "datas no formato AAAA-MM-DD")
+        limite = _inteiro(params, "limite", 20)
+        chave = (inicio, fim, limite)
+        resposta = self._cache_standings.get(chave)
+        if resposta is None:
+            times = top_k(self.datas.team_scores(inicio, fim), limite, key=lambda t: t.score)
+            resposta = {"teams": [{"name": t.name, "points": t.score} for t in times]}
+            if len(self._cache_standings) < LIMITE_CACHE_STANDINGS:
+                self._cache_standings[chave] = resposta
+        return resposta
+
+    def h2h(self, params: Dict[str, str]) -> Dict[str, Any]:
+        time_a, time_b = _parametro(params, "a"), _parametro(params, "b")
+        for nome in (time_a, time_b):
+            if nome not in self.confrontos.team_ids:
+                raise ErroConsulta(404, f"time '{nome}' não encontrado")
+        try:
+            inicio = data_iso_para_ordinal(params["inicio"]) if "inicio" in params else None
+            fim = data_iso_para_ordinal(params["fim"]) if "fim" in params else None
+        except ValueError:
+            raise ErroConsulta(400, "datas no formato AAAA-MM-DD")
+        confronto = self.confrontos.record(time_a, time_b, inicio, fim)
+        return {"team": time_a, "opponent": time_b, "played": confronto.played,
+                "wins": confronto.wins, "draws": confronto.draws, "losses": confronto.losses,
+                "goals_for": confronto.goals_for, "goals_against": confronto.goals_against,
+                "form": self.confrontos.last_n(time_a, time_b, _inteiro(params, "ultimos", 5),
+                                              inicio, fim)}
+
+    def search(self, params: Dict[str, str]) -> Dict[str, Any]:
+        texto = _parametro(params, "q")
+        categoria = params.get("category")
+        if categoria is not None and categoria not in CATEGORIAS:
+            raise ErroConsulta(400, f"categoria deve ser uma de: {', '.join(CATEGORIAS)}")
+        resultados = self.nomes.search(texto, _inteiro(params, "limit", 10), categoria)
+        return {"query": texto, "results": [{"name": nome, "category": cat, "score": pontuacao}
+                                            for nome, cat, pontuacao in resultados]}
+
+def _parametro(params: Dict[str, str], nome: str) -> str:
+    if nome not in params:
+        raise ErroConsulta(400, f"parâmetro '{nome}' obrigatório")
+    return params[nome]
+
+def _inteiro(params: Dict[str, str], nome: str, padrao: int) -> int:
+    try:
+        return int(params[nome]) if nome in params else padrao
+    except ValueError:
+        raise ErroConsulta(400, f"parâmetro '{nome}' deve ser inteiro")
+
+# =====================================================================
+# Servidor
+# =====================================================================
+
+class QueryServer:
+    """
+    Servidor HTTP/1.1 mínimo (GET, keep-alive) sobre asyncio.
+    As consultas são rápidas (O(log n + k)) e rodam direto no laço de eventos;
+    a remontagem do snapshot roda em uma thread, sem bloquear as requisições.
+    """
+    ROTAS: Dict[str, Callable[[Snapshot, Dict[str, str]], Dict[str, Any]]] = {
+        "/health": Snapshot.health,
+        "/team": Snapshot.team,
+        "/ranking": Snapshot.ranking,
+        "/range": Snapshot.range,
+        "/standings": Snapshot.standings,
+        "/h2h": Snapshot.h2h,
+        "/search": Snapshot.search,
+    }
+
+    def __init__(self, caminho_csv: str = CAMINHO_RESULTADOS,
+                 caminho_nomes_antigos: Optional[str] = CAMINHO_NOMES_ANTIGOS,
+                 intervalo: float = 2.0):
+        self.caminho_csv = caminho_csv
+        self.caminho_nomes_antigos = caminho_nomes_antigos
+        self.intervalo = intervalo
+        self.snapshot = Snapshot.carregar(caminho_csv, caminho_nomes_antigos, versao=1)
+
+    async def recarregar_se_mudou(self) -> bool:
+        """Se o CSV mudou, monta um snapshot novo (em uma thread) e troca o atual."""
+        info = os.stat(self.caminho_csv)
+        if (info.st_size, info.st_mtime_ns) == self.snapshot.assinatura:
+            return False
+        novo = await asyncio.get_running_loop().run_in_executor(
+            None, Snapshot.carregar, self.caminho_csv, self.caminho_nomes_antigos,
+            self.snapshot.versao + 1)
+        self.snapshot = novo  # troca atômica: uma única atribuição
+        return True
+
+    async def observar(self):
+        """Verifica o CSV a cada 'intervalo' segundos (recarga automática)."""
+        while True:
+            await asyncio.sleep(self.intervalo)
+            try:
+                await self.recarregar_se_mudou()
+            except (OSError, ValueError) as erro:
+                print(f"Falha ao recarregar {self.caminho_csv}: {erro}")
+
+    def responder(self, alvo: str) -> Tuple[int, Dict[str, Any]]:
+        """Executa a consulta do caminho 'alvo' no snapshot atual."""
+        snapshot = self.snapshot  # a requisição inteira usa este snapshot
+        url = urlsplit(alvo)
+        rota = self.ROTAS.get(url.path)
+        if rota is None:
+            return 404, {"error": f"rota '{url.path}' não existe"}
+        params = {chave: valores[-1] for chave, valores in parse_qs(url.query).items()}
+        try:
+            return 200, rota(snapshot, params)
+        except ErroConsulta as erro:
+            return erro.status, {"error": str(erro)}
+
+    async def atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atende uma conexão (várias requisições com keep-alive)."""
+        try:
+            while True:
+                try:
+                    cabecalho = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                linhas = cabecalho.decode("latin-1").split("\r\n")
+                partes = linhas[0].split(" ")
+                campos = {}
+                for linha in linhas[1:]:
+                    nome, _, valor = linha.partition(":")
+                    campos[nome.strip().lower()] = valor.strip().lower()
+                # Corpo (ignorado em GET). Sem tamanho válido não dá para saber onde
+                # ele termina: responde 400 e fecha a conexão.
+                erro = None
+                try:
+                    tamanho_corpo = int(campos.get("content-length", "0") or 0)
+                    if tamanho_corpo < 0:
+                        raise ValueError
+                except ValueError:
+                    erro = "Content-Length inválido"
+                else:
+                    if tamanho_corpo:
+                        try:
+                            await reader.readexactly(tamanho_corpo)
+                        except asyncio.IncompleteReadError:
+                            erro = "corpo menor que o Content-Length"
+
+                if erro is not None:
+                    status, corpo = 400, {"error": erro}
+                elif len(partes) != 3:
+                    status, corpo = 400, {"error": "requisição inválida"}
+                elif partes[0] != "GET":
+                    status, corpo = 405, {"error": "apenas GET"}
+                else:
+                    status, corpo = self.responder(partes[1])
+
+                manter = (erro is None and campos.get("connection") != "close"
+                          and partes[-1] == "HTTP/1.1")
+                dados = json.dumps(corpo, ensure_ascii=False).encode("utf-8")
+                writer.write(f"HTTP/1.1 {status} {_MOTIVOS.get(status, '')}\r\n"
+                             f"Content-Type: application/json; charset=utf-8\r\n"
+                             f"Content-Length: {len(dados)}\r\n"
+                             f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n"
+                             .encode("latin-1") + dados)
+                await writer.drain()
+                if not manter:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def executar(self, host: str = "127.0.0.1", porta: int = 8000):
+        servidor = await asyncio.start_server(self.atender, host, porta, limit=LIMITE_CABECALHO)
+        observador = asyncio.create_task(self.observar())
+        print(f"Servindo em http://{host}:{porta} ({self.snapshot.partidas} partidas)")
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            observador.cancel()
+
+_MOTIVOS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor de consultas (HTTP/JSON)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8000)
+    parser.add_argument("--resultados", default=CAMINHO_RESULTADOS)
+    parser.add_argument("--nomes-antigos", default=CAMINHO_NOMES_ANTIGOS)
+    parser.add_argument("--intervalo", type=float, default=2.0,
+                        help="segundos entre as verificações de mudança do CSV")
+    args = parser.parse_args()
+
+    servidor = QueryServer(args.resultados, args.nomes_antigos or None, args.intervalo)
+    try:
+        asyncio.run(servidor.executar(args.host, args.porta))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,106 @@
+# src/shootouts.py
+# Leitura de data/shootouts.csv e junção das disputas de pênaltis com as
+# partidas de results.csv.
+from bisect import bisect_left
+from itertools import islice
+from operator import le
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from .match_store import MatchStore
+from .ingest import VALORES_FALTANTES, data_iso_para_ordinal, ler_csv_posicional
+
+if TYPE_CHECKING:
+    from .former_names import NameResolver
+
+CAMINHO_DISPUTAS = "data/shootouts.csv"
+
+# Colunas usadas de shootouts.csv
+COLUNAS_DISPUTAS = ["date", "home_team", "away_team", "winner"]
+
+# =====================================================================
+# Leitura
+# =====================================================================
+
+def ler_disputas_csv(caminho_csv: str,
+                     resolver: Optional["NameResolver"] = None) -> Tuple[Dict[Tuple[int, str, str], str], int]:
+    """
+    Lê shootouts.csv para um índice hash (data, mandante, visitante) -> vencedor,
+    com a data como ordinal. Linhas sem data, times ou vencedor são filtradas.
+    Retorna (disputas, linhas_filtradas).
+    """
+    faltantes = VALORES_FALTANTES
+    disputas: Dict[Tuple[int, str, str], str] = {}
+    filtradas = 0
+    for texto_data, home, away, winner in ler_csv_posicional(caminho_csv, COLUNAS_DISPUTAS):
+        home, away, winner = home.strip(), away.strip(), winner.strip()
+        if (home.lower() in faltantes or away.lower() in faltantes or
+                winner.lower() in faltantes or texto_data.strip().lower() in faltantes):
+            filtradas += 1
+            continue
+        try:
+            data_ord = data_iso_para_ordinal(texto_data)
+        except ValueError:
+            filtradas += 1
+            continue
+        if resolver is not None:
+            home = resolver.resolve(home, data_ord)
+            away = resolver.resolve(away, data_ord)
+            winner = resolver.resolve(winner, data_ord)
+        disputas[(data_ord, home, away)] = winner
+    return disputas, filtradas
+
+# =====================================================================
+# Junção com as Partidas
+# =====================================================================
+
+def _linha_partida(store: MatchStore, data_ord: int, home_id: int, away_id: int) -> int:
+    """
+    Linha da partida (data, mandante, visitante) na store, ou -1.
+    As partidas vêm em ordem de data (results.csv é ordenado), então a busca
+    é binária na coluna de datas e depois só olha os jogos daquele dia.
+    """
+    dates = store.dates
+    i = bisect_left(dates, data_ord)
+    while i < len(dates) and dates[i] == data_ord:
+        if store.home_ids[i] == home_id and store.away_ids[i] == away_id:
+            return i
+        i += 1
+    return -1
+
+def anexar_disputas(store: MatchStore, disputas: Dict[Tuple[int, str, str], str]) -> int:
+    """
+    Anexa o vencedor de cada disputa à sua partida (store.shootouts e, nas
+    visões de linha, Match.shootout_winner). Custo O(d log n), com d disputas:
+    nenhuma passada pelas partidas. Só se alguma disputa não for achada e a
+    store não estiver em ordem de data, usa o índice hash completo de
+    goalscorers.indice_partidas.
+    Retorna quantas disputas foram ligadas a alguma partida.
+    """
+    team_ids = store.team_ids
+    store.shootouts = {}
+    indice = None
+    ordenada = None
+    for (data_ord, home, away), winner in disputas.items():
+        home_id, away_id, winner_id = team_ids.get(home), team_ids.get(away), team_ids.get(winner)
+        if home_id is None or away_id is None or winner_id not in (home_id, away_id):
+            continue
+        linha = _linha_partida(store, data_ord, home_id, away_id)
+        if linha < 0:
+            if ordenada is None:
+                dates = store.dates
+                ordenada = all(map(le, dates, islice(dates, 1, None)))
+            if ordenada:
+                continue  # a partida não está na store
+            if indice is None:
+                from .goalscorers import indice_partidas
+                indice = indice_partidas(store)
+            linha = indice.get((data_ord, home_id, away_id), -1)
+        if linha >= 0:
+            store.shootouts[linha] = winner_id
+    return len(store.shootouts)
+
+def carregar_disputas(store: MatchStore, caminho_csv: str = CAMINHO_DISPUTAS,
+                      resolver: Optional["NameResolver"] = None) -> int:
+    """Lê shootouts.csv e anexa as disputas à store. Retorna quantas foram ligadas."""
+    disputas, _ = ler_disputas_csv(caminho_csv, resolver)
+    return anexar_disputas(store, disputas)
@@ -1,22 +1,32 @@
 # src/sorting.py
-from typing import List, Dict, Tuple
+import heapq
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar
 from .data_structs import Match, Team
+from .match_store import MatchStore
+
+T = TypeVar("T")
 
 # =====================================================================
 # Funções Auxiliares de Pontuação (Score)
 # =====================================================================
 
-def calculate_team_scores(matches: List[Match]) -> List[Team]:
+def calculate_team_scores(matches: List[Match], shootouts: bool = False) -> List[Team]:
     """
     Calcula a pontuação (score) de todos os times com base nas partidas.
     Regra: Vitória = 3, Empate = 1, Derrota = 0.
+    Com 'shootouts', empates decididos nos pênaltis usam o vencedor da disputa.
     Retorna uma lista de objetos Team com seus scores totais.
+    Se 'matches' for uma MatchStore, usa a agregação colunar.
     """
+    if isinstance(matches, MatchStore):
+        return matches.team_scores(shootouts)
+
     team_points: Dict[str, int] = {}
     
     # Acumula os pontos
     for match in matches:
-        home_points, away_points = match.determine_points()
+        home_points, away_points = match.determine_points(shootouts)
         
         # Inicializa se não existir e soma os pontos
         team_points[match.home_team_name] = team_points.get(match.home_team_name, 0) + home_points
@@ -34,7 +44,11 @@ def calculate_total_goals(matches: List[Match]) -> List[Team]:
     Calcula o total de GOLS MARCADOS (acumulados) por todos os times.
     Esta lista é usada para a BST 2 da Etapa 3.
     Retorna uma lista de objetos Team com seus GOLS TOTAIS.
+    Se 'matches' for uma MatchStore, usa a agregação colunar.
     """
+    if isinstance(matches, MatchStore):
+        return matches.total_goals()
+
     team_goals: Dict[str, int] = {}
     
     # Acumula os gols
@@ -54,20 +68,63 @@ def calculate_total_goals(matches: List[Match]) -> List[Team]:
     return lista_times_gols
 
 
-def generate_top_rankings(teams: List[Team], top_n: int = 10) -> Tuple[List[Team], List[Team]]:
+def generate_top_rankings(teams: Iterable[Team], top_n: int = 10) -> Tuple[List[Team], List[Team]]:
     """
     Gera o ranking Top N com mais pontos e o Top N com menos pontos.
+    Usa seleção com heaps (select_top_bottom) em uma única passada, sem ordenar a lista.
     """
-    # Ordenação decrescente (mais pontos)
-    sorted_teams_desc = sorted(teams, key=lambda t: t.score, reverse=True)
-    
-    # Ordenação crescente (menos pontos)
-    sorted_teams_asc = sorted(teams, key=lambda t: t.score, reverse=False)
-    
-    top_more = sorted_teams_desc[:top_n]
-    top_less = sorted_teams_asc[:top_n]
-    
-    return top_more, top_less
+    return select_top_bottom(teams, top_n, key=lambda t: t.score)
+
+
+# =====================================================================
+# Seleção Top-K com Heaps
+# =====================================================================
+# Para pegar só os k maiores (ou menores) de n itens não é preciso ordenar
+# tudo: um heap limitado a k itens guarda os melhores vistos até agora.
+# Custo O(n log k) de tempo e O(k) de memória, funcionando também sobre
+# um gerador (fluxo de itens que nunca vira lista).
+# O desempate é estável: com chaves iguais, vence quem apareceu primeiro
+# (mesmo resultado de sorted(...)[:k]). As chaves devem ser numéricas.
+
+def top_k(items: Iterable[T], k: int, key: Callable[[T], float]) -> List[T]:
+    """Os k itens de maior chave, do maior para o menor."""
+    return select_top_bottom(items, k, key, bottom=False)[0]
+
+def bottom_k(items: Iterable[T], k: int, key: Callable[[T], float]) -> List[T]:
+    """Os k itens de menor chave, do menor para o maior."""
+    return select_top_bottom(items, k, key, top=False)[1]
+
+def select_top_bottom(items: Iterable[T], k: int, key: Callable[[T], float],
+                      top: bool = True, bottom: bool = True) -> Tuple[List[T], List[T]]:
+    """
+    Em uma única passada, retorna (k maiores em ordem decrescente,
+    k menores em ordem crescente).
+    """
+    if k <= 0:
+        return [], []
+
+    # Heap dos maiores: mínimo no topo, entradas (chave, -índice, item).
+    # Entre chaves iguais, o de maior índice (apareceu depois) sai primeiro.
+    top_heap: List[Tuple[float, int, T]] = []
+    # Heap dos menores: máximo no topo, entradas (-chave, -índice, item).
+    bottom_heap: List[Tuple[float, int, T]] = []
+
+    for i, item in enumerate(items):
+        value = key(item)
+        if top:
+            if len(top_heap) < k:
+                heapq.heappush(top_heap, (value, -i, item))
+            elif value > top_heap[0][0]:
+                heapq.heapreplace(top_heap, (value, -i, item))
+        if bottom:
+            if len(bottom_heap) < k:
+                heapq.heappush(bottom_heap, (-value, -i, item))
+            elif value < -bottom_heap[0][0]:
+                heapq.heapreplace(bottom_heap, (-value, -i, item))
+
+    top_heap.sort(reverse=True)
+    bottom_heap.sort(reverse=True)
+    return [entry[2] for entry in top_heap], [entry[2] for entry in bottom_heap]
 
 
 # =====================================================================
@@ -90,39 +147,136 @@ def bubble_sort(arr: List[Team]):
         if not swapped:
             break
 
-def merge_sort(arr: List[Team]):
+def merge_sort(arr: List[T], key: Callable[[T], Any] | None = None, reverse: bool = False):
     """
     Algoritmo de ordenação Merge Sort (O(n log n)).
-    Estável e eficiente. Ordena a lista 'arr' em ordem crescente pelo score.
+    Estável e eficiente. Ordena a lista 'arr' (no lugar) em ordem crescente
+    pelo score (Team.__lt__), ou pela chave 'key' se fornecida.
+
+    Versão bottom-up (sem recursão): as chaves são calculadas uma única vez
+    (decorate-sort-undecorate), trechos pequenos são ordenados por inserção
+    binária e depois intercalados em passadas de largura dobrada, alternando
+    entre a lista de trabalho e UM buffer auxiliar (sem fatias L/R a cada nível).
+    Só usa o operador '<' das chaves.
     """
-    if len(arr) > 1:
-        mid = len(arr) // 2
-        L = arr[:mid]  # Parte esquerda
-        R = arr[mid:]  # Parte direita
-        
-        merge_sort(L)  # Ordena recursivamente L
-        merge_sort(R)  # Ordena recursivamente R
-        
-        i = j = k = 0
-        
-        # Mescla as partes ordenadas
-        while i < len(L) and j < len(R):
-            # Compara score usando a sobrecarga do operador '<' (Team.__lt__)
-            if L[i] < R[j]: 
-                arr[k] = L[i]
-                i += 1
-            else:
-                arr[k] = R[j]
-                j += 1
-            k += 1
-            
-        # Adiciona elementos restantes, se houver
-        while i < len(L):
-            arr[k] = L[i]
-            i += 1
+    n = len(arr)
+    if n < 2:
+        return
+
+    keys = [key(item) for item in arr] if key else arr[:]
+    values = arr[:]
+    if reverse:
+        # Decrescente estável = inverter, ordenar crescente (estável) e inverter de novo
+        keys.reverse()
+        values.reverse()
+
+    # 1. Trechos de tamanho _RUN ordenados por inserção binária (estável)
+    for start in range(0, n, _RUN):
+        _insertion_sort_run(keys, values, start, min(start + _RUN, n))
+
+    # 2. Intercalação bottom-up com um buffer auxiliar reaproveitado
+    aux_keys = [None] * n
+    aux_values = [None] * n
+    width = _RUN
+    while width < n:
+        for low in range(0, n, 2 * width):
+            _merge_runs(keys, values, aux_keys, aux_values,
+                        low, min(low + width, n), min(low + 2 * width, n))
+        keys, aux_keys = aux_keys, keys
+        values, aux_values = aux_values, values
+        width *= 2
+
+    if reverse:
+        values.reverse()
+    arr[:] = values
+
+# Tamanho dos trechos ordenados por inserção antes da intercalação
+_RUN = 32
+
+def _insertion_sort_run(keys: List[Any], values: List[Any], start: int, end: int):
+    """
+    Ordena keys/values[start:end] por inserção binária: a posição é achada
+    com bisect_right (depois das chaves iguais, o que mantém a estabilidade).
+    """
+    for i in range(start + 1, end):
+        current_key = keys[i]
+        if not current_key < keys[i - 1]:
+            continue
+        pos = bisect_right(keys, current_key, start, i)
+        current_value = values[i]
+        keys[pos + 1:i + 1] = keys[pos:i]
+        values[pos + 1:i + 1] = values[pos:i]
+        keys[pos] = current_key
+        values[pos] = current_value
+
+def _merge_runs(keys: List[Any], values: List[Any], out_keys: List[Any], out_values: List[Any],
+                low: int, mid: int, high: int):
+    """
+    Intercala os trechos ordenados [low, mid) e [mid, high) em out_keys/out_values.
+    Em empate vence o trecho da esquerda (estabilidade).
+    """
+    # Trechos já em ordem (ou sem parte direita): cópia direta
+    if mid >= high or not keys[mid] < keys[mid - 1]:
+        out_keys[low:high] = keys[low:high]
+        out_values[low:high] = values[low:high]
+        return
+
+    i, j, k = low, mid, low
+    left_key, right_key = keys[i], keys[j]
+    while True:
+        # Pega da direita só se ela for estritamente menor
+        if right_key < left_key:
+            out_keys[k] = right_key
+            out_values[k] = values[j]
             k += 1
-            
-        while j < len(R):
-            arr[k] = R[j]
             j += 1
-            k += 1
\ No newline at end of file
+            if j == high:
+                break
+            right_key = keys[j]
+        else:
+            out_keys[k] = left_key
+            out_values[k] = values[i]
+            k += 1
+            i += 1
+            if i == mid:
+                break
+            left_key = keys[i]
+
+    # Adiciona elementos restantes, se houver
+    if i < mid:
+        out_keys[k:high] = keys[i:mid]
+        out_values[k:high] = values[i:mid]
+    else:
+        out_keys[k:high] = keys[j:high]
+        out_values[k:high] = values[j:high]
+
+def radix_sort(arr: List[T], key: Callable[[T], int] | None = None, reverse: bool = False):
+    """
+    Radix Sort LSD (O(d·n)) para chaves INTEIRAS (ex.: pontos, gols).
+    Ordena 'arr' no lugar, de forma estável, processando a chave 8 bits por
+    vez com baldes (counting sort por dígito). Chaves negativas são
+    deslocadas pelo mínimo; reverse=True usa (máximo - chave), o que
+    mantém a estabilidade em ordem decrescente.
+    """
+    n = len(arr)
+    if n < 2:
+        return
+
+    keys = [key(item) for item in arr] if key else list(arr)
+    lowest, highest = min(keys), max(keys)
+    if reverse:
+        keys = [highest - k for k in keys]
+    else:
+        keys = [k - lowest for k in keys]
+    span = highest - lowest
+
+    order = list(range(n))
+    shift = 0
+    while span >> shift:
+        buckets: List[List[int]] = [[] for _ in range(256)]
+        for index in order:
+            buckets[(keys[index] >> shift) & 255].append(index)
+        order = [index for bucket in buckets for index in bucket]
+        shift += 8
+
+    arr[:] = [arr[index] for index in order]
@@ -0,0 +1,234 @@
+# src/standings.py
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .data_structs import PONTOS_PERDEDOR_PENALTIS, PONTOS_VENCEDOR_PENALTIS, Match, Team
+from .match_store import MatchStore
+from .bst_library import BST_A
+from .avl import AVLPointsTree_A
+from .sorting import merge_sort
+from .ingest import ler_novas_linhas
+from .former_names import NameResolver
+
+class IncrementalStandings:
+    """
+    Classificação atualizada de forma incremental.
+    Mantém os pontos e gols de cada time e as três árvores do projeto
+    (BST por nome, BST por gols e AVL por pontos). Novas partidas só alteram
+    os times envolvidos: cada um é removido e reinserido nas árvores com o
+    novo valor, sem recalcular o histórico inteiro.
+    """
+    def __init__(self):
+        self.store = MatchStore()                 # Histórico de partidas aplicadas
+        self.points_teams: Dict[str, Team] = {}   # nome -> Team (score = pontos)
+        self.goals_teams: Dict[str, Team] = {}    # nome -> Team (score = gols)
+        self.bst_nome = BST_A()
+        self.bst_gols = BST_A()
+        self.avl = AVLPointsTree_A()
+        self.linhas_filtradas = 0
+        self.caminho_csv: Optional[str] = None
+        self.csv_offset = 0                       # Próximo byte a ler do CSV
+        self.resolver: Optional[NameResolver] = None  # Nomes antigos -> nome atual
+
+    @classmethod
+    def from_store(cls, store: MatchStore,
+                   resolver: Optional[NameResolver] = None) -> "IncrementalStandings":
+        """
+        Construção completa (uma única vez) a partir de uma MatchStore.
+        'resolver' é usado nas partidas aplicadas depois; a própria 'store'
+        já deve ter sido lida com ele.
+        """
+        standings = cls()
+        standings.resolver = resolver
+        standings.store.extend(store)
+
+        lista_times_pontos = store.team_scores()
+        lista_times_gols = store.total_goals()
+        for time in lista_times_pontos:
+            standings.points_teams[time.name] = time
+            standings.bst_nome.insert(time.name, time)
+        for time in lista_times_gols:
+            standings.goals_teams[time.name] = time
+            standings.bst_gols.insert(time.score, time)
+
+        times_ordenacao = lista_times_pontos[:]
+        merge_sort(times_ordenacao, key=lambda t: t.score)
+        standings.avl = AVLPointsTree_A.from_sorted(times_ordenacao)
+        return standings
+
+    @classmethod
+    def from_csv(cls, caminho_csv: str,
+                 resolver: Optional[NameResolver] = None) -> "IncrementalStandings":
+        """Carrega o CSV inteiro e guarda a posição final para ler só as linhas novas depois."""
+        store, linhas_filtradas, offset = ler_novas_linhas(caminho_csv, 0, resolver)
+        standings = cls.from_store(store, resolver)
+        standings.linhas_filtradas = linhas_filtradas
+        standings.caminho_csv = caminho_csv
+        standings.csv_offset = offset
+        return standings
+
+    # =================================================================
+    # Atualização incremental
+    # =================================================================
+
+    def apply_matches(self, matches: Iterable[Match]) -> int:
+        """Aplica novas partidas (objetos Match). Retorna quantas foram aplicadas."""
+        return self.apply_store(MatchStore.from_matches(matches, self.resolver))
+
+    def apply_csv_tail(self, caminho_csv: Optional[str] = None) -> int:
+        """
+        Lê apenas as linhas adicionadas ao CSV desde a última leitura e as aplica.
+        Retorna quantas partidas novas foram aplicadas.
+        """
+        caminho_csv = caminho_csv or self.caminho_csv
+        if caminho_csv != self.caminho_csv:
+            self.caminho_csv, self.csv_offset = caminho_csv, 0
+        novas, filtradas, self.csv_offset = ler_novas_linhas(caminho_csv, self.csv_offset,
+                                                             self.resolver)
+        self.linhas_filtradas += filtradas
+        return self.apply_store(novas)
+
+    def apply_store(self, novas: MatchStore) -> int:
+        """
+        Aplica um lote de partidas: soma os pontos/gols do lote por time
+        (agregação colunar) e reposiciona cada time afetado uma única vez.
+        """
+        if not len(novas):
+            return 0
+        self.store.extend(novas)
+        for name, points, goals in zip(novas.team_names, novas.points_by_team(),
+                                       novas.goals_by_team()):
+            self._update_team(name, points, goals)
+        return len(novas)
+
+    def _update_team(self, name: str, points: int, goals: int):
+        """Soma pontos e gols a um time, removendo e reinserindo nas árvores ordenadas por valor."""
+        time = self.points_teams.get(name)
+        if time is None:
+            time = Team(name, points)
+            time_gols = Team(name, goals)
+            self.points_teams[name] = time
+            self.goals_teams[name] = time_gols
+            self.bst_nome.insert(name, time)
+            self.bst_gols.insert(goals, time_gols)
+            self.avl.insert(time)
+            return
+
+        # A BST por nome guarda o próprio objeto Team: a chave (nome) não muda.
+        if points:
+            self.avl.delete(time)
+            time.score += points
+            self.avl.insert(time)
+        if goals:
+            time_gols = self.goals_teams[name]
+            self.bst_gols.delete(time_gols.score, time_gols)
+            time_gols.score += goals
+            self.bst_gols.insert(time_gols.score, time_gols)
+
+    # =================================================================
+    # Consultas
+    # =================================================================
+
+    def team_scores(self) -> List[Team]:
+        """Times com os pontos atuais (mesma forma de calculate_team_scores)."""
+        return list(self.points_teams.values())
+
+    def total_goals(self) -> List[Team]:
+        """Times com os gols atuais (mesma forma de calculate_total_goals)."""
+        return list(self.goals_teams.values())
+
+
+def _ordinal(dia: date | int) -> int:
+    """Aceita date/datetime ou um ordinal já calculado."""
+    return dia if isinstance(dia, int) else dia.toordinal()
+
+class DateRangeStandings:
+    """
+    Classificação por intervalo de datas.
+    Para cada time guarda as datas dos seus jogos em ordem cronológica e as
+    somas acumuladas (prefixos) de pontos, gols e jogos. Os totais de um
+    intervalo [início, fim] saem de duas buscas binárias nas datas do time e
+    da diferença entre dois prefixos: O(log m) por time, sem percorrer as
+    partidas do intervalo.
+    """
+    def __init__(self):
+        self.team_names: List[str] = []
+        self.team_ids: Dict[str, int] = {}
+        self.team_dates: List[array] = []    # datas dos jogos de cada time (ordenadas)
+        self.cum_points: List[array] = []    # cum_points[t][k] = pontos nos k primeiros jogos
+        self.cum_goals: List[array] = []     # idem para gols marcados
+
+    @classmethod
+    def from_store(cls, store: MatchStore, shootouts: bool = False) -> "DateRangeStandings":
+        """
+        Monta o índice cronológico a partir de uma MatchStore (O(n log n)).
+        Com 'shootouts', empates decididos nos pênaltis (store.shootouts) dão
+        os pontos da disputa, como em Match.determine_points.
+        """
+        index = cls()
+        index.team_names = list(store.team_names)
+        index.team_ids = dict(store.team_ids)
+        total_times = len(store.team_names)
+        index.team_dates = [array("i") for _ in range(total_times)]
+        index.cum_points = [array("i", [0]) for _ in range(total_times)]
+        index.cum_goals = [array("i", [0]) for _ in range(total_times)]
+
+        dates = store.dates
+        disputas = store.shootouts if shootouts else {}
+        # Ordenação estável: partidas do mesmo dia mantêm a ordem do arquivo
+        for i in sorted(range(len(dates)), key=dates.__getitem__):
+            home, away = store.home_ids[i], store.away_ids[i]
+            home_score, away_score = store.home_scores[i], store.away_scores[i]
+            if home_score > away_score:
+                home_points, away_points = 3, 0
+            elif home_score < away_score:
+                home_points, away_points = 0, 3
+            elif i in disputas:
+                if disputas[i] == home:
+                    home_points, away_points = PONTOS_VENCEDOR_PENALTIS, PONTOS_PERDEDOR_PENALTIS
+                else:
+                    home_points, away_points = PONTOS_PERDEDOR_PENALTIS, PONTOS_VENCEDOR_PENALTIS
+            else:
+                home_points, away_points = 1, 1
+            for team, points, goals in ((home, home_points, home_score),
+                                        (away, away_points, away_score)):
+                index.team_dates[team].append(dates[i])
+                index.cum_points[team].append(index.cum_points[team][-1] + points)
+                index.cum_goals[team].append(index.cum_goals[team][-1] + goals)
+        return index
+
+    def _window(self, team: int, start: int, end: int) -> Tuple[int, int]:
+        """Posições [lo, hi) dos jogos do time com start <= data <= end."""
+        team_dates = self.team_dates[team]
+        return bisect_left(team_dates, start), bisect_right(team_dates, end)
+
+    def team_record(self, name: str, start: date | int, end: date | int) -> Tuple[int, int, int]:
+        """(pontos, gols, jogos) de um time no intervalo [start, end], em O(log m)."""
+        team = self.team_ids.get(name)
+        if team is None:
+            return (0, 0, 0)
+        lo, hi = self._window(team, _ordinal(start), _ordinal(end))
+        return (self.cum_points[team][hi] - self.cum_points[team][lo],
+                self.cum_goals[team][hi] - self.cum_goals[team][lo], hi - lo)
+
+    def _scores(self, cumulative: List[array], start: date | int, end: date | int) -> List[Team]:
+        start, end = _ordinal(start), _ordinal(end)
+        result = []
+        for team, name in enumerate(self.team_names):
+            lo, hi = self._window(team, start, end)
+            if hi > lo:
+                result.append(Team(name, cumulative[team][hi] - cumulative[team][lo]))
+        return result
+
+    def team_scores(self, start: date | int, end: date | int) -> List[Team]:
+        """
+        Pontos de cada time no intervalo [start, end] (mesma forma de
+        calculate_team_scores; só entram times que jogaram no intervalo).
+        """
+        return self._scores(self.cum_points, start, end)
+
+    def total_goals(self, start: date | int, end: date | int) -> List[Team]:
+        """Gols de cada time no intervalo [start, end] (forma de calculate_total_goals)."""
+        return self._scores(self.cum_goals, start, end)
@@ -0,0 +1,68 @@
+# tests/test_elo.py
+# O cálculo incremental do Elo (update após update, ou load + update) precisa
+# dar exatamente o mesmo resultado do cálculo completo.
+# Execução (a partir da raiz do projeto): python -m unittest discover tests
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from src.elo import EloEngine
+from src.ingest import ler_resultados_csv
+from src.match_store import MatchStore
+
+def _store(linhas):
+    store = MatchStore()
+    for dia, casa, fora, gols_casa, gols_fora in linhas:
+        store.append(dia.toordinal(), casa, fora, gols_casa, gols_fora, "Friendly")
+    return store
+
+class TestEloIncremental(unittest.TestCase):
+    def assertMesmoEstado(self, incremental, completo):
+        self.assertEqual(incremental.processed, completo.processed)
+        for nome in completo.team_names:
+            self.assertAlmostEqual(incremental.rating(nome), completo.rating(nome))
+            self.assertEqual(incremental.history(nome), completo.history(nome))
+
+    def test_partida_antiga_no_fim(self):
+        linhas = [(date(2020, 1, 1), "A", "B", 1, 0),
+                  (date(2020, 3, 1), "A", "C", 0, 2)]
+        atrasada = (date(2020, 2, 1), "A", "B", 3, 0)
+
+        store = _store(linhas)
+        incremental = EloEngine.from_store(store)
+        store.append(atrasada[0].toordinal(), *atrasada[1:], "Friendly")
+        incremental.update(store)
+
+        completo = EloEngine.from_store(_store(linhas + [atrasada]))
+        self.assertMesmoEstado(incremental, completo)
+        self.assertAlmostEqual(incremental.rating_at("A", date(2020, 2, 15)),
+                               completo.rating_at("A", date(2020, 2, 15)))
+
+    def test_arquivo_real_em_partes(self):
+        store, _ = ler_resultados_csv("data/results.csv")
+        incremental = EloEngine()
+        for fim in (len(store) // 3, 2 * len(store) // 3, len(store)):
+            parte = MatchStore()
+            parte.extend(store)
+            for coluna in ("dates", "home_ids", "away_ids", "home_scores", "away_scores",
+                           "tournament_ids", "city_ids", "country_ids", "neutral"):
+                del getattr(parte, coluna)[fim:]
+            incremental.update(parte)
+        self.assertMesmoEstado(incremental, EloEngine.from_store(store))
+
+    def test_checkpoint_com_linha_corrigida(self):
+        linhas = [(date(2020, 1, 1), "A", "B", 1, 0),
+                  (date(2020, 3, 1), "A", "C", 0, 2)]
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "elo.ckpt")
+            EloEngine.from_store(_store(linhas)).save(caminho)
+
+            corrigidas = [(date(2020, 1, 1), "A", "B", 0, 1)] + linhas[1:]
+            novas = corrigidas + [(date(2020, 4, 1), "B", "C", 2, 2)]
+            carregado = EloEngine.load(caminho)
+            carregado.update(_store(novas))
+            self.assertMesmoEstado(carregado, EloEngine.from_store(_store(novas)))
+
+if __name__ == "__main__":
+    unittest.main()